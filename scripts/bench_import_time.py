@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for fast-agent startup.
+
+Runs each import in a fresh interpreter with `python -X importtime`, repeats it, and reports
+the median total along with the slowest modules. Pass --baseline-ref to compare against
+another git revision (checked out into a temporary worktree), e.g. `--baseline-ref HEAD~1`,
+and --budget-ms to fail when an import gets slower than the budget.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# What short-lived invocations pay for: the package, the app entry point and the CLI
+TARGETS = {
+    "import mcp_agent": "import mcp_agent",
+    "from mcp_agent import FastAgent": "from mcp_agent import FastAgent",
+    "fast-agent CLI": "import mcp_agent.cli.__main__",
+}
+
+
+def measure(statement: str, src_path: Path) -> Tuple[float, Dict[str, float]]:
+    """
+    Run a statement under -X importtime. Returns the total import time in ms and
+    the cumulative time of each module in ms.
+    """
+    env = {**os.environ, "PYTHONPATH": str(src_path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    total = 0.0
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        total += int(self_us) / 1000
+        cumulative[name.strip()] = int(cumulative_us) / 1000
+    return total, cumulative
+
+
+def benchmark(statement: str, src_path: Path, repeat: int) -> Tuple[float, List[Tuple[str, float]]]:
+    """Median total in ms, and the modules with the highest cumulative time in the median run."""
+    runs = sorted((measure(statement, src_path) for _ in range(repeat)), key=lambda run: run[0])
+    total, cumulative = runs[len(runs) // 2]
+    slowest = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)
+    return total, slowest
+
+
+def baseline_worktree(ref: str, directory: str) -> Path:
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", directory, ref],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+    )
+    return Path(directory) / "src"
+
+
+def main(
+    repeat: int = typer.Option(5, help="Runs per import; the median is reported"),
+    top: int = typer.Option(10, help="Slowest modules to list for each import"),
+    baseline_ref: Optional[str] = typer.Option(None, help="Git revision to compare against"),
+    budget_ms: Optional[float] = typer.Option(
+        None, help="Exit with an error if any import takes longer than this"
+    ),
+) -> None:
+    console = Console()
+    current_src = REPO_ROOT / "src"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_src = None
+        if baseline_ref:
+            baseline_src = baseline_worktree(baseline_ref, os.path.join(tmp, "baseline"))
+
+        try:
+            table = Table(title=f"Import time, ms (median of {repeat} runs)")
+            table.add_column("Import")
+            table.add_column("current", justify="right")
+            if baseline_src:
+                table.add_column(f"baseline ({baseline_ref})", justify="right")
+                table.add_column("Speedup", justify="right")
+
+            over_budget = []
+            details = {}
+            for label, statement in TARGETS.items():
+                total, slowest = benchmark(statement, current_src, repeat)
+                details[label] = slowest[:top]
+                row = [label, f"{total:.0f}"]
+                if baseline_src:
+                    baseline_total, _ = benchmark(statement, baseline_src, repeat)
+                    row += [f"{baseline_total:.0f}", f"{baseline_total / total:.1f}x"]
+                table.add_row(*row)
+                if budget_ms is not None and total > budget_ms:
+                    over_budget.append(label)
+        finally:
+            if baseline_src:
+                subprocess.run(
+                    ["git", "worktree", "remove", "--force", str(baseline_src.parent)],
+                    cwd=REPO_ROOT,
+                    capture_output=True,
+                )
+
+    console.print(table)
+    for label, slowest in details.items():
+        modules = Table(title=f"Slowest modules: {label}")
+        modules.add_column("Module")
+        modules.add_column("Cumulative ms", justify="right")
+        for name, cumulative in slowest:
+            modules.add_row(name, f"{cumulative:.0f}")
+        console.print(modules)
+
+    if over_budget:
+        console.print(f"[red]Over the {budget_ms:.0f} ms budget: {', '.join(over_budget)}[/red]")
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
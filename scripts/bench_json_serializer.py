@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for log event serialization.
+
+Times JSONSerializer plus JSON encoding on representative event payloads (tool call
+arguments, LLM responses). Pass --baseline-ref to compare against the implementation
+at another git revision, e.g. `--baseline-ref HEAD~1`.
+"""
+
+import importlib.util
+import json
+import subprocess
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import typer
+from anthropic.types import Message, TextBlock, ToolUseBlock, Usage
+from mcp.types import CallToolRequest, CallToolRequestParams, CallToolResult, TextContent
+from rich.console import Console
+from rich.table import Table
+
+from mcp_agent.logging.json_serializer import JSONSerializer, dumps
+
+SERIALIZER_PATH = "src/mcp_agent/logging/json_serializer.py"
+
+
+def payloads() -> Dict[str, Any]:
+    """Event data shaped like what the agent logs in practice."""
+    tool_call = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="filesystem-read_file",
+            arguments={"path": "/tmp/report.csv", "encoding": "utf-8", "limit": 200},
+        ),
+    )
+    tool_result = CallToolResult(
+        content=[TextContent(type="text", text="row,value\n" * 200)], isError=False
+    )
+    llm_response = Message(
+        id="msg_01",
+        type="message",
+        role="assistant",
+        model="claude-3-7-sonnet-latest",
+        content=[
+            TextBlock(type="text", text="Let me read that file for you. " * 20),
+            ToolUseBlock(
+                type="tool_use",
+                id="toolu_01",
+                name="filesystem-read_file",
+                input={"path": "/tmp/report.csv"},
+            ),
+        ],
+        stop_reason="tool_use",
+        usage=Usage(input_tokens=1200, output_tokens=85),
+    )
+    arguments = {
+        "model": "claude-3-7-sonnet-latest",
+        "max_tokens": 4096,
+        "api_key": "sk-ant-0123456789abcdef",
+        "messages": [
+            {"role": "user", "content": [{"type": "text", "text": "Summarize the report"}]},
+            {"role": "assistant", "content": llm_response.model_dump()["content"]},
+        ],
+        "tools": [
+            {
+                "name": f"server-tool_{i}",
+                "description": "A tool",
+                "input_schema": {"type": "object"},
+            }
+            for i in range(20)
+        ],
+    }
+    return {
+        "tool call": {"data": tool_call},
+        "tool result": {"data": tool_result},
+        "llm response": {"data": llm_response},
+        "request arguments": {"data": arguments},
+    }
+
+
+def load_baseline(ref: str) -> Callable[[Any], str]:
+    """Import json_serializer.py as it was at a git revision."""
+    source = subprocess.run(
+        ["git", "show", f"{ref}:{SERIALIZER_PATH}"], check=True, capture_output=True, text=True
+    ).stdout
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("baseline_json_serializer", f.name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    Path(f.name).unlink()
+
+    serializer = module.JSONSerializer()
+    if hasattr(module, "dumps"):
+        return lambda data: module.dumps(serializer(data))
+    return lambda data: json.dumps(serializer(data), separators=(",", ":"))
+
+
+def main(
+    number: int = typer.Option(2000, help="Iterations per payload"),
+    baseline_ref: str = typer.Option(None, help="Git revision to compare against"),
+) -> None:
+    serializer = JSONSerializer()
+    candidates = {"current": lambda data: dumps(serializer(data))}
+    if baseline_ref:
+        candidates[f"baseline ({baseline_ref})"] = load_baseline(baseline_ref)
+
+    table = Table(title=f"Serialize + encode, µs per event ({number} iterations)")
+    table.add_column("Payload")
+    for name in candidates:
+        table.add_column(name, justify="right")
+    if baseline_ref:
+        table.add_column("Speedup", justify="right")
+
+    for payload_name, data in payloads().items():
+        timings = [
+            timeit.timeit(lambda: encode(data), number=number) / number * 1e6
+            for encode in candidates.values()
+        ]
+        row = [payload_name] + [f"{t:.1f}" for t in timings]
+        if baseline_ref:
+            row.append(f"{timings[1] / timings[0]:.2f}x")
+        table.add_row(*row)
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    typer.run(main)
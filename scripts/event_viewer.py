@@ -1,13 +1,10 @@
 #!/usr/bin/env python3
 """MCP Event Viewer"""
 
-import json
 import sys
 import termios
 import tty
-from datetime import datetime
-from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 import typer
 from rich.console import Console
@@ -17,6 +14,7 @@ from rich.text import Text
 
 from mcp_agent.event_progress import ProgressEvent, convert_log_event
 from mcp_agent.logging.events import Event
+from mcp_agent.logging.log_reader import EventLogReader
 
 
 def get_key() -> str:
@@ -33,7 +31,7 @@ def get_key() -> str:
 class EventDisplay:
     """Display MCP events from a log file."""
 
-    def __init__(self, events: List[Event]) -> None:
+    def __init__(self, events: Sequence[Event]) -> None:
         self.events = events
         self.total = len(events)
         self.current = 0
@@ -57,13 +55,13 @@ class EventDisplay:
             self._rebuild_progress_events()
 
     def _rebuild_progress_events(self) -> None:
-        """Rebuild progress events up to current position."""
+        """Find the latest progress event up to current position, scanning backwards."""
         self.progress_events = []
-        for i in range(self.current + 1):
+        for i in range(self.current, -1, -1):
             progress_event = convert_log_event(self.events[i])
             if progress_event:
-                if not self.progress_events or str(progress_event) != str(self.progress_events[-1]):
-                    self.progress_events.append(progress_event)
+                self.progress_events.append(progress_event)
+                break
 
     def _process_current(self) -> None:
         """Process the current event."""
@@ -152,40 +150,14 @@ class EventDisplay:
         return Panel(main_layout, title="MCP Event Viewer")
 
 
-def load_events(path: Path) -> List[Event]:
-    """Load events from JSONL file."""
-    events = []
-    print(f"Loading events from {path}")  # Debug
-    try:
-        with open(path) as f:
-            for line_num, line in enumerate(f, 1):
-                if line.strip():
-                    try:
-                        raw_event = json.loads(line)
-                        # Convert from log format to event format
-                        event = Event(
-                            type=raw_event.get("level", "info").lower(),
-                            namespace=raw_event.get("namespace", ""),
-                            message=raw_event.get("message", ""),
-                            timestamp=datetime.fromisoformat(raw_event["timestamp"]),
-                            data=raw_event.get("data", {}),
-                        )
-                        events.append(event)
-                    except Exception as e:
-                        print(f"Error on line {line_num}: {e}")
-                        print(f"Line content: {line.strip()}")
-                        raise
-    except Exception as e:
-        print(f"Error loading file: {e}")
-        raise
-
-    print(f"Loaded {len(events)} events")  # Debug
-    return events
-
-
-def main(log_file: str) -> None:
+def main(
+    log_file: str,
+    level: Optional[str] = typer.Option(None, help="Only show events at or above this level"),
+    namespace: Optional[str] = typer.Option(None, help="Only show events under this namespace"),
+) -> None:
     """View MCP Agent events from a log file."""
-    events = load_events(Path(log_file))
+    reader = EventLogReader(log_file)
+    events = reader.find(min_level=level, namespace=namespace) if level or namespace else reader
     if not events:
         print("No events loaded!")
         return
@@ -1,43 +1,83 @@
 """fast-agent - (fast-agent-mcp) An MCP native agent application framework"""
 
-# Import important MCP types
-from mcp.types import (
-    CallToolResult,
-    EmbeddedResource,
-    GetPromptResult,
-    ImageContent,
-    Prompt,
-    PromptMessage,
-    ReadResourceResult,
-    Role,
-    TextContent,
-    Tool,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Core agent components
-from mcp_agent.agents.agent import Agent, AgentConfig
-from mcp_agent.core.agent_app import AgentApp
+if TYPE_CHECKING:
+    # Import important MCP types
+    from mcp.types import (
+        CallToolResult,
+        EmbeddedResource,
+        GetPromptResult,
+        ImageContent,
+        Prompt,
+        PromptMessage,
+        ReadResourceResult,
+        Role,
+        TextContent,
+        Tool,
+    )
 
-# Workflow decorators
-from mcp_agent.core.direct_decorators import (
-    agent,
-    chain,
-    evaluator_optimizer,
-    orchestrator,
-    parallel,
-    router,
-)
+    # Core agent components
+    from mcp_agent.agents.agent import Agent, AgentConfig
+    from mcp_agent.core.agent_app import AgentApp
+
+    # Workflow decorators
+    from mcp_agent.core.direct_decorators import (
+        agent,
+        chain,
+        evaluator_optimizer,
+        orchestrator,
+        parallel,
+        router,
+    )
+
+    # FastAgent components
+    from mcp_agent.core.fastagent import FastAgent
 
-# FastAgent components
-from mcp_agent.core.fastagent import FastAgent
+    # Request configuration
+    from mcp_agent.core.request_params import RequestParams
 
-# Request configuration
-from mcp_agent.core.request_params import RequestParams
+    # Core protocol interfaces
+    from mcp_agent.mcp.interfaces import AgentProtocol, AugmentedLLMProtocol
+    from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+    from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
-# Core protocol interfaces
-from mcp_agent.mcp.interfaces import AgentProtocol, AugmentedLLMProtocol
-from mcp_agent.mcp.mcp_aggregator import MCPAggregator
-from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+# Public names and the modules they come from. They are imported on first access (PEP 562),
+# so importing a submodule such as mcp_agent.config doesn't load the whole framework.
+_LAZY_IMPORTS = {
+    # MCP types
+    "Prompt": "mcp.types",
+    "Tool": "mcp.types",
+    "CallToolResult": "mcp.types",
+    "TextContent": "mcp.types",
+    "ImageContent": "mcp.types",
+    "PromptMessage": "mcp.types",
+    "GetPromptResult": "mcp.types",
+    "ReadResourceResult": "mcp.types",
+    "EmbeddedResource": "mcp.types",
+    "Role": "mcp.types",
+    # Core protocols
+    "AgentProtocol": "mcp_agent.mcp.interfaces",
+    "AugmentedLLMProtocol": "mcp_agent.mcp.interfaces",
+    # Core agent components
+    "Agent": "mcp_agent.agents.agent",
+    "AgentConfig": "mcp_agent.agents.agent",
+    "MCPAggregator": "mcp_agent.mcp.mcp_aggregator",
+    "PromptMessageMultipart": "mcp_agent.mcp.prompt_message_multipart",
+    # FastAgent components
+    "FastAgent": "mcp_agent.core.fastagent",
+    "AgentApp": "mcp_agent.core.agent_app",
+    # Workflow decorators
+    "agent": "mcp_agent.core.direct_decorators",
+    "orchestrator": "mcp_agent.core.direct_decorators",
+    "router": "mcp_agent.core.direct_decorators",
+    "chain": "mcp_agent.core.direct_decorators",
+    "parallel": "mcp_agent.core.direct_decorators",
+    "evaluator_optimizer": "mcp_agent.core.direct_decorators",
+    # Request configuration
+    "RequestParams": "mcp_agent.core.request_params",
+}
 
 __all__ = [
     # MCP types
@@ -72,3 +112,17 @@ __all__ = [
     # Request configuration
     "RequestParams",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -10,6 +10,7 @@ import uuid
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     Dict,
     List,
@@ -38,6 +39,7 @@ from mcp_agent.core.agent_types import AgentConfig, AgentType
 from mcp_agent.core.exceptions import PromptExitError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.core.stream_events import GenerationComplete, StreamEvent, TextDelta
 from mcp_agent.human_input.types import (
     HUMAN_INPUT_SIGNAL_NAME,
     HumanInputCallback,
@@ -178,6 +180,12 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         Shutdown the agent and close all MCP server connections.
         NOTE: This method is called automatically when the agent is used as an async context manager.
         """
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut down the attached LLM, then close the MCP server connections."""
+        if self._llm is not None:
+            await self._llm.shutdown()
         await super().close()
 
     async def __call__(
@@ -593,6 +601,40 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         with self.tracer.start_as_current_span(f"Agent: '{self.name}' generate"):
             return await self._llm.generate(multipart_messages, request_params)
 
+    async def generate_stream(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Create a completion with the LLM, yielding events as the response is produced.
+        Delegates to the attached LLM.
+
+        Agents that override generate() (e.g. workflows composing other agents) yield their
+        final response as a single TextDelta followed by GenerationComplete.
+
+        Args:
+            multipart_messages: List of multipart messages to send to the LLM
+            request_params: Optional parameters to configure the request
+
+        Returns:
+            An async iterator of StreamEvents, ending with GenerationComplete
+        """
+        if type(self).generate is not BaseAgent.generate:
+            response = await self.generate(multipart_messages, request_params)
+            if response.last_text():
+                yield TextDelta(text=response.last_text())
+            yield GenerationComplete(message=response)
+            return
+
+        assert self._llm
+        span = self.tracer.start_span(f"Agent: '{self.name}' generate_stream")
+        try:
+            async for event in self._llm.generate_stream(multipart_messages, request_params):
+                yield event
+        finally:
+            span.end()
+
     async def structured(
         self,
         multipart_messages: List[PromptMessageMultipart],
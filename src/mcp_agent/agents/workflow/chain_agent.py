@@ -16,6 +16,7 @@ from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import workflow_step
 
 
 class ChainAgent(BaseAgent):
@@ -72,11 +73,14 @@ class ChainAgent(BaseAgent):
         user_message = multipart_messages[-1] if multipart_messages else None
 
         if not self.cumulative:
-            response: PromptMessageMultipart = await self.agents[0].generate(multipart_messages)
+            first = self.agents[0]
+            with workflow_step(self.agent_type.value, self.name, first.name):
+                response: PromptMessageMultipart = await first.generate(multipart_messages)
             # Process the rest of the agents in the chain
             for agent in self.agents[1:]:
                 next_message = Prompt.user(*response.content)
-                response = await agent.generate([next_message])
+                with workflow_step(self.agent_type.value, self.name, agent.name):
+                    response = await agent.generate([next_message])
 
             return response
 
@@ -95,7 +99,8 @@ class ChainAgent(BaseAgent):
             # In cumulative mode, include the original message and all previous responses
             chain_messages = multipart_messages.copy()
             chain_messages.extend(all_responses)
-            current_response = await agent.generate(chain_messages, request_params)
+            with workflow_step(self.agent_type.value, self.name, agent.name):
+                current_response = await agent.generate(chain_messages, request_params)
 
             # Store the response
             all_responses.append(current_response)
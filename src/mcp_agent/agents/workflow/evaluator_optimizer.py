@@ -21,6 +21,7 @@ from mcp_agent.core.request_params import RequestParams
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import workflow_step
 
 logger = get_logger(__name__)
 
@@ -131,7 +132,8 @@ class EvaluatorOptimizerAgent(BaseAgent):
         request = multipart_messages[-1].all_text() if multipart_messages else ""
 
         # Initial generation
-        response = await self.generator_agent.generate(multipart_messages, request_params)
+        with workflow_step(self.agent_type.value, self.name, "generate"):
+            response = await self.generator_agent.generate(multipart_messages, request_params)
         best_response = response
 
         # Refinement loop
@@ -145,9 +147,10 @@ class EvaluatorOptimizerAgent(BaseAgent):
 
             # Create evaluation message and get structured evaluation result
             eval_message = Prompt.user(eval_prompt)
-            evaluation_result, _ = await self.evaluator_agent.structured(
-                [eval_message], EvaluationResult, request_params
-            )
+            with workflow_step(self.agent_type.value, self.name, "evaluate"):
+                evaluation_result, _ = await self.evaluator_agent.structured(
+                    [eval_message], EvaluationResult, request_params
+                )
 
             # If structured parsing failed, use default evaluation
             if evaluation_result is None:
@@ -197,7 +200,8 @@ class EvaluatorOptimizerAgent(BaseAgent):
 
             # Create refinement message and get refined response
             refinement_message = Prompt.user(refinement_prompt)
-            response = await self.generator_agent.generate([refinement_message], request_params)
+            with workflow_step(self.agent_type.value, self.name, "refine"):
+                response = await self.generator_agent.generate([refinement_message], request_params)
 
             refinement_count += 1
 
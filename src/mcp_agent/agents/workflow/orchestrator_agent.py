@@ -5,6 +5,8 @@ This workflow provides an implementation that manages complex tasks by
 dynamically planning, delegating to specialized agents, and synthesizing results.
 """
 
+import asyncio
+from collections import defaultdict
 from typing import Any, Dict, List, Literal, Optional, Tuple, Type
 
 from mcp.types import TextContent
@@ -12,6 +14,7 @@ from mcp.types import TextContent
 from mcp_agent.agents.agent import Agent
 from mcp_agent.agents.base_agent import BaseAgent
 from mcp_agent.agents.workflow.orchestrator_models import (
+    AgentTask,
     NextStep,
     Plan,
     PlanResult,
@@ -34,6 +37,7 @@ from mcp_agent.core.request_params import RequestParams
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import workflow_step
 
 logger = get_logger(__name__)
 
@@ -58,6 +62,8 @@ class OrchestratorAgent(BaseAgent):
         agents: List[Agent],
         plan_type: Literal["full", "iterative"] = "full",
         plan_iterations: int = 5,
+        max_parallel_tasks: Optional[int] = None,
+        task_timeout: Optional[float] = None,
         context: Optional[Any] = None,
         **kwargs,
     ) -> None:
@@ -68,6 +74,9 @@ class OrchestratorAgent(BaseAgent):
             config: Agent configuration or name
             agents: List of specialized worker agents available for task execution
             plan_type: Planning mode ("full" or "iterative")
+            plan_iterations: Maximum number of planning iterations
+            max_parallel_tasks: Maximum number of tasks in a step to run concurrently (None = unlimited)
+            task_timeout: Timeout in seconds for each individual task (None = no timeout)
             context: Optional context object
             **kwargs: Additional keyword arguments to pass to BaseAgent
         """
@@ -85,6 +94,10 @@ class OrchestratorAgent(BaseAgent):
             self.logger.info(f"Adding agent '{agent_name}' to orchestrator")
             self.agents[agent_name] = agent
         self.plan_iterations = plan_iterations
+        if max_parallel_tasks is not None and max_parallel_tasks < 1:
+            raise AgentConfigError("max_parallel_tasks must be at least 1")
+        self.max_parallel_tasks = max_parallel_tasks
+        self.task_timeout = task_timeout
         # For tracking state during execution
         self.plan_result: Optional[PlanResult] = None
 
@@ -197,7 +210,8 @@ class OrchestratorAgent(BaseAgent):
         while iterations < max_iterations:
             # Generate plan based on planning mode
             if self.plan_type == "iterative":
-                next_step = await self._get_next_step(objective, plan_result, request_params)
+                with workflow_step(self.agent_type.value, self.name, "plan"):
+                    next_step = await self._get_next_step(objective, plan_result, request_params)
                 if next_step is None:
                     self.logger.error("Failed to generate next step, ending iteration early")
                     plan_result.max_iterations_reached = True
@@ -206,7 +220,8 @@ class OrchestratorAgent(BaseAgent):
                 logger.debug(f"Iteration {iterations}: Iterative plan:", data=next_step)
                 plan = Plan(steps=[next_step], is_complete=next_step.is_complete)
             elif self.plan_type == "full":
-                plan = await self._get_full_plan(objective, plan_result, request_params)
+                with workflow_step(self.agent_type.value, self.name, "plan"):
+                    plan = await self._get_full_plan(objective, plan_result, request_params)
                 if plan is None:
                     self.logger.error("Failed to generate full plan, ending iteration early")
                     plan_result.max_iterations_reached = True
@@ -233,7 +248,8 @@ class OrchestratorAgent(BaseAgent):
                     break
 
                 # Execute the step and collect results
-                step_result = await self._execute_step(step, plan_result, request_params)
+                with workflow_step(self.agent_type.value, self.name, "execute_step"):
+                    step_result = await self._execute_step(step, plan_result, request_params)
 
                 plan_result.add_step_result(step_result)
                 total_steps_executed += 1
@@ -270,9 +286,10 @@ class OrchestratorAgent(BaseAgent):
             )
 
         # Generate final synthesis
-        plan_result.result = await self._planner_generate_str(
-            synthesis_prompt, request_params.model_copy(update={"max_iterations": 1})
-        )
+        with workflow_step(self.agent_type.value, self.name, "synthesize"):
+            plan_result.result = await self._planner_generate_str(
+                synthesis_prompt, request_params.model_copy(update={"max_iterations": 1})
+            )
 
         return plan_result
 
@@ -298,92 +315,91 @@ class OrchestratorAgent(BaseAgent):
         # Format context for tasks
         context = format_plan_result(previous_result)
 
-        # Execute all tasks in parallel
-        futures = []
-        error_tasks = []
-
-        for task in step.tasks:
-            # Check agent exists
-            agent = self.agents.get(task.agent)
-            if not agent:
-                self.logger.error(
-                    f"No agent found matching '{task.agent}'. Available agents: {list(self.agents.keys())}"
-                )
-                error_tasks.append(
-                    (
-                        task,
-                        f"Error: Agent '{task.agent}' not found. Available agents: {', '.join(self.agents.keys())}",
-                    )
-                )
-                continue
+        # Limit concurrency if configured; tasks otherwise all start together
+        semaphore = asyncio.Semaphore(self.max_parallel_tasks) if self.max_parallel_tasks else None
+        # Tasks for the same agent share its message history, so they run one after another
+        agent_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
-            # Prepare task prompt
-            task_description = TASK_PROMPT_TEMPLATE.format(
-                objective=previous_result.objective, task=task.description, context=context
-            )
+        async def run_task(task: AgentTask) -> TaskWithResult:
+            async with agent_locks[task.agent]:
+                if semaphore is None:
+                    return await self._execute_task(task, previous_result.objective, context)
+                async with semaphore:
+                    return await self._execute_task(task, previous_result.objective, context)
 
-            # Queue task for execution
-            futures.append(
-                (
-                    task,
-                    agent.generate(
-                        [
-                            PromptMessageMultipart(
-                                role="user",
-                                content=[TextContent(type="text", text=task_description)],
-                            )
-                        ]
-                    ),
-                )
-            )
-
-        # Wait for all tasks
-        task_results = []
-        for future in futures:
-            task, future_obj = future
-            try:
-                result = await future_obj
-                result_text = result.all_text()
-
-                # Create task result
-                task_model = task.model_dump()
-                task_result = TaskWithResult(
-                    description=task_model["description"],
-                    agent=task_model["agent"],
-                    result=result_text,
-                )
-                task_results.append(task_result)
-            except Exception as e:
-                self.logger.error(f"Error executing task: {str(e)}")
-                # Add error result
-                task_model = task.model_dump()
-                task_results.append(
-                    TaskWithResult(
-                        description=task_model["description"],
-                        agent=task_model["agent"],
-                        result=f"ERROR: {str(e)}",
-                    )
-                )
+        # Execute tasks for different agents in parallel - gather preserves the plan's task order
+        task_results = await asyncio.gather(*[run_task(task) for task in step.tasks])
 
-        # Add all task results to step result
         for task_result in task_results:
             step_result.add_task_result(task_result)
 
-        # Add error task results
-        for task, error_message in error_tasks:
-            task_model = task.model_dump()
-            step_result.add_task_result(
-                TaskWithResult(
-                    description=task_model["description"],
-                    agent=task_model["agent"],
-                    result=f"ERROR: {error_message}",
-                )
-            )
-
         # Format step result
         step_result.result = format_step_result_text(step_result)
         return step_result
 
+    async def _execute_task(self, task: AgentTask, objective: str, context: str) -> TaskWithResult:
+        """
+        Execute a single task with its assigned agent.
+
+        Errors (including missing agents and timeouts) are captured in the result
+        so that one failing task does not affect the others in the step.
+
+        Args:
+            task: The task to execute
+            objective: The overall objective of the plan
+            context: Formatted results of the plan execution so far
+
+        Returns:
+            TaskWithResult containing the agent response or an error message
+        """
+        # Check agent exists
+        agent = self.agents.get(task.agent)
+        if not agent:
+            self.logger.error(
+                f"No agent found matching '{task.agent}'. Available agents: {list(self.agents.keys())}"
+            )
+            return TaskWithResult(
+                description=task.description,
+                agent=task.agent,
+                result=f"ERROR: Agent '{task.agent}' not found. Available agents: {', '.join(self.agents.keys())}",
+            )
+
+        # Prepare task prompt
+        task_description = TASK_PROMPT_TEMPLATE.format(
+            objective=objective, task=task.description, context=context
+        )
+        prompt = [
+            PromptMessageMultipart(
+                role="user",
+                content=[TextContent(type="text", text=task_description)],
+            )
+        ]
+
+        try:
+            if self.task_timeout is not None:
+                result = await asyncio.wait_for(agent.generate(prompt), timeout=self.task_timeout)
+            else:
+                result = await agent.generate(prompt)
+            return TaskWithResult(
+                description=task.description,
+                agent=task.agent,
+                result=result.all_text(),
+            )
+        except asyncio.TimeoutError:
+            self.logger.error(f"Task for agent '{task.agent}' timed out after {self.task_timeout}s")
+            return TaskWithResult(
+                description=task.description,
+                agent=task.agent,
+                result=f"ERROR: Task timed out after {self.task_timeout} seconds",
+            )
+        except Exception as e:
+            self.logger.error(f"Error executing task: {str(e)}")
+            return TaskWithResult(
+                description=task.description,
+                agent=task.agent,
+                result=f"ERROR: {str(e)}",
+            )
+
     async def _get_full_plan(
         self, objective: str, plan_result: PlanResult, request_params: RequestParams
     ) -> Optional[Plan]:
@@ -10,6 +10,7 @@ from mcp_agent.core.agent_types import AgentConfig, AgentType
 from mcp_agent.core.request_params import RequestParams
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import workflow_step
 
 
 class ParallelAgent(BaseAgent):
@@ -67,12 +68,13 @@ class ParallelAgent(BaseAgent):
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Parallel: '{self.name}' generate"):
             # Execute all fan-out agents in parallel
-            responses: List[PromptMessageMultipart] = await asyncio.gather(
-                *[
-                    agent.generate(multipart_messages, request_params)
-                    for agent in self.fan_out_agents
-                ]
-            )
+            with workflow_step(self.agent_type.value, self.name, "fan_out"):
+                responses: List[PromptMessageMultipart] = await asyncio.gather(
+                    *[
+                        agent.generate(multipart_messages, request_params)
+                        for agent in self.fan_out_agents
+                    ]
+                )
 
             # Extract the received message from the input
             received_message: Optional[str] = (
@@ -93,7 +95,8 @@ class ParallelAgent(BaseAgent):
             )
 
             # Use the fan-in agent to aggregate the responses
-            return await self.fan_in_agent.generate([formatted_prompt], request_params)
+            with workflow_step(self.agent_type.value, self.name, "fan_in"):
+                return await self.fan_in_agent.generate([formatted_prompt], request_params)
 
     def _format_responses(self, responses: List[Any], message: Optional[str] = None) -> str:
         """
@@ -144,12 +147,13 @@ class ParallelAgent(BaseAgent):
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Parallel: '{self.name}' generate"):
             # Generate parallel responses first
-            responses: List[PromptMessageMultipart] = await asyncio.gather(
-                *[
-                    agent.generate(multipart_messages, request_params)
-                    for agent in self.fan_out_agents
-                ]
-            )
+            with workflow_step(self.agent_type.value, self.name, "fan_out"):
+                responses: List[PromptMessageMultipart] = await asyncio.gather(
+                    *[
+                        agent.generate(multipart_messages, request_params)
+                        for agent in self.fan_out_agents
+                    ]
+                )
 
             # Extract the received message
             received_message: Optional[str] = (
@@ -168,7 +172,8 @@ class ParallelAgent(BaseAgent):
             )
 
             # Use the fan-in agent to parse the structured output
-            return await self.fan_in_agent.structured([formatted_prompt], model, request_params)
+            with workflow_step(self.agent_type.value, self.name, "fan_in"):
+                return await self.fan_in_agent.structured([formatted_prompt], model, request_params)
 
     async def initialize(self) -> None:
         """
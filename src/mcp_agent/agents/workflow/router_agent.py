@@ -19,6 +19,7 @@ from mcp_agent.core.request_params import RequestParams
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.interfaces import AugmentedLLMProtocol, ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import workflow_step
 
 if TYPE_CHECKING:
     from a2a_types.types import AgentCard
@@ -161,7 +162,8 @@ class RouterAgent(BaseAgent):
         """
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Routing: '{self.name}' generate"):
-            route, warn = await self._route_request(multipart_messages[-1])
+            with workflow_step(self.agent_type.value, self.name, "route"):
+                route, warn = await self._route_request(multipart_messages[-1])
 
             if not route:
                 return Prompt.assistant(warn or "No routing result or warning received")
@@ -170,7 +172,8 @@ class RouterAgent(BaseAgent):
             agent: Agent = self.agent_map[route.agent]
 
             # Dispatch the request to the selected agent
-            return await agent.generate(multipart_messages, request_params)
+            with workflow_step(self.agent_type.value, self.name, agent.name):
+                return await agent.generate(multipart_messages, request_params)
 
     async def structured(
         self,
@@ -192,7 +195,8 @@ class RouterAgent(BaseAgent):
 
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Routing: '{self.name}' structured"):
-            route, warn = await self._route_request(multipart_messages[-1])
+            with workflow_step(self.agent_type.value, self.name, "route"):
+                route, warn = await self._route_request(multipart_messages[-1])
 
             if not route:
                 return None, Prompt.assistant(
@@ -203,7 +207,8 @@ class RouterAgent(BaseAgent):
             agent: Agent = self.agent_map[route.agent]
 
             # Dispatch the request to the selected agent
-            return await agent.structured(multipart_messages, model, request_params)
+            with workflow_step(self.agent_type.value, self.name, agent.name):
+                return await agent.structured(multipart_messages, model, request_params)
 
     async def _route_request(
         self, message: PromptMessageMultipart
@@ -150,6 +150,8 @@ class MCPApp:
                 "agent_name": self.name or "fastagent loop",
             },
         )
+        if self._context.executor:
+            self._context.executor.shutdown()
         try:
             await cleanup_context()
         except asyncio.CancelledError:
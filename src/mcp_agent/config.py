@@ -6,7 +6,7 @@ for the application configuration.
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -96,11 +96,32 @@ class MCPServerSettings(BaseModel):
     cwd: str | None = None
     """Working directory for the executed server command."""
 
+    startup_timeout_seconds: float | None = None
+    """Maximum time in seconds to wait for the server to start and initialize (None waits indefinitely)."""
+
+    pool_size: int = Field(default=1, ge=1)
+    """
+    Number of sessions (processes, for stdio) to keep open to this server when using persistent
+    connections. Tool calls, prompts and resource reads are spread across the pool, each going to
+    the session with the fewest requests in flight. Only use values above 1 for stateless servers.
+    """
+
 
 class MCPSettings(BaseModel):
     """Configuration for all MCP servers."""
 
     servers: Dict[str, MCPServerSettings] = {}
+
+    max_concurrent_startups: int = Field(default=8, ge=1)
+    """Maximum number of servers an agent starts concurrently when connecting to its servers."""
+
+    catalog_cache_dir: str | None = None
+    """
+    Directory in which to cache server tool and prompt lists between runs. When every server an
+    agent uses has a cached catalog, the agent is ready without waiting for its servers to start.
+    Disabled when unset.
+    """
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -113,6 +134,12 @@ class AnthropicSettings(BaseModel):
 
     base_url: str | None = None
 
+    prompt_caching: bool = False
+    """
+    Add cache breakpoints to the system prompt, tools and latest message so that repeated
+    prefixes are served from Anthropic's prompt cache. Can be overridden per request.
+    """
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -179,6 +206,80 @@ class OpenRouterSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class ProviderHTTPSettings(BaseModel):
+    """
+    HTTP connection pool settings for LLM provider clients.
+    """
+
+    max_connections: int = 100
+    """Maximum number of concurrent connections per client"""
+
+    max_keepalive_connections: int = 20
+    """Maximum number of idle connections kept open for reuse"""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection is kept open"""
+
+    connect_timeout: float = 5.0
+    """Timeout in seconds for establishing a connection"""
+
+    timeout: float = 600.0
+    """Timeout in seconds for a complete request"""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
+class RetrySettings(BaseModel):
+    """
+    Retry policy for tasks run by the executor that fail with a transient error,
+    such as a provider rate limit (429) or overload (529).
+    """
+
+    max_attempts: int = Field(default=3, ge=1)
+    """Attempts per task, including the first"""
+
+    initial_delay: float = 1.0
+    """Seconds to wait before the first retry"""
+
+    max_delay: float = 30.0
+    """Upper bound in seconds for the backoff delay"""
+
+    backoff_multiplier: float = 2.0
+    """Factor the delay grows by after each attempt"""
+
+    jitter: bool = True
+    """Pick each delay at random between zero and the backoff value, to spread retries out"""
+
+    respect_retry_after: bool = True
+    """Wait as long as the provider's Retry-After header asks, instead of the backoff value"""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
+class ExecutorSettings(BaseModel):
+    """
+    Settings for the executor that runs provider calls and other tasks, and the worker
+    pools it uses for blocking and CPU-heavy work.
+    """
+
+    max_concurrent_activities: int | None = None
+    """Maximum number of tasks running at once (unbounded if not set)"""
+
+    timeout_seconds: float | None = None
+    """Deadline in seconds for a task, including any retries (no deadline if not set)"""
+
+    retry: RetrySettings | None = RetrySettings()
+    """Retry policy for transient errors; set to null to disable retries"""
+
+    io_pool_size: int = Field(default=64, ge=1)
+    """Threads for blocking calls, such as sync provider SDK calls"""
+
+    process_pool_size: int = Field(default=0, ge=0)
+    """Processes for CPU-heavy work such as re-encoding images (0 disables the process pool)"""
+
+    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+
+
 class OpenTelemetrySettings(BaseModel):
     """
     OTEL settings for the fast-agent application.
@@ -194,8 +295,35 @@ class OpenTelemetrySettings(BaseModel):
     console_debug: bool = False
     """Log spans to console"""
 
-    sample_rate: float = 1.0
-    """Sample rate for tracing (1.0 = sample everything)"""
+    sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    """Sample rate for new traces (1.0 = sample everything). Child spans follow their parent's decision"""
+
+    max_queue_size: int = 2048
+    """Maximum number of finished spans buffered for export before new spans are dropped"""
+
+    max_export_batch_size: int = 512
+    """Maximum number of spans sent per export request"""
+
+    schedule_delay_millis: int = 5000
+    """Delay between scheduled exports"""
+
+    max_attribute_length: int | None = 4096
+    """Truncate string span attributes (e.g. prompts, tool payloads) to this many characters"""
+
+    max_span_attributes: int = 128
+    """Maximum number of attributes recorded per span"""
+
+    metrics: bool = False
+    """Record metrics (LLM and tool latency, token counts, MCP connections, event bus, workflow steps)"""
+
+    otlp_metrics_endpoint: str | None = None
+    """OTLP endpoint for metrics (defaults to otlp_endpoint with /v1/traces replaced by /v1/metrics)"""
+
+    metrics_export_interval_millis: int = 60000
+    """Interval between OTLP metric exports"""
+
+    prometheus: bool = False
+    """Serve metrics in Prometheus text format at /metrics when running as an MCP server over SSE/HTTP"""
 
 
 class TensorZeroSettings(BaseModel):
@@ -224,6 +352,18 @@ class LoggerSettings(BaseModel):
     path: str = "fastagent.jsonl"
     """Path to log file, if logger 'type' is 'file'."""
 
+    max_file_size: int | None = None
+    """Rotate the log file before it exceeds this many bytes"""
+
+    rotate_interval: float | None = None
+    """Rotate the log file after it has been written to for this many seconds"""
+
+    backup_count: int = 5
+    """Number of rotated log files to keep"""
+
+    compress_rotated: bool = False
+    """Gzip rotated log files"""
+
     batch_size: int = 100
     """Number of events to accumulate before processing"""
 
@@ -233,6 +373,17 @@ class LoggerSettings(BaseModel):
     max_queue_size: int = 2048
     """Maximum queue size for event processing"""
 
+    queue_overflow: Literal["block", "drop_oldest", "drop_newest", "sample_debug"] = "drop_oldest"
+    """
+    What to do with a new event when the queue is full: wait for space ('block'), discard
+    the oldest queued event, discard the new event, or keep only a sample of debug and
+    progress events while discarding the oldest queued event for everything else.
+    Logger calls can't wait, so with 'block' they discard the new event instead.
+    """
+
+    queue_debug_sample_rate: float = 0.1
+    """Fraction of debug/progress events kept when the queue is full, for 'sample_debug'"""
+
     # HTTP transport settings
     http_endpoint: str | None = None
     """HTTP endpoint for event transport"""
@@ -272,6 +423,12 @@ class Settings(BaseSettings):
     execution_engine: Literal["asyncio"] = "asyncio"
     """Execution engine for the fast-agent application"""
 
+    executor: ExecutorSettings | None = ExecutorSettings()
+    """Concurrency, deadline and retry settings for the executor"""
+
+    agent_init_concurrency: int | None = Field(default=8, ge=1)
+    """Maximum number of agents initializing (connecting MCP servers) at once; null for no limit"""
+
     default_model: str | None = "haiku"
     """
     Default model for agents. Format is provider.model_name.<reasoning_effort>, for example openai.o3-mini.low
@@ -302,6 +459,9 @@ class Settings(BaseSettings):
     tensorzero: Optional[TensorZeroSettings] = None
     """Settings for using TensorZero inference gateway"""
 
+    provider_http: ProviderHTTPSettings | None = ProviderHTTPSettings()
+    """HTTP connection pool settings shared by the Anthropic and OpenAI compatible providers"""
+
     logger: LoggerSettings | None = LoggerSettings()
     """Logger settings for the fast-agent application"""
 
@@ -9,25 +9,21 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from mcp import ServerSession
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
-from opentelemetry.instrumentation.openai import OpenAIInstrumentor
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from pydantic import BaseModel, ConfigDict
 
-from mcp_agent.config import Settings, get_settings
-from mcp_agent.executor.executor import AsyncioExecutor, Executor
+from mcp_agent.config import OpenTelemetrySettings, Settings, get_settings
+from mcp_agent.executor.executor import AsyncioExecutor, Executor, ExecutorConfig
 from mcp_agent.executor.task_registry import ActivityRegistry
 from mcp_agent.logging.events import EventFilter
 from mcp_agent.logging.logger import LoggingConfig, get_logger
 from mcp_agent.logging.transport import create_transport
 from mcp_agent.mcp_server_registry import ServerRegistry
+from mcp_agent.metrics import configure_metrics
 
 if TYPE_CHECKING:
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+
     from mcp_agent.executor.workflow_signal import SignalWaitCallback
     from mcp_agent.human_input.types import HumanInputCallback
 else:
@@ -62,19 +58,65 @@ class Context(BaseModel):
     )
 
 
-async def configure_otel(config: "Settings") -> None:
+def create_tracer_provider(
+    settings: OpenTelemetrySettings, resource: "Resource | None" = None
+) -> "TracerProvider":
     """
-    Configure OpenTelemetry based on the application config.
+    Create a tracer provider with sampling, span limits and exporters from the OTEL settings.
     """
-    if not config.otel or not config.otel.enabled:
-        return
+    # The SDK and exporters are only imported when OTEL is enabled, to keep startup fast
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import SpanLimits, TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SpanExporter,
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    tracer_provider = TracerProvider(
+        resource=resource or Resource.create(),
+        sampler=ParentBased(TraceIdRatioBased(settings.sample_rate)),
+        span_limits=SpanLimits(
+            max_span_attributes=settings.max_span_attributes,
+            max_span_attribute_length=settings.max_attribute_length,
+        ),
+    )
 
-    # Set up global textmap propagator first
-    set_global_textmap(TraceContextTextMapPropagator())
+    def add_exporter(exporter: SpanExporter) -> None:
+        tracer_provider.add_span_processor(
+            BatchSpanProcessor(
+                exporter,
+                max_queue_size=settings.max_queue_size,
+                max_export_batch_size=settings.max_export_batch_size,
+                schedule_delay_millis=settings.schedule_delay_millis,
+            )
+        )
 
-    service_name = config.otel.service_name
+    # Add exporters based on config
+    if settings.otlp_endpoint:
+        add_exporter(OTLPSpanExporter(endpoint=settings.otlp_endpoint))
+
+        if settings.console_debug:
+            add_exporter(ConsoleSpanExporter())
+    else:
+        # Default to console exporter in development
+        add_exporter(ConsoleSpanExporter())
+
+    return tracer_provider
+
+
+def _otel_resource(settings: OpenTelemetrySettings) -> "Resource":
+    """
+    Resource describing this fast-agent instance, shared by traces and metrics.
+    """
     from importlib.metadata import version
 
+    from opentelemetry.sdk.resources import Resource
+
+    service_name = settings.service_name
+
     try:
         app_version = version("fast-agent-mcp")
     except:  # noqa: E722
@@ -91,21 +133,31 @@ async def configure_otel(config: "Settings") -> None:
             if value is not None
         }
     )
+    return resource
 
-    # Create provider with resource
-    tracer_provider = TracerProvider(resource=resource)
 
-    # Add exporters based on config
-    otlp_endpoint = config.otel.otlp_endpoint
-    if otlp_endpoint:
-        exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-        tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+async def configure_otel(config: "Settings") -> None:
+    """
+    Configure OpenTelemetry based on the application config.
+    """
+    if not config.otel or not (config.otel.enabled or config.otel.metrics):
+        return
 
-        if config.otel.console_debug:
-            tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
-    else:
-        # Default to console exporter in development
-        tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    resource = _otel_resource(config.otel)
+    if config.otel.metrics:
+        configure_metrics(config.otel, resource)
+    if not config.otel.enabled:
+        return
+
+    from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
+    from opentelemetry.instrumentation.openai import OpenAIInstrumentor
+    from opentelemetry.propagate import set_global_textmap
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+    # Set up global textmap propagator first
+    set_global_textmap(TraceContextTextMapPropagator())
+
+    tracer_provider = create_tracer_provider(config.otel, resource)
 
     # Set as global tracer provider
     trace.set_tracer_provider(tracer_provider)
@@ -125,6 +177,9 @@ async def configure_logger(config: "Settings") -> None:
         transport=transport,
         batch_size=config.logger.batch_size,
         flush_interval=config.logger.flush_interval,
+        max_queue_size=config.logger.max_queue_size,
+        queue_overflow=config.logger.queue_overflow,
+        queue_debug_sample_rate=config.logger.queue_debug_sample_rate,
         progress_display=config.logger.progress_display,
     )
 
@@ -141,7 +196,19 @@ async def configure_executor(config: "Settings"):
     """
     Configure the executor based on the application config.
     """
-    return AsyncioExecutor()
+    settings = config.executor
+    if settings is None:
+        return AsyncioExecutor()
+
+    return AsyncioExecutor(
+        config=ExecutorConfig(
+            max_concurrent_activities=settings.max_concurrent_activities,
+            timeout_seconds=settings.timeout_seconds,
+            retry_policy=settings.retry,
+            io_pool_size=settings.io_pool_size,
+            process_pool_size=settings.process_pool_size,
+        )
+    )
 
 
 async def initialize_context(
@@ -225,6 +225,8 @@ def orchestrator(
     human_input: bool = False,
     plan_type: Literal["full", "iterative"] = "full",
     plan_iterations: int = 5,
+    max_parallel_tasks: Optional[int] = None,
+    task_timeout: Optional[float] = None,
 ) -> Callable[[AgentCallable[P, R]], DecoratedOrchestratorProtocol[P, R]]:
     """
     Decorator to create and register an orchestrator agent with type-safe signature.
@@ -238,7 +240,9 @@ def orchestrator(
         request_params: Additional request parameters for the LLM
         human_input: Whether to enable human input capabilities
         plan_type: Planning approach - "full" or "iterative"
-        max_iterations: Maximum number of planning iterations
+        plan_iterations: Maximum number of planning iterations
+        max_parallel_tasks: Maximum number of tasks within a step to run concurrently
+        task_timeout: Timeout in seconds for each task executed by a child agent
 
     Returns:
         A decorator that registers the orchestrator with proper type annotations
@@ -261,6 +265,8 @@ def orchestrator(
             child_agents=agents,
             plan_type=plan_type,
             plan_iterations=plan_iterations,
+            max_parallel_tasks=max_parallel_tasks,
+            task_timeout=task_timeout,
         ),
     )
 
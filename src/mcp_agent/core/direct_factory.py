@@ -3,7 +3,8 @@ Direct factory functions for creating agent and workflow instances without proxi
 Implements type-safe factories with improved error handling.
 """
 
-from typing import Any, Callable, Dict, Optional, Protocol, TypeVar
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Protocol, TypeVar
 
 from mcp_agent.agents.agent import Agent, AgentConfig
 from mcp_agent.agents.workflow.evaluator_optimizer import (
@@ -96,10 +97,13 @@ async def create_agents_by_type(
     agent_type: AgentType,
     active_agents: Optional[AgentDict] = None,
     model_factory_func: Optional[ModelFactoryFn] = None,
+    max_concurrency: Optional[int] = None,
     **kwargs: Any,
 ) -> AgentDict:
     """
     Generic method to create agents of a specific type without using proxies.
+    The agents are initialized concurrently; if any fail, each failure is logged,
+    the agents that were initialized are shut down and the first failure is raised.
 
     Args:
         app_instance: The main application instance
@@ -107,6 +111,7 @@ async def create_agents_by_type(
         agent_type: Type of agents to create
         active_agents: Dictionary of already created agents (for dependencies)
         model_factory_func: Function for creating model factories
+        max_concurrency: Maximum number of agents initializing at once (unbounded if not set)
         **kwargs: Additional type-specific parameters
 
     Returns:
@@ -120,196 +125,247 @@ async def create_agents_by_type(
         def model_factory_func(model=None, request_params=None):
             return lambda: None
 
-    # Create a dictionary to store the initialized agents
+    # Agents in a dependency group don't depend on each other, so initialize them
+    # (connecting their MCP servers and attaching LLMs) concurrently
+    semaphore = asyncio.Semaphore(max_concurrency or len(agents_dict) or 1)
+
+    async def create(name: str, agent_data: Dict[str, Any]) -> AgentDict:
+        async with semaphore:
+            return await _create_agent(
+                app_instance, name, agent_data, agent_type, active_agents, model_factory_func
+            )
+
+    results = await asyncio.gather(
+        *(create(name, agent_data) for name, agent_data in agents_dict.items()),
+        return_exceptions=True,
+    )
+
+    # Report every failure, then raise the first
+    result_agents: AgentDict = {}
+    failures: List[BaseException] = []
+    for name, result in zip(agents_dict, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Failed to initialize agent {name}: {result}",
+                data={"progress_action": ProgressAction.FATAL_ERROR, "agent_name": name},
+            )
+            failures.append(result)
+        else:
+            result_agents.update(result)
+    if failures:
+        # Don't leave the agents that did initialize holding their servers and clients
+        for name, agent in result_agents.items():
+            try:
+                await agent.shutdown()
+            except Exception as e:
+                logger.warning(f"Error shutting down agent {name}: {e}")
+        raise failures[0]
+
+    return result_agents
+
+
+async def _create_agent(
+    app_instance: MCPApp,
+    name: str,
+    agent_data: Dict[str, Any],
+    agent_type: AgentType,
+    active_agents: AgentDict,
+    model_factory_func: ModelFactoryFn,
+) -> AgentDict:
+    """
+    Create and initialize one agent of the given type.
+
+    Returns:
+        The new agent, plus any agents created for it (e.g. a default fan-in agent)
+    """
+    logger.info(
+        f"Loaded {name}",
+        data={
+            "progress_action": ProgressAction.LOADED,
+            "agent_name": name,
+        },
+    )
+
+    # Compare type string from config with Enum value
     result_agents: AgentDict = {}
+    if agent_data["type"] != agent_type.value:
+        return result_agents
+
+    # Get common configuration
+    config = agent_data["config"]
+
+    # Type-specific initialization based on the Enum type
+    # Note: Above we compared string values from config, here we compare Enum objects directly
+    if agent_type == AgentType.BASIC:
+        # Create a basic agent
+        agent = Agent(
+            config=config,
+            context=app_instance.context,
+        )
+        await agent.initialize()
+
+        # Attach LLM to the agent
+        llm_factory = model_factory_func(model=config.model)
+        await agent.attach_llm(llm_factory, request_params=config.default_request_params)
+        result_agents[name] = agent
+
+    elif agent_type == AgentType.ORCHESTRATOR:
+        # Get base params configured with model settings
+        base_params = (
+            config.default_request_params.model_copy()
+            if config.default_request_params
+            else RequestParams()
+        )
+        base_params.use_history = False  # Force no history for orchestrator
+
+        # Get the child agents
+        child_agents = []
+        for agent_name in agent_data["child_agents"]:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Agent {agent_name} not found")
+            agent = active_agents[agent_name]
+            child_agents.append(agent)
+
+        # Create the orchestrator
+        orchestrator = OrchestratorAgent(
+            config=config,
+            context=app_instance.context,
+            agents=child_agents,
+            plan_iterations=agent_data.get("plan_iterations", 5),
+            plan_type=agent_data.get("plan_type", "full"),
+            max_parallel_tasks=agent_data.get("max_parallel_tasks"),
+            task_timeout=agent_data.get("task_timeout"),
+        )
+
+        # Initialize the orchestrator
+        await orchestrator.initialize()
+
+        # Attach LLM to the orchestrator
+        llm_factory = model_factory_func(model=config.model)
+        await orchestrator.attach_llm(llm_factory, request_params=config.default_request_params)
+
+        result_agents[name] = orchestrator
 
-    # Get all agents of the specified type
-    for name, agent_data in agents_dict.items():
-        logger.info(
-            f"Loaded {name}",
-            data={
-                "progress_action": ProgressAction.LOADED,
-                "agent_name": name,
-            },
+    elif agent_type == AgentType.PARALLEL:
+        # Get the fan-out and fan-in agents
+        fan_in_name = agent_data.get("fan_in")
+        fan_out_names = agent_data["fan_out"]
+
+        # Create or retrieve the fan-in agent
+        if not fan_in_name:
+            # Create default fan-in agent with auto-generated name
+            fan_in_name = f"{name}_fan_in"
+            fan_in_agent = await _create_default_fan_in_agent(
+                fan_in_name, app_instance.context, model_factory_func
+            )
+            # Add to result_agents so it's registered properly
+            result_agents[fan_in_name] = fan_in_agent
+        elif fan_in_name not in active_agents:
+            raise AgentConfigError(f"Fan-in agent {fan_in_name} not found")
+        else:
+            fan_in_agent = active_agents[fan_in_name]
+
+        # Get the fan-out agents
+        fan_out_agents = []
+        for agent_name in fan_out_names:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Fan-out agent {agent_name} not found")
+            fan_out_agents.append(active_agents[agent_name])
+
+        # Create the parallel agent
+        parallel = ParallelAgent(
+            config=config,
+            context=app_instance.context,
+            fan_in_agent=fan_in_agent,
+            fan_out_agents=fan_out_agents,
+        )
+        await parallel.initialize()
+        result_agents[name] = parallel
+
+    elif agent_type == AgentType.ROUTER:
+        # Get the router agents
+        router_agents = []
+        for agent_name in agent_data["router_agents"]:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Router agent {agent_name} not found")
+            router_agents.append(active_agents[agent_name])
+
+        # Create the router agent
+        router = RouterAgent(
+            config=config,
+            context=app_instance.context,
+            agents=router_agents,
+            routing_instruction=agent_data.get("instruction"),
         )
+        await router.initialize()
+
+        # Attach LLM to the router
+        llm_factory = model_factory_func(model=config.model)
+        await router.attach_llm(llm_factory, request_params=config.default_request_params)
+        result_agents[name] = router
+
+    elif agent_type == AgentType.CHAIN:
+        # Get the chained agents
+        chain_agents = []
 
-        # Compare type string from config with Enum value
-        if agent_data["type"] == agent_type.value:
-            # Get common configuration
-            config = agent_data["config"]
-
-            # Type-specific initialization based on the Enum type
-            # Note: Above we compared string values from config, here we compare Enum objects directly
-            if agent_type == AgentType.BASIC:
-                # Create a basic agent
-                agent = Agent(
-                    config=config,
-                    context=app_instance.context,
-                )
-                await agent.initialize()
-
-                # Attach LLM to the agent
-                llm_factory = model_factory_func(model=config.model)
-                await agent.attach_llm(llm_factory, request_params=config.default_request_params)
-                result_agents[name] = agent
-
-            elif agent_type == AgentType.ORCHESTRATOR:
-                # Get base params configured with model settings
-                base_params = (
-                    config.default_request_params.model_copy()
-                    if config.default_request_params
-                    else RequestParams()
-                )
-                base_params.use_history = False  # Force no history for orchestrator
-
-                # Get the child agents
-                child_agents = []
-                for agent_name in agent_data["child_agents"]:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Agent {agent_name} not found")
-                    agent = active_agents[agent_name]
-                    child_agents.append(agent)
-
-                # Create the orchestrator
-                orchestrator = OrchestratorAgent(
-                    config=config,
-                    context=app_instance.context,
-                    agents=child_agents,
-                    plan_iterations=agent_data.get("plan_iterations", 5),
-                    plan_type=agent_data.get("plan_type", "full"),
-                )
-
-                # Initialize the orchestrator
-                await orchestrator.initialize()
-
-                # Attach LLM to the orchestrator
-                llm_factory = model_factory_func(model=config.model)
-                await orchestrator.attach_llm(
-                    llm_factory, request_params=config.default_request_params
-                )
-
-                result_agents[name] = orchestrator
-
-            elif agent_type == AgentType.PARALLEL:
-                # Get the fan-out and fan-in agents
-                fan_in_name = agent_data.get("fan_in")
-                fan_out_names = agent_data["fan_out"]
-
-                # Create or retrieve the fan-in agent
-                if not fan_in_name:
-                    # Create default fan-in agent with auto-generated name
-                    fan_in_name = f"{name}_fan_in"
-                    fan_in_agent = await _create_default_fan_in_agent(
-                        fan_in_name, app_instance.context, model_factory_func
-                    )
-                    # Add to result_agents so it's registered properly
-                    result_agents[fan_in_name] = fan_in_agent
-                elif fan_in_name not in active_agents:
-                    raise AgentConfigError(f"Fan-in agent {fan_in_name} not found")
-                else:
-                    fan_in_agent = active_agents[fan_in_name]
-
-                # Get the fan-out agents
-                fan_out_agents = []
-                for agent_name in fan_out_names:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Fan-out agent {agent_name} not found")
-                    fan_out_agents.append(active_agents[agent_name])
-
-                # Create the parallel agent
-                parallel = ParallelAgent(
-                    config=config,
-                    context=app_instance.context,
-                    fan_in_agent=fan_in_agent,
-                    fan_out_agents=fan_out_agents,
-                )
-                await parallel.initialize()
-                result_agents[name] = parallel
-
-            elif agent_type == AgentType.ROUTER:
-                # Get the router agents
-                router_agents = []
-                for agent_name in agent_data["router_agents"]:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Router agent {agent_name} not found")
-                    router_agents.append(active_agents[agent_name])
-
-                # Create the router agent
-                router = RouterAgent(
-                    config=config,
-                    context=app_instance.context,
-                    agents=router_agents,
-                    routing_instruction=agent_data.get("instruction"),
-                )
-                await router.initialize()
-
-                # Attach LLM to the router
-                llm_factory = model_factory_func(model=config.model)
-                await router.attach_llm(llm_factory, request_params=config.default_request_params)
-                result_agents[name] = router
-
-            elif agent_type == AgentType.CHAIN:
-                # Get the chained agents
-                chain_agents = []
-
-                agent_names = agent_data["sequence"]
-                if 0 == len(agent_names):
-                    raise AgentConfigError("No agents in the chain")
-
-                for agent_name in agent_data["sequence"]:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Chain agent {agent_name} not found")
-                    chain_agents.append(active_agents[agent_name])
-
-                from mcp_agent.agents.workflow.chain_agent import ChainAgent
-
-                # Get the cumulative parameter
-                cumulative = agent_data.get("cumulative", False)
-
-                chain = ChainAgent(
-                    config=config,
-                    context=app_instance.context,
-                    agents=chain_agents,
-                    cumulative=cumulative,
-                )
-                await chain.initialize()
-                result_agents[name] = chain
-
-            elif agent_type == AgentType.EVALUATOR_OPTIMIZER:
-                # Get the generator and evaluator agents
-                generator_name = agent_data["generator"]
-                evaluator_name = agent_data["evaluator"]
-
-                if generator_name not in active_agents:
-                    raise AgentConfigError(f"Generator agent {generator_name} not found")
-
-                if evaluator_name not in active_agents:
-                    raise AgentConfigError(f"Evaluator agent {evaluator_name} not found")
-
-                generator_agent = active_agents[generator_name]
-                evaluator_agent = active_agents[evaluator_name]
-
-                # Get min_rating and max_refinements from agent_data
-                min_rating_str = agent_data.get("min_rating", "GOOD")
-                min_rating = QualityRating(min_rating_str)
-                max_refinements = agent_data.get("max_refinements", 3)
-
-                # Create the evaluator-optimizer agent
-                evaluator_optimizer = EvaluatorOptimizerAgent(
-                    config=config,
-                    context=app_instance.context,
-                    generator_agent=generator_agent,
-                    evaluator_agent=evaluator_agent,
-                    min_rating=min_rating,
-                    max_refinements=max_refinements,
-                )
-
-                # Initialize the agent
-                await evaluator_optimizer.initialize()
-                result_agents[name] = evaluator_optimizer
-
-            else:
-                raise ValueError(f"Unknown agent type: {agent_type}")
+        agent_names = agent_data["sequence"]
+        if 0 == len(agent_names):
+            raise AgentConfigError("No agents in the chain")
+
+        for agent_name in agent_data["sequence"]:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Chain agent {agent_name} not found")
+            chain_agents.append(active_agents[agent_name])
+
+        from mcp_agent.agents.workflow.chain_agent import ChainAgent
+
+        # Get the cumulative parameter
+        cumulative = agent_data.get("cumulative", False)
+
+        chain = ChainAgent(
+            config=config,
+            context=app_instance.context,
+            agents=chain_agents,
+            cumulative=cumulative,
+        )
+        await chain.initialize()
+        result_agents[name] = chain
+
+    elif agent_type == AgentType.EVALUATOR_OPTIMIZER:
+        # Get the generator and evaluator agents
+        generator_name = agent_data["generator"]
+        evaluator_name = agent_data["evaluator"]
+
+        if generator_name not in active_agents:
+            raise AgentConfigError(f"Generator agent {generator_name} not found")
+
+        if evaluator_name not in active_agents:
+            raise AgentConfigError(f"Evaluator agent {evaluator_name} not found")
+
+        generator_agent = active_agents[generator_name]
+        evaluator_agent = active_agents[evaluator_name]
+
+        # Get min_rating and max_refinements from agent_data
+        min_rating_str = agent_data.get("min_rating", "GOOD")
+        min_rating = QualityRating(min_rating_str)
+        max_refinements = agent_data.get("max_refinements", 3)
+
+        # Create the evaluator-optimizer agent
+        evaluator_optimizer = EvaluatorOptimizerAgent(
+            config=config,
+            context=app_instance.context,
+            generator_agent=generator_agent,
+            evaluator_agent=evaluator_agent,
+            min_rating=min_rating,
+            max_refinements=max_refinements,
+        )
+
+        # Initialize the agent
+        await evaluator_optimizer.initialize()
+        result_agents[name] = evaluator_optimizer
+
+    else:
+        raise ValueError(f"Unknown agent type: {agent_type}")
 
     return result_agents
 
@@ -319,6 +375,7 @@ async def create_agents_in_dependency_order(
     agents_dict: AgentConfigDict,
     model_factory_func: ModelFactoryFn,
     allow_cycles: bool = False,
+    max_concurrency: Optional[int] = None,
 ) -> AgentDict:
     """
     Create agent instances in dependency order without proxies.
@@ -328,6 +385,8 @@ async def create_agents_in_dependency_order(
         agents_dict: Dictionary of agent configurations
         model_factory_func: Function for creating model factories
         allow_cycles: Whether to allow cyclic dependencies
+        max_concurrency: Maximum number of agents initializing at once
+            (defaults to the agent_init_concurrency setting)
 
     Returns:
         Dictionary of initialized agent instances
@@ -335,6 +394,9 @@ async def create_agents_in_dependency_order(
     # Get the dependencies between agents
     dependencies = get_dependencies_groups(agents_dict, allow_cycles)
 
+    if max_concurrency is None and app_instance.context.config:
+        max_concurrency = app_instance.context.config.agent_init_concurrency
+
     # Create a dictionary to store all active agents/workflows
     active_agents: AgentDict = {}
 
@@ -353,6 +415,7 @@ async def create_agents_in_dependency_order(
                 AgentType.BASIC,
                 active_agents,
                 model_factory_func,
+                max_concurrency=max_concurrency,
             )
             active_agents.update(basic_agents)
 
@@ -368,6 +431,7 @@ async def create_agents_in_dependency_order(
                 AgentType.PARALLEL,
                 active_agents,
                 model_factory_func,
+                max_concurrency=max_concurrency,
             )
             active_agents.update(parallel_agents)
 
@@ -383,6 +447,7 @@ async def create_agents_in_dependency_order(
                 AgentType.ROUTER,
                 active_agents,
                 model_factory_func,
+                max_concurrency=max_concurrency,
             )
             active_agents.update(router_agents)
 
@@ -398,6 +463,7 @@ async def create_agents_in_dependency_order(
                 AgentType.CHAIN,
                 active_agents,
                 model_factory_func,
+                max_concurrency=max_concurrency,
             )
             active_agents.update(chain_agents)
 
@@ -413,6 +479,7 @@ async def create_agents_in_dependency_order(
                 AgentType.EVALUATOR_OPTIMIZER,
                 active_agents,
                 model_factory_func,
+                max_concurrency=max_concurrency,
             )
             active_agents.update(evaluator_agents)
 
@@ -428,6 +495,7 @@ async def create_agents_in_dependency_order(
                 AgentType.ORCHESTRATOR,
                 active_agents,
                 model_factory_func,
+                max_concurrency=max_concurrency,
             )
             active_agents.update(orchestrator_agents)
 
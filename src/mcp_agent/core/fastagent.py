@@ -305,6 +305,11 @@ class FastAgent:
                                     print(f"Listening on {self.args.host}:{self.args.port}")
                                 print("Press Ctrl+C to stop")
 
+                            # stdout carries the protocol over stdio; never render chat/tool panels on it
+                            if self.args.transport == "stdio":
+                                self.app.context.config.logger.show_chat = False
+                                self.app.context.config.logger.show_tools = False
+
                             # Create the MCP server
                             from mcp_agent.mcp_server import AgentMCPServer
 
@@ -43,6 +43,17 @@ class RequestParams(CreateMessageRequestParams):
     """
     Whether to allow simultaneous tool calls
     """
+
+    max_parallel_tool_calls: int = 8
+    """
+    The maximum number of tool calls from a single assistant turn to execute concurrently
+    """
+
+    prompt_caching: bool | None = None
+    """
+    Mark the system prompt, tools and conversation so far as cacheable, for providers that
+    support prompt caching (Anthropic). When None, the provider's configured default is used.
+    """
     response_format: Any | None = None
     """
     Override response format for structured calls. Prefer sending pydantic model - only use in exceptional circumstances
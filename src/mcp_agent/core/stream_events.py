@@ -0,0 +1,47 @@
+"""
+Events yielded by generate_stream() while a response is being produced.
+"""
+
+from typing import Any, Dict, Literal, Union
+
+from mcp.types import CallToolResult
+from pydantic import BaseModel
+
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+
+class TextDelta(BaseModel):
+    """A fragment of assistant text, delivered as soon as the provider produces it"""
+
+    type: Literal["text_delta"] = "text_delta"
+    text: str
+
+
+class ToolCallEvent(BaseModel):
+    """The assistant has requested a tool call, which is about to be executed"""
+
+    type: Literal["tool_call"] = "tool_call"
+    tool_call_id: str
+    name: str
+    arguments: Dict[str, Any] | None = None
+
+
+class ToolResultEvent(BaseModel):
+    """A requested tool call has completed"""
+
+    type: Literal["tool_result"] = "tool_result"
+    tool_call_id: str
+    result: CallToolResult
+
+
+class GenerationComplete(BaseModel):
+    """
+    Final event of a stream. Carries the assembled assistant message, identical to
+    the one generate() would have returned (and which has been added to history).
+    """
+
+    type: Literal["complete"] = "complete"
+    message: PromptMessageMultipart
+
+
+StreamEvent = Union[TextDelta, ToolCallEvent, ToolResultEvent, GenerationComplete]
@@ -1,25 +1,37 @@
 import asyncio
+import concurrent.futures
 import contextvars
 import functools
+import inspect
+import multiprocessing
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
+    Awaitable,
     Callable,
     Coroutine,
+    Deque,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
+    Tuple,
     Type,
     TypeVar,
 )
 
 from pydantic import BaseModel, ConfigDict
 
+from mcp_agent.config import RetrySettings
 from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.executor.retry import is_retryable, retry_delay
 from mcp_agent.executor.workflow_signal import (
     AsyncioSignalHandler,
     Signal,
@@ -27,6 +39,7 @@ from mcp_agent.executor.workflow_signal import (
     SignalValueT,
 )
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.metrics import task_retries, task_retry_outcomes, task_timeouts
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -36,13 +49,27 @@ logger = get_logger(__name__)
 # Type variable for the return type of tasks
 R = TypeVar("R")
 
+# Sized for many agents making blocking provider calls at once, unlike the loop's
+# default executor (min(32, cpu_count + 4) threads)
+DEFAULT_IO_POOL_SIZE = 64
+
+
+def _is_async_callable(task: Callable[..., Any]) -> bool:
+    """
+    Check whether a callable is a coroutine function, looking through decorators
+    (e.g. the argument validation wrappers used by the provider SDKs).
+    """
+    return asyncio.iscoroutinefunction(task) or inspect.iscoroutinefunction(inspect.unwrap(task))
+
 
 class ExecutorConfig(BaseModel):
     """Configuration for executors."""
 
     max_concurrent_activities: int | None = None  # Unbounded by default
     timeout_seconds: timedelta | None = None  # No timeout by default
-    retry_policy: Dict[str, Any] | None = None
+    retry_policy: RetrySettings | None = None  # No retries by default
+    io_pool_size: int = DEFAULT_IO_POOL_SIZE  # Threads for blocking calls
+    process_pool_size: int = 0  # Processes for CPU-heavy work (no process pool by default)
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -98,35 +125,109 @@ class Executor(ABC, ContextDependent):
     async def map(
         self,
         func: Callable[..., R],
-        inputs: List[Any],
+        inputs: Iterable[Any],
+        *,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        fail_fast: bool = False,
         **kwargs: Any,
     ) -> List[R | BaseException]:
         """
-        Run `func(item)` for each item in `inputs` with concurrency limit.
+        Run `func(item)` for each item in `inputs` with a concurrency limit.
+        Results (or exceptions) are returned in input order; see map_streaming for the options.
+        """
+        results: Dict[int, R | BaseException] = {}
+        async for index, result in self.map_streaming(
+            func,
+            inputs,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            fail_fast=fail_fast,
+            **kwargs,
+        ):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
+
+    async def map_streaming(
+        self,
+        func: Callable[..., R],
+        inputs: Iterable[Any],
+        *,
+        ordered: bool = False,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        fail_fast: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[int, R | BaseException]]:
         """
-        results: List[R, BaseException] = []
+        Run `func(item)` for each item in `inputs`, yielding `(index, result)` pairs.
 
-        async def run(item):
-            if self.config.max_concurrent_activities:
-                semaphore = asyncio.Semaphore(self.config.max_concurrent_activities)
-                async with semaphore:
-                    return await self.execute(functools.partial(func, item), **kwargs)
-            else:
-                return await self.execute(functools.partial(func, item), **kwargs)
+        Inputs are consumed lazily, so at most `max_concurrency` items (default:
+        config.max_concurrent_activities, unbounded if neither is set) are running at once.
+        With `ordered`, results are yielded in input order and the limit also counts
+        finished items waiting for an earlier one, bounding memory as well as concurrency.
 
-        coros = [run(x) for x in inputs]
-        # gather all, each returns a single-element list
-        list_of_lists = await asyncio.gather(*coros, return_exceptions=True)
+        Args:
+            timeout: Seconds allowed per item; an item that runs over yields a TimeoutError
+            fail_fast: Cancel the remaining items and raise the first exception instead of
+                yielding it
+        """
+        limit = max_concurrency or self.config.max_concurrent_activities
+        items = enumerate(inputs)
+        running: Set[asyncio.Task] = set()
+        order: Deque[asyncio.Task] = deque()
+        indices: Dict[asyncio.Task, int] = {}
 
-        # Flatten results
-        for entry in list_of_lists:
-            if isinstance(entry, list):
-                results.extend(entry)
-            else:
-                # Means we got an exception at the gather level
-                results.append(entry)
+        async def run(item: Any) -> R | BaseException:
+            try:
+                results = await asyncio.wait_for(
+                    self.execute(functools.partial(func, item), **kwargs), timeout
+                )
+            except asyncio.TimeoutError as e:
+                return e
+            return results[0]
+
+        def fill() -> None:
+            while limit is None or (len(order) if ordered else len(running)) < limit:
+                entry = next(items, None)
+                if entry is None:
+                    return
+                index, item = entry
+                task = asyncio.create_task(run(item))
+                running.add(task)
+                indices[task] = index
+                if ordered:
+                    order.append(task)
+
+        try:
+            fill()
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                running -= done
+
+                if fail_fast:
+                    for task in done:
+                        if isinstance(task.result(), BaseException):
+                            raise task.result()
+
+                if ordered:
+                    ready = []
+                    while order and order[0].done():
+                        ready.append(order.popleft())
+                else:
+                    ready = done
 
-        return results
+                for task in ready:
+                    yield indices.pop(task), task.result()
+                fill()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def shutdown(self) -> None:
+        """Release resources (such as worker pools) held by the executor."""
 
     async def validate_task(self, task: Callable[..., R] | Coroutine[Any, Any, R]) -> None:
         """Validate a task before execution."""
@@ -181,7 +282,15 @@ class Executor(ABC, ContextDependent):
 
 
 class AsyncioExecutor(Executor):
-    """Default executor using asyncio"""
+    """
+    Default executor using asyncio.
+
+    Sync callables run on a dedicated I/O thread pool rather than the event loop's default
+    executor, and CPU-heavy work can be sent to an optional process pool (run_cpu_bound).
+    """
+
+    # Live executors, for the pool usage metrics
+    instances: "weakref.WeakSet[AsyncioExecutor]" = weakref.WeakSet()
 
     def __init__(
         self,
@@ -195,6 +304,66 @@ class AsyncioExecutor(Executor):
         if self.config.max_concurrent_activities is not None:
             self._activity_semaphore = asyncio.Semaphore(self.config.max_concurrent_activities)
 
+        # Pools are created on first use
+        self._pools: Dict[str, concurrent.futures.Executor] = {}
+        self._in_flight: Dict[str, int] = {"io": 0, "process": 0}
+        AsyncioExecutor.instances.add(self)
+
+    def _pool(self, name: str) -> concurrent.futures.Executor:
+        pool = self._pools.get(name)
+        if pool is None:
+            if name == "process":
+                # Forking copies the state of the loop's threads, so start workers cleanly
+                methods = multiprocessing.get_all_start_methods()
+                pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.config.process_pool_size,
+                    mp_context=multiprocessing.get_context(
+                        "forkserver" if "forkserver" in methods else "spawn"
+                    ),
+                )
+            else:
+                pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.config.io_pool_size, thread_name_prefix="fast-agent-io"
+                )
+            self._pools[name] = pool
+        return pool
+
+    async def _run_in_pool(self, name: str, call: Callable[[], R]) -> R:
+        loop = asyncio.get_running_loop()
+        self._in_flight[name] += 1
+        try:
+            return await loop.run_in_executor(self._pool(name), call)
+        finally:
+            self._in_flight[name] -= 1
+
+    async def run_blocking(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Run a blocking call (e.g. a sync SDK or network call) on the executor's I/O thread pool,
+        in a copy of the current context.
+        """
+        ctx = contextvars.copy_context()
+        return await self._run_in_pool("io", functools.partial(ctx.run, func, *args, **kwargs))
+
+    async def run_cpu_bound(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Run CPU-heavy work (e.g. image re-encoding or parsing large documents) on the process
+        pool, so it doesn't hold the GIL for the event loop. The function and its arguments
+        must be picklable. Without a configured process pool this uses the I/O thread pool.
+        """
+        if not self.config.process_pool_size:
+            return await self.run_blocking(func, *args, **kwargs)
+        return await self._run_in_pool("process", functools.partial(func, *args, **kwargs))
+
+    def pool_usage(self) -> Dict[str, Tuple[int, int]]:
+        """Tasks submitted and not yet finished, and the worker count, for each started pool."""
+        sizes = {"io": self.config.io_pool_size, "process": self.config.process_pool_size}
+        return {name: (self._in_flight[name], sizes[name]) for name in self._pools}
+
+    def shutdown(self) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools.clear()
+
     async def _execute_task(
         self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
     ) -> R | BaseException:
@@ -202,18 +371,11 @@ class AsyncioExecutor(Executor):
             try:
                 if asyncio.iscoroutine(task):
                     return await task
-                elif asyncio.iscoroutinefunction(task):
+                elif _is_async_callable(task):
                     return await task(**kwargs)
                 else:
-                    # Execute the callable and await if it returns a coroutine
-                    loop = asyncio.get_running_loop()
-                    ctx = contextvars.copy_context()
-                    # If kwargs are provided, wrap the function with partial
-                    if kwargs:
-                        wrapped_task = functools.partial(task, **kwargs)
-                        result = await loop.run_in_executor(None, lambda: ctx.run(wrapped_task))
-                    else:
-                        result = await loop.run_in_executor(None, lambda: ctx.run(task))
+                    # Execute the callable on the I/O pool and await if it returns a coroutine
+                    result = await self.run_blocking(task, **kwargs)
 
                     # Handle case where the sync function returns a coroutine
                     if asyncio.iscoroutine(result):
@@ -226,10 +388,69 @@ class AsyncioExecutor(Executor):
 
         if self._activity_semaphore:
             async with self._activity_semaphore:
-                return await run_task(task)
+                return await self._run_with_policy(run_task, task)
         else:
+            return await self._run_with_policy(run_task, task)
+
+    async def _run_with_policy(
+        self,
+        run_task: Callable[[Callable[..., R] | Coroutine[Any, Any, R]], Awaitable[R]],
+        task: Callable[..., R] | Coroutine[Any, Any, R],
+    ) -> R | BaseException:
+        """
+        Run a task within the configured deadline, retrying transient errors.
+        Coroutine objects can only be awaited once, so only callables are retried.
+        """
+        timeout = self.config.timeout_seconds
+        policy = self.config.retry_policy
+        if timeout is None and policy is None:
             return await run_task(task)
 
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout.total_seconds() if timeout is not None else None
+        name = getattr(task, "__qualname__", None) or repr(task)
+        attempt = 1
+        while True:
+            remaining = deadline - loop.time() if deadline is not None else None
+            try:
+                result = await asyncio.wait_for(run_task(task), remaining)
+            except asyncio.TimeoutError:
+                task_timeouts.add(1)
+                message = f"Task {name} timed out after {timeout.total_seconds()}s"
+                logger.error(message)
+                return asyncio.TimeoutError(message)
+
+            if (
+                policy is None
+                or not isinstance(result, Exception)
+                or asyncio.iscoroutine(task)
+                or not is_retryable(result)
+            ):
+                if attempt > 1:
+                    outcome = "failed" if isinstance(result, BaseException) else "succeeded"
+                    task_retry_outcomes.add(1, {"outcome": outcome})
+                    logger.info(f"Task {name} {outcome} after {attempt} attempts")
+                return result
+
+            delay = retry_delay(policy, attempt, result)
+            if attempt >= policy.max_attempts or (
+                deadline is not None and loop.time() + delay >= deadline
+            ):
+                task_retry_outcomes.add(1, {"outcome": "exhausted"})
+                logger.error(
+                    f"Task {name} failed after {attempt} attempts: {result}",
+                    data={"attempts": attempt, "error": type(result).__name__},
+                )
+                return result
+
+            task_retries.add(1, {"error": type(result).__name__})
+            logger.warning(
+                f"Task {name} failed with a transient error, retrying in {delay:.2f}s: {result}",
+                data={"attempt": attempt, "delay": delay, "error": type(result).__name__},
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
     async def execute(
         self,
         *tasks: Callable[..., R] | Coroutine[Any, Any, R],
@@ -0,0 +1,88 @@
+"""
+Retry support for the executor: deciding which errors are transient and how long to wait.
+
+Providers register a classifier for the exceptions raised by their SDK, keyed by the
+SDK's top-level package (e.g. "anthropic"). Errors from packages without a classifier
+are never retried.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict
+
+from mcp_agent.config import RetrySettings
+
+RetryClassifier = Callable[[BaseException], bool]
+
+# Request timeout, lock conflict, rate limit, server errors and Anthropic's "overloaded"
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+# Set on errors that must not be retried whatever their type
+_NON_RETRYABLE = "_fast_agent_non_retryable"
+
+_classifiers: Dict[str, RetryClassifier] = {}
+
+
+def register_retry_classifier(package: str, classifier: RetryClassifier) -> None:
+    """Register the classifier for exceptions raised from the given top-level package."""
+    _classifiers[package] = classifier
+
+
+def mark_non_retryable(error: BaseException) -> None:
+    """
+    Stop the executor retrying this error, e.g. because part of a streamed response
+    was already delivered and a retry would send it again.
+    """
+    setattr(error, _NON_RETRYABLE, True)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether the error is transient, according to the classifier for its package."""
+    if getattr(error, _NON_RETRYABLE, False):
+        return False
+    classifier = _classifiers.get(type(error).__module__.partition(".")[0])
+    return classifier is not None and classifier(error)
+
+
+def _headers(error: BaseException):
+    return getattr(getattr(error, "response", None), "headers", None) or {}
+
+
+def retryable_status(error: BaseException) -> bool:
+    """
+    Classify an HTTP status error, honouring the x-should-retry header that
+    the Anthropic and OpenAI APIs send.
+    """
+    should_retry = _headers(error).get("x-should-retry")
+    if should_retry in ("true", "false"):
+        return should_retry == "true"
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Seconds the server asked us to wait (Retry-After or retry-after-ms), if any."""
+    headers = _headers(error)
+    try:
+        if milliseconds := headers.get("retry-after-ms"):
+            return max(float(milliseconds) / 1000, 0.0)
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(policy: RetrySettings, attempt: int, error: BaseException) -> float:
+    """Seconds to wait before retrying after the given (1-based) failed attempt."""
+    if policy.respect_retry_after:
+        requested = retry_after(error)
+        if requested is not None:
+            return requested
+
+    delay = min(policy.initial_delay * policy.backoff_multiplier ** (attempt - 1), policy.max_delay)
+    return random.uniform(0, delay) if policy.jitter else delay
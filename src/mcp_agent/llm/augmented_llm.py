@@ -1,7 +1,11 @@
+import asyncio
 from abc import abstractmethod
+from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Callable,
     Dict,
     Generic,
     List,
@@ -18,9 +22,8 @@ from mcp.types import (
     GetPromptResult,
     PromptMessage,
     TextContent,
+    Tool,
 )
-from openai import NotGiven
-from openai.lib._parsing import type_to_response_format_param as _type_to_response_format
 from pydantic_core import from_json
 from rich.text import Text
 
@@ -28,6 +31,13 @@ from mcp_agent.context_dependent import ContextDependent
 from mcp_agent.core.exceptions import PromptExitError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.core.stream_events import (
+    GenerationComplete,
+    StreamEvent,
+    TextDelta,
+    ToolCallEvent,
+    ToolResultEvent,
+)
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.llm.memory import Memory, SimpleMemory
 from mcp_agent.llm.provider_types import Provider
@@ -49,6 +59,7 @@ from mcp_agent.ui.console_display import ConsoleDisplay
 # Define type variables locally
 MessageParamT = TypeVar("MessageParamT")
 MessageT = TypeVar("MessageT")
+ProviderToolsT = TypeVar("ProviderToolsT")
 
 # Forward reference for type annotations
 if TYPE_CHECKING:
@@ -59,6 +70,12 @@ if TYPE_CHECKING:
 # TODO -- move this to a constant
 HUMAN_INPUT_TOOL_NAME = "__human_input__"
 
+# Set for the duration of a generate_stream() call to the LLM doing the streaming and the
+# queue its events are delivered to. Copied into the generation task's context.
+_active_stream: ContextVar[Tuple["AugmentedLLM", "asyncio.Queue[StreamEvent]"] | None] = ContextVar(
+    "fast_agent_active_stream", default=None
+)
+
 
 def deep_merge(dict1: Dict[Any, Any], dict2: Dict[Any, Any]) -> Dict[Any, Any]:
     """
@@ -91,6 +108,8 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
     PARAM_SYSTEM_PROMPT = "systemPrompt"
     PARAM_STOP_SEQUENCES = "stopSequences"
     PARAM_PARALLEL_TOOL_CALLS = "parallel_tool_calls"
+    PARAM_MAX_PARALLEL_TOOL_CALLS = "max_parallel_tool_calls"
+    PARAM_PROMPT_CACHING = "prompt_caching"
     PARAM_METADATA = "metadata"
     PARAM_USE_HISTORY = "use_history"
     PARAM_MAX_ITERATIONS = "max_iterations"
@@ -152,6 +171,9 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
 
         self._message_history: List[PromptMessageMultipart] = []
 
+        # Provider-formatted tools, with the aggregator tool catalog version they were built from
+        self._provider_tools_cache: Tuple[int, Any] | None = None
+
         # Initialize the display component
         self.display = ConsoleDisplay(config=self.context.config)
 
@@ -217,6 +239,62 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         self._message_history.append(assistant_response)
         return assistant_response
 
+    async def generate_stream(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Create a completion with the LLM, yielding events as the response is produced.
+
+        Runs the same path as generate(), so history is updated identically. Providers that
+        support streaming emit TextDeltas as tokens arrive; for others the complete text is
+        delivered as a single TextDelta. The final event is a GenerationComplete.
+        """
+        queue: asyncio.Queue[StreamEvent] = asyncio.Queue()
+        token = _active_stream.set((self, queue))
+        try:
+            task = asyncio.create_task(self.generate(multipart_messages, request_params))
+        finally:
+            _active_stream.reset(token)
+
+        streamed_text = False
+        try:
+            while not task.done() or not queue.empty():
+                if queue.empty():
+                    getter = asyncio.ensure_future(queue.get())
+                    await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                    if not getter.done():
+                        getter.cancel()
+                        continue
+                    event = getter.result()
+                else:
+                    event = queue.get_nowait()
+
+                streamed_text = streamed_text or isinstance(event, TextDelta)
+                yield event
+
+            response = task.result()
+            if not streamed_text and response.last_text():
+                yield TextDelta(text=response.last_text())
+            yield GenerationComplete(message=response)
+        finally:
+            if not task.done():
+                task.cancel()
+
+    def _stream_queue(self) -> "asyncio.Queue[StreamEvent] | None":
+        """Return the event queue if this LLM is currently servicing a generate_stream() call"""
+        active = _active_stream.get()
+        if active is not None and active[0] is self:
+            return active[1]
+        return None
+
+    def _emit_stream_event(self, event: StreamEvent) -> None:
+        """Deliver an event to the active generate_stream() consumer, if there is one"""
+        queue = self._stream_queue()
+        if queue is not None:
+            queue.put_nowait(event)
+
     @abstractmethod
     async def _apply_prompt_provider_specific(
         self,
@@ -268,7 +346,10 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         Returns:
             Provider-agnostic schema representation or NotGiven if conversion fails
         """
-        return _type_to_response_format(model)
+        # The OpenAI SDK is imported on first use rather than with every provider
+        from openai.lib._parsing import type_to_response_format_param
+
+        return type_to_response_format_param(model)
 
     @staticmethod
     def model_to_schema_str(
@@ -304,6 +385,8 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         request_params = self.get_request_params(request_params)
 
         if not request_params.response_format:
+            from openai import NotGiven
+
             schema = self.model_to_response_format(model)
             if schema is not NotGiven:
                 request_params.response_format = schema
@@ -330,7 +413,7 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
     def _precall(self, multipart_messages: List[PromptMessageMultipart]) -> None:
         """Pre-call hook to modify the message before sending it to the provider."""
         self._message_history.extend(multipart_messages)
-        if multipart_messages[-1].role == "user":
+        if multipart_messages[-1].role == "user" and self.display.chat_enabled:
             self.show_user_message(
                 render_multipart_message(multipart_messages[-1]),
                 model=self.default_request_params.model,
@@ -419,7 +502,7 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         """Display a tool result in a formatted panel."""
         self.display.show_tool_result(result)
 
-    def show_oai_tool_result(self, result: str) -> None:
+    def show_oai_tool_result(self, result: Any) -> None:
         """Display a tool result in a formatted panel."""
         self.display.show_oai_tool_result(result)
 
@@ -512,6 +595,91 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
                 ],
             )
 
+    async def _provider_tools(
+        self, build: Callable[[List[Tool]], ProviderToolsT]
+    ) -> ProviderToolsT:
+        """
+        Return the aggregator's tools converted to the provider's format by `build`.
+        The result is reused until the aggregator's tool catalog changes, so callers
+        must not modify it.
+        """
+        cache = self._provider_tools_cache
+        version = getattr(self.aggregator, "tool_catalog_version", None)
+        if cache is not None and version is not None and cache[0] == version:
+            return cache[1]
+
+        tools = (await self.aggregator.list_tools()).tools
+        provider_tools = build(tools)
+
+        # Read the version after listing, as list_tools() may load the servers
+        version = getattr(self.aggregator, "tool_catalog_version", None)
+        self._provider_tools_cache = (version, provider_tools) if version is not None else None
+        return provider_tools
+
+    async def call_tools(
+        self,
+        tool_calls: List[Tuple[str, CallToolRequest]],
+        request_params: RequestParams,
+    ) -> List[Tuple[str, CallToolResult]]:
+        """
+        Execute the tool calls requested in a single assistant turn.
+
+        When parallel_tool_calls is enabled the calls are dispatched concurrently,
+        at most max_parallel_tool_calls at a time. Human input calls always run on their
+        own, so the user isn't prompted while other tools are in flight. If a call raises
+        (e.g. PromptExitError), the calls still running are cancelled. Results are returned
+        in request order.
+
+        Args:
+            tool_calls: List of (tool_call_id, request) tuples
+            request_params: Request parameters controlling parallel execution
+
+        Returns:
+            List of (tool_call_id, result) tuples in the same order as tool_calls
+        """
+        if request_params.parallel_tool_calls:
+            limit = max(1, request_params.max_parallel_tool_calls)
+        else:
+            limit = 1
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(tool_call_id: str, request: CallToolRequest) -> Tuple[str, CallToolResult]:
+            async with semaphore:
+                result = await self.call_tool(request, tool_call_id)
+            self._emit_stream_event(ToolResultEvent(tool_call_id=tool_call_id, result=result))
+            return tool_call_id, result
+
+        for tool_call_id, request in tool_calls:
+            self._emit_stream_event(
+                ToolCallEvent(
+                    tool_call_id=tool_call_id,
+                    name=request.params.name,
+                    arguments=request.params.arguments,
+                )
+            )
+
+        # Consecutive calls run together, but each human input call runs on its own
+        batches: List[List[Tuple[str, CallToolRequest]]] = []
+        previous_human_input = True
+        for tool_call_id, request in tool_calls:
+            human_input = request.params.name == HUMAN_INPUT_TOOL_NAME
+            if human_input or previous_human_input:
+                batches.append([])
+            batches[-1].append((tool_call_id, request))
+            previous_human_input = human_input
+
+        results: List[Tuple[str, CallToolResult]] = []
+        for batch in batches:
+            tasks = [asyncio.create_task(run(id, request)) for id, request in batch]
+            try:
+                results.extend(await asyncio.gather(*tasks))
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        return results
+
     def _log_chat_progress(
         self, chat_turn: Optional[int] = None, model: Optional[str] = None
     ) -> None:
@@ -637,6 +805,9 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         """
         return self._message_history
 
+    async def shutdown(self) -> None:
+        """Release resources held for the LLM. Providers with an SDK client close it here."""
+
     def _api_key(self):
         from mcp_agent.llm.provider_key_manager import ProviderKeyManager
 
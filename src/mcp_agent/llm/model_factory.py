@@ -1,36 +1,23 @@
+import importlib
 from enum import Enum
-from typing import Callable, Dict, Optional, Type, Union
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Type, Union
 
 from pydantic import BaseModel
 
-from mcp_agent.agents.agent import Agent
 from mcp_agent.core.exceptions import ModelConfigError
 from mcp_agent.core.request_params import RequestParams
-from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
-from mcp_agent.llm.augmented_llm_playback import PlaybackLLM
 from mcp_agent.llm.provider_types import Provider
-from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_deepseek import DeepSeekAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_generic import GenericAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_google import GoogleAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_openrouter import OpenRouterAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_tensorzero import TensorZeroAugmentedLLM
 from mcp_agent.mcp.interfaces import AugmentedLLMProtocol
 
-# from mcp_agent.workflows.llm.augmented_llm_deepseek import DeekSeekAugmentedLLM
-
+if TYPE_CHECKING:
+    from mcp_agent.agents.agent import Agent
 
 # Type alias for LLM classes
-LLMClass = Union[
-    Type[AnthropicAugmentedLLM],
-    Type[OpenAIAugmentedLLM],
-    Type[PassthroughLLM],
-    Type[PlaybackLLM],
-    Type[DeepSeekAugmentedLLM],
-    Type[OpenRouterAugmentedLLM],
-    Type[TensorZeroAugmentedLLM],
-]
+LLMClass = Type[AugmentedLLMProtocol]
+
+# LLM classes are registered as "module:ClassName" paths, so a provider's module (and its SDK)
+# is only imported when a model from that provider is used
+LLMClassRef = Union[str, LLMClass]
 
 
 class ReasoningEffort(Enum):
@@ -103,24 +90,36 @@ class ModelFactory:
         "deepseek": "deepseek-chat",
     }
 
-    # Mapping of providers to their LLM classes
-    PROVIDER_CLASSES: Dict[Provider, LLMClass] = {
-        Provider.ANTHROPIC: AnthropicAugmentedLLM,
-        Provider.OPENAI: OpenAIAugmentedLLM,
-        Provider.FAST_AGENT: PassthroughLLM,
-        Provider.DEEPSEEK: DeepSeekAugmentedLLM,
-        Provider.GENERIC: GenericAugmentedLLM,
-        Provider.GOOGLE: GoogleAugmentedLLM,  # type: ignore
-        Provider.OPENROUTER: OpenRouterAugmentedLLM,
-        Provider.TENSORZERO: TensorZeroAugmentedLLM,
+    # Mapping of providers to their LLM classes (or "module:ClassName" paths)
+    PROVIDER_CLASSES: Dict[Provider, LLMClassRef] = {
+        Provider.ANTHROPIC: "mcp_agent.llm.providers.augmented_llm_anthropic:AnthropicAugmentedLLM",
+        Provider.OPENAI: "mcp_agent.llm.providers.augmented_llm_openai:OpenAIAugmentedLLM",
+        Provider.FAST_AGENT: "mcp_agent.llm.augmented_llm_passthrough:PassthroughLLM",
+        Provider.DEEPSEEK: "mcp_agent.llm.providers.augmented_llm_deepseek:DeepSeekAugmentedLLM",
+        Provider.GENERIC: "mcp_agent.llm.providers.augmented_llm_generic:GenericAugmentedLLM",
+        Provider.GOOGLE: "mcp_agent.llm.providers.augmented_llm_google:GoogleAugmentedLLM",
+        Provider.OPENROUTER: (
+            "mcp_agent.llm.providers.augmented_llm_openrouter:OpenRouterAugmentedLLM"
+        ),
+        Provider.TENSORZERO: (
+            "mcp_agent.llm.providers.augmented_llm_tensorzero:TensorZeroAugmentedLLM"
+        ),
     }
 
     # Mapping of special model names to their specific LLM classes
     # This overrides the provider-based class selection
-    MODEL_SPECIFIC_CLASSES: Dict[str, LLMClass] = {
-        "playback": PlaybackLLM,
+    MODEL_SPECIFIC_CLASSES: Dict[str, LLMClassRef] = {
+        "playback": "mcp_agent.llm.augmented_llm_playback:PlaybackLLM",
     }
 
+    @staticmethod
+    def load_llm_class(class_ref: LLMClassRef) -> LLMClass:
+        """Resolve a registered LLM class, importing its module if given as a path"""
+        if not isinstance(class_ref, str):
+            return class_ref
+        module_name, _, class_name = class_ref.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
     @classmethod
     def parse_model_string(cls, model_string: str) -> ModelConfig:
         """Parse a model string into a ModelConfig object"""
@@ -180,13 +179,13 @@ class ModelFactory:
         # Parse configuration up front
         config = cls.parse_model_string(model_string)
         if config.model_name in cls.MODEL_SPECIFIC_CLASSES:
-            llm_class = cls.MODEL_SPECIFIC_CLASSES[config.model_name]
+            llm_class = cls.load_llm_class(cls.MODEL_SPECIFIC_CLASSES[config.model_name])
         else:
-            llm_class = cls.PROVIDER_CLASSES[config.provider]
+            llm_class = cls.load_llm_class(cls.PROVIDER_CLASSES[config.provider])
 
         # Create a factory function matching the updated attach_llm protocol
         def factory(
-            agent: Agent, request_params: Optional[RequestParams] = None, **kwargs
+            agent: "Agent", request_params: Optional[RequestParams] = None, **kwargs
         ) -> AugmentedLLMProtocol:
             # Create base params with parsed model name
             base_params = RequestParams()
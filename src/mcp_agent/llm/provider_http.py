@@ -0,0 +1,60 @@
+"""
+HTTP client construction for LLM provider SDKs.
+
+Providers hold a single async SDK client for their lifetime; this module builds the
+underlying httpx client so that connections (and TLS sessions) are pooled and reused
+between requests.
+"""
+
+from typing import TYPE_CHECKING
+
+import httpx
+
+from mcp_agent.config import ProviderHTTPSettings
+
+if TYPE_CHECKING:
+    from mcp_agent.config import Settings
+    from mcp_agent.executor.executor import Executor
+
+
+def provider_http_settings(config: "Settings | None") -> ProviderHTTPSettings:
+    """Return the configured provider HTTP settings, or defaults if not configured"""
+    if config is not None and config.provider_http is not None:
+        return config.provider_http
+    return ProviderHTTPSettings()
+
+
+def create_http_client(config: "Settings | None") -> httpx.AsyncClient:
+    """
+    Create a pooled async httpx client for a provider SDK.
+
+    Args:
+        config: Application settings, used to size the connection pool
+
+    Returns:
+        An httpx.AsyncClient suitable for passing as `http_client` to AsyncAnthropic/AsyncOpenAI
+    """
+    settings = provider_http_settings(config)
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(timeout=settings.timeout, connect=settings.connect_timeout),
+        follow_redirects=True,
+    )
+
+
+def sdk_max_retries(executor: "Executor | None", default: int) -> int:
+    """
+    Retries the provider SDK should make itself. An executor with a retry policy already
+    retries transient errors, and SDK retries on top would multiply the attempts.
+
+    Args:
+        executor: The executor that runs the provider calls
+        default: The SDK's own default, used when the executor doesn't retry
+    """
+    if executor is not None and executor.config.retry_policy is not None:
+        return 0
+    return default
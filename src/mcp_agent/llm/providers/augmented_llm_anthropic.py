@@ -1,23 +1,14 @@
-from typing import TYPE_CHECKING, List, Tuple, Type
-
-from mcp.types import EmbeddedResource, ImageContent, TextContent
-
-from mcp_agent.core.prompt import Prompt
-from mcp_agent.llm.provider_types import Provider
-from mcp_agent.llm.providers.multipart_converter_anthropic import (
-    AnthropicConverter,
-)
-from mcp_agent.llm.providers.sampling_converter_anthropic import (
-    AnthropicSamplingConverter,
+import functools
+import time
+from typing import List, Tuple, Type
+
+from anthropic import (
+    DEFAULT_MAX_RETRIES,
+    APIConnectionError,
+    APIStatusError,
+    AsyncAnthropic,
+    AuthenticationError,
 )
-from mcp_agent.mcp.interfaces import ModelT
-from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
-
-if TYPE_CHECKING:
-    from mcp import ListToolsResult
-
-
-from anthropic import Anthropic, AuthenticationError
 from anthropic.types import (
     Message,
     MessageParam,
@@ -30,18 +21,52 @@ from anthropic.types import (
 from mcp.types import (
     CallToolRequest,
     CallToolRequestParams,
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
 )
 from rich.text import Text
 
 from mcp_agent.core.exceptions import ProviderKeyError
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.core.stream_events import TextDelta
+from mcp_agent.executor.retry import (
+    mark_non_retryable,
+    register_retry_classifier,
+    retryable_status,
+)
 from mcp_agent.llm.augmented_llm import (
     AugmentedLLM,
     RequestParams,
 )
+from mcp_agent.llm.provider_http import create_http_client, sdk_max_retries
+from mcp_agent.llm.provider_types import Provider
+from mcp_agent.llm.providers.multipart_converter_anthropic import (
+    AnthropicConverter,
+)
+from mcp_agent.llm.providers.sampling_converter_anthropic import (
+    AnthropicSamplingConverter,
+)
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.mcp.interfaces import ModelT
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import record_llm_request
 
 DEFAULT_ANTHROPIC_MODEL = "claude-3-7-sonnet-latest"
 
+# Marks the end of a prompt prefix that Anthropic should cache
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Connection failures, rate limits and server errors from the Anthropic SDK can be retried"""
+    if isinstance(error, APIConnectionError):
+        return True
+    return isinstance(error, APIStatusError) and retryable_status(error)
+
+
+register_retry_classifier("anthropic", _is_transient_error)
+
 
 class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
     """
@@ -62,6 +87,8 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         AugmentedLLM.PARAM_USE_HISTORY,
         AugmentedLLM.PARAM_MAX_ITERATIONS,
         AugmentedLLM.PARAM_PARALLEL_TOOL_CALLS,
+        AugmentedLLM.PARAM_MAX_PARALLEL_TOOL_CALLS,
+        AugmentedLLM.PARAM_PROMPT_CACHING,
         AugmentedLLM.PARAM_TEMPLATE_VARS,
     }
 
@@ -73,6 +100,9 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             *args, provider=Provider.ANTHROPIC, type_converter=AnthropicSamplingConverter, **kwargs
         )
 
+        # Created on first use and reused for the lifetime of this LLM
+        self._client: AsyncAnthropic | None = None
+
     def _initialize_default_params(self, kwargs: dict) -> RequestParams:
         """Initialize Anthropic-specific default parameters"""
         return RequestParams(
@@ -88,6 +118,27 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         assert self.context.config
         return self.context.config.anthropic.base_url if self.context.config.anthropic else None
 
+    def _anthropic_client(self) -> AsyncAnthropic:
+        """Return the async Anthropic client, creating it with a pooled HTTP client on first use"""
+        if self._client is None:
+            base_url = self._base_url()
+            if base_url and base_url.endswith("/v1"):
+                base_url = base_url.rstrip("/v1")
+
+            self._client = AsyncAnthropic(
+                api_key=self._api_key(),
+                base_url=base_url,
+                http_client=create_http_client(self.context.config),
+                max_retries=sdk_max_retries(self.executor, DEFAULT_MAX_RETRIES),
+            )
+        return self._client
+
+    async def shutdown(self) -> None:
+        """Close the Anthropic client and its pooled connections"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
     async def _anthropic_completion(
         self,
         message_param,
@@ -98,13 +149,8 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         Override this method to use a different LLM.
         """
 
-        api_key = self._api_key()
-        base_url = self._base_url()
-        if base_url and base_url.endswith("/v1"):
-            base_url = base_url.rstrip("/v1")
-
         try:
-            anthropic = Anthropic(api_key=api_key, base_url=base_url)
+            anthropic = self._anthropic_client()
             messages: List[MessageParam] = []
             params = self.get_request_params(request_params)
         except AuthenticationError as e:
@@ -119,27 +165,34 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
         messages.append(message_param)
 
-        tool_list: ListToolsResult = await self.aggregator.list_tools()
-        available_tools: List[ToolParam] = [
-            ToolParam(
-                name=tool.name,
-                description=tool.description or "",
-                input_schema=tool.inputSchema,
-            )
-            for tool in tool_list.tools
-        ]
+        available_tools: List[ToolParam] = await self._provider_tools(
+            lambda tools: [
+                ToolParam(
+                    name=tool.name,
+                    description=tool.description or "",
+                    input_schema=tool.inputSchema,
+                )
+                for tool in tools
+            ]
+        )
 
         responses: List[TextContent | ImageContent | EmbeddedResource] = []
 
         model = self.default_request_params.model
 
+        system_prompt = self.instruction or params.systemPrompt
+        prompt_caching = self._prompt_caching(params)
+        if prompt_caching:
+            system_prompt = self._cacheable_system(system_prompt)
+            available_tools = self._cacheable_tools(available_tools)
+
         for i in range(params.max_iterations):
             self._log_chat_progress(self.chat_turn(), model=model)
             # Create base arguments dictionary
             base_args = {
                 "model": model,
-                "messages": messages,
-                "system": self.instruction or params.systemPrompt,
+                "messages": self._cacheable_messages(messages) if prompt_caching else messages,
+                "system": system_prompt,
                 "stop_sequences": params.stopSequences,
                 "tools": available_tools,
             }
@@ -152,11 +205,28 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 base_args, params, self.ANTHROPIC_EXCLUDE_FIELDS
             )
 
-            self.logger.debug(f"{arguments}")
+            self.logger.debug(lambda: f"{arguments}")
 
-            executor_result = await self.executor.execute(anthropic.messages.create, **arguments)
+            start = time.perf_counter()
+            if self._stream_queue() is not None:
+                executor_result = await self.executor.execute(
+                    functools.partial(self._anthropic_stream, anthropic), **arguments
+                )
+            else:
+                executor_result = await self.executor.execute(
+                    anthropic.messages.create, **arguments
+                )
 
             response = executor_result[0]
+            usage = None if isinstance(response, BaseException) else response.usage
+            record_llm_request(
+                self.provider.value,
+                model,
+                time.perf_counter() - start,
+                input_tokens=usage.input_tokens if usage else None,
+                output_tokens=usage.output_tokens if usage else None,
+                error=isinstance(response, BaseException),
+            )
 
             if isinstance(response, AuthenticationError):
                 raise ProviderKeyError(
@@ -191,6 +261,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 f"{model} response:",
                 data=response,
             )
+            self._log_cache_usage(response.usage, model)
 
             response_as_message = self.convert_message_to_message_param(response)
             messages.append(response_as_message)
@@ -252,8 +323,8 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                             style="dim green italic",
                         )
 
-                    # Process all tool calls and collect results
-                    tool_results = []
+                    # Display and prepare all tool calls
+                    tool_calls = []
                     for i, content in enumerate(tool_uses):
                         tool_name = content.name
                         tool_args = content.input
@@ -267,14 +338,13 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                             method="tools/call",
                             params=CallToolRequestParams(name=tool_name, arguments=tool_args),
                         )
-                        # TODO -- support MCP isError etc.
-                        result = await self.call_tool(
-                            request=tool_call_request, tool_call_id=tool_use_id
-                        )
-                        self.show_tool_result(result)
+                        tool_calls.append((tool_use_id, tool_call_request))
 
-                        # Add each result to our collection
-                        tool_results.append((tool_use_id, result))
+                    # Execute the tool calls (concurrently if permitted), results in tool_use order
+                    # TODO -- support MCP isError etc.
+                    tool_results = await self.call_tools(tool_calls, params)
+                    for _, result in tool_results:
+                        self.show_tool_result(result)
                         responses.extend(result.content)
 
                     messages.append(AnthropicConverter.create_tool_results_message(tool_results))
@@ -295,6 +365,79 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
         return responses
 
+    def _prompt_caching(self, params: RequestParams) -> bool:
+        """Whether to add prompt cache breakpoints, from the request or the Anthropic settings"""
+        if params.prompt_caching is not None:
+            return params.prompt_caching
+        anthropic_settings = self.context.config.anthropic if self.context.config else None
+        return bool(anthropic_settings and anthropic_settings.prompt_caching)
+
+    @staticmethod
+    def _cacheable_system(system_prompt: str | None) -> List[TextBlockParam] | str | None:
+        """Convert the system prompt to a text block marked as a cache breakpoint"""
+        if not system_prompt:
+            return system_prompt
+        return [TextBlockParam(type="text", text=system_prompt, cache_control=CACHE_CONTROL)]
+
+    @staticmethod
+    def _cacheable_tools(tools: List[ToolParam]) -> List[ToolParam]:
+        """Copy the tool list, marking the final tool (and so all tools) as a cache breakpoint"""
+        if not tools:
+            return tools
+        return [*tools[:-1], {**tools[-1], "cache_control": CACHE_CONTROL}]
+
+    @staticmethod
+    def _cacheable_messages(messages: List[MessageParam]) -> List[MessageParam]:
+        """
+        Return the messages with the last content block of the final message marked as a cache
+        breakpoint, so the whole conversation so far can be read from the cache by the next
+        request. The messages themselves (which are kept in history) are not modified.
+        """
+        if not messages:
+            return messages
+
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            content = [TextBlockParam(type="text", text=content)]
+        if not content or not isinstance(content[-1], dict):
+            return messages
+
+        marked_block = {**content[-1], "cache_control": CACHE_CONTROL}
+        return [*messages[:-1], {**last, "content": [*content[:-1], marked_block]}]
+
+    def _log_cache_usage(self, usage: Usage | None, model: str) -> None:
+        """Log prompt cache reads and writes reported by the API"""
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        if not cache_read and not cache_write:
+            return
+        self.logger.info(
+            f"{model} prompt cache: {cache_read} tokens read, {cache_write} tokens written",
+            data={
+                "model": model,
+                "cache_read_input_tokens": cache_read,
+                "cache_creation_input_tokens": cache_write,
+                "input_tokens": usage.input_tokens,
+            },
+        )
+
+    async def _anthropic_stream(self, anthropic: AsyncAnthropic, **arguments) -> Message:
+        """Stream a completion, forwarding text deltas to the generate_stream() consumer"""
+        streamed = False
+        try:
+            async with anthropic.messages.stream(**arguments) as stream:
+                async for event in stream:
+                    if event.type == "text":
+                        self._emit_stream_event(TextDelta(text=event.text))
+                        streamed = True
+                return await stream.get_final_message()
+        except Exception as e:
+            # A retry would replay the deltas the consumer already has
+            if streamed:
+                mark_non_retryable(e)
+            raise
+
     async def generate_messages(
         self,
         message_param,
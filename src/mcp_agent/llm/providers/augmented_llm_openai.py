@@ -1,3 +1,5 @@
+import functools
+import time
 from typing import Dict, List
 
 from mcp.types import (
@@ -8,24 +10,41 @@ from mcp.types import (
     ImageContent,
     TextContent,
 )
-from openai import AuthenticationError, OpenAI
+from openai import (
+    DEFAULT_MAX_RETRIES,
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    AuthenticationError,
+)
 
 # from openai.types.beta.chat import
 from openai.types.chat import (
+    ChatCompletion,
     ChatCompletionMessage,
     ChatCompletionMessageParam,
+    ChatCompletionMessageToolCall,
     ChatCompletionSystemMessageParam,
     ChatCompletionToolParam,
 )
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_message_tool_call import Function
 from pydantic_core import from_json
 from rich.text import Text
 
 from mcp_agent.core.exceptions import ProviderKeyError
 from mcp_agent.core.prompt import Prompt
+from mcp_agent.core.stream_events import TextDelta
+from mcp_agent.executor.retry import (
+    mark_non_retryable,
+    register_retry_classifier,
+    retryable_status,
+)
 from mcp_agent.llm.augmented_llm import (
     AugmentedLLM,
     RequestParams,
 )
+from mcp_agent.llm.provider_http import create_http_client, sdk_max_retries
 from mcp_agent.llm.provider_types import Provider
 from mcp_agent.llm.providers.multipart_converter_openai import OpenAIConverter, OpenAIMessage
 from mcp_agent.llm.providers.sampling_converter_openai import (
@@ -33,6 +52,7 @@ from mcp_agent.llm.providers.sampling_converter_openai import (
 )
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import record_llm_request
 
 _logger = get_logger(__name__)
 
@@ -40,6 +60,16 @@ DEFAULT_OPENAI_MODEL = "gpt-4.1-mini"
 DEFAULT_REASONING_EFFORT = "medium"
 
 
+def _is_transient_error(error: BaseException) -> bool:
+    """Connection failures, rate limits and server errors from the OpenAI SDK can be retried"""
+    if isinstance(error, APIConnectionError):
+        return True
+    return isinstance(error, APIStatusError) and retryable_status(error)
+
+
+register_retry_classifier("openai", _is_transient_error)
+
+
 class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletionMessage]):
     """
     The basic building block of agentic systems is an LLM enhanced with augmentations
@@ -54,6 +84,8 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         AugmentedLLM.PARAM_MAX_TOKENS,
         AugmentedLLM.PARAM_SYSTEM_PROMPT,
         AugmentedLLM.PARAM_PARALLEL_TOOL_CALLS,
+        AugmentedLLM.PARAM_MAX_PARALLEL_TOOL_CALLS,
+        AugmentedLLM.PARAM_PROMPT_CACHING,
         AugmentedLLM.PARAM_USE_HISTORY,
         AugmentedLLM.PARAM_MAX_ITERATIONS,
         AugmentedLLM.PARAM_TEMPLATE_VARS,
@@ -66,6 +98,9 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
 
         super().__init__(*args, provider=provider, **kwargs)
 
+        # Created on first use and reused for the lifetime of this LLM
+        self._client: AsyncOpenAI | None = None
+
         # Initialize logger with name if available
         self.logger = get_logger(f"{__name__}.{self.name}" if self.name else __name__)
 
@@ -103,9 +138,18 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
     def _base_url(self) -> str:
         return self.context.config.openai.base_url if self.context.config.openai else None
 
-    def _openai_client(self) -> OpenAI:
+    def _openai_client(self) -> AsyncOpenAI:
+        """Return the async OpenAI client, creating it with a pooled HTTP client on first use"""
+        if self._client is not None:
+            return self._client
         try:
-            return OpenAI(api_key=self._api_key(), base_url=self._base_url())
+            self._client = AsyncOpenAI(
+                api_key=self._api_key(),
+                base_url=self._base_url(),
+                http_client=create_http_client(self.context.config),
+                max_retries=sdk_max_retries(self.executor, DEFAULT_MAX_RETRIES),
+            )
+            return self._client
         except AuthenticationError as e:
             raise ProviderKeyError(
                 "Invalid OpenAI API key",
@@ -113,6 +157,12 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
                 "Please check that your API key is valid and not expired.",
             ) from e
 
+    async def shutdown(self) -> None:
+        """Close the OpenAI client and its pooled connections"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
     async def _openai_completion(
         self,
         message: OpenAIMessage,
@@ -137,34 +187,50 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         messages.extend(self.history.get(include_completion_history=request_params.use_history))
         messages.append(message)
 
-        response = await self.aggregator.list_tools()
-        available_tools: List[ChatCompletionToolParam] | None = [
-            ChatCompletionToolParam(
-                type="function",
-                function={
-                    "name": tool.name,
-                    "description": tool.description if tool.description else "",
-                    "parameters": self.adjust_schema(tool.inputSchema),
-                },
-            )
-            for tool in response.tools
-        ]
-
-        if not available_tools:
-            available_tools = None  # deepseek does not allow empty array
+        available_tools: List[ChatCompletionToolParam] | None = await self._provider_tools(
+            lambda tools: (
+                [
+                    ChatCompletionToolParam(
+                        type="function",
+                        function={
+                            "name": tool.name,
+                            "description": tool.description if tool.description else "",
+                            "parameters": self.adjust_schema(tool.inputSchema),
+                        },
+                    )
+                    for tool in tools
+                ]
+                or None
+            )  # deepseek does not allow empty array
+        )
 
         # we do NOT send "stop sequences" as this causes errors with mutlimodal processing
         for i in range(request_params.max_iterations):
             arguments = self._prepare_api_request(messages, available_tools, request_params)
-            self.logger.debug(f"OpenAI completion requested for: {arguments}")
+            self.logger.debug(lambda: f"OpenAI completion requested for: {arguments}")
 
             self._log_chat_progress(self.chat_turn(), model=self.default_request_params.model)
 
-            executor_result = await self.executor.execute(
-                self._openai_client().chat.completions.create, **arguments
-            )
+            start = time.perf_counter()
+            if self._stream_queue() is not None:
+                executor_result = await self.executor.execute(
+                    functools.partial(self._openai_stream, self._openai_client()), **arguments
+                )
+            else:
+                executor_result = await self.executor.execute(
+                    self._openai_client().chat.completions.create, **arguments
+                )
 
             response = executor_result[0]
+            usage = None if isinstance(response, BaseException) else response.usage
+            record_llm_request(
+                self.provider.value,
+                arguments.get("model"),
+                time.perf_counter() - start,
+                input_tokens=usage.prompt_tokens if usage else None,
+                output_tokens=usage.completion_tokens if usage else None,
+                error=isinstance(response, BaseException),
+            )
 
             self.logger.debug(
                 "OpenAI completion response:",
@@ -212,7 +278,7 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
                         message.tool_calls[0].function.name,
                     )
 
-                tool_results = []
+                tool_calls = []
                 for tool_call in message.tool_calls:
                     self.show_tool_call(
                         available_tools,
@@ -229,15 +295,19 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
                             else from_json(tool_call.function.arguments, allow_partial=True),
                         ),
                     )
-                    result = await self.call_tool(tool_call_request, tool_call.id)
-                    self.show_oai_tool_result(str(result))
+                    tool_calls.append((tool_call.id, tool_call_request))
 
-                    tool_results.append((tool_call.id, result))
+                # Execute the tool calls (concurrently if permitted), results in tool_call order
+                tool_results = await self.call_tools(tool_calls, request_params)
+                for _, result in tool_results:
+                    self.show_oai_tool_result(result)
                     responses.extend(result.content)
                 messages.extend(OpenAIConverter.convert_function_results_to_openai(tool_results))
 
                 self.logger.debug(
-                    f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
+                    lambda: (
+                        f"Iteration {i}: Tool call results: {str(tool_results) if tool_results else 'None'}"
+                    )
                 )
             elif choice.finish_reason == "length":
                 # We have reached the max tokens limit
@@ -281,6 +351,75 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
 
         return responses
 
+    async def _openai_stream(self, client: AsyncOpenAI, **arguments) -> ChatCompletion:
+        """
+        Stream a completion, forwarding text deltas to the generate_stream() consumer
+        and assembling the chunks into the ChatCompletion the non-streaming call would return.
+        """
+        # Without include_usage no usage is sent, and token accounting would see zero.
+        # It arrives in a final chunk with no choices.
+        stream = await client.chat.completions.create(
+            stream=True, stream_options={"include_usage": True}, **arguments
+        )
+
+        completion_id, created, model = "", 0, arguments.get("model") or ""
+        content: List[str] = []
+        tool_calls: Dict[int, Dict[str, str]] = {}
+        finish_reason = None
+        usage = None
+
+        try:
+            async for chunk in stream:
+                completion_id, created, model = chunk.id, chunk.created, chunk.model
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if delta.content:
+                    content.append(delta.content)
+                    self._emit_stream_event(TextDelta(text=delta.content))
+                for tool_call in delta.tool_calls or []:
+                    entry = tool_calls.setdefault(
+                        tool_call.index, {"id": "", "name": "", "arguments": ""}
+                    )
+                    if tool_call.id:
+                        entry["id"] = tool_call.id
+                    if tool_call.function:
+                        entry["name"] += tool_call.function.name or ""
+                        entry["arguments"] += tool_call.function.arguments or ""
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+        except Exception as e:
+            # A retry would replay the deltas the consumer already has
+            if content:
+                mark_non_retryable(e)
+            raise
+
+        message = ChatCompletionMessage(
+            role="assistant",
+            content="".join(content) or None,
+            tool_calls=[
+                ChatCompletionMessageToolCall(
+                    id=entry["id"],
+                    type="function",
+                    function=Function(name=entry["name"], arguments=entry["arguments"]),
+                )
+                for _, entry in sorted(tool_calls.items())
+            ]
+            or None,
+        )
+        return ChatCompletion(
+            id=completion_id,
+            created=created,
+            model=model,
+            object="chat.completion",
+            choices=[Choice(index=0, finish_reason=finish_reason or "stop", message=message)],
+            usage=usage,
+        )
+
     async def _apply_prompt_provider_specific(
         self,
         multipart_messages: List["PromptMessageMultipart"],
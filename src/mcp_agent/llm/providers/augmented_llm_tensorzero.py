@@ -1,4 +1,5 @@
 import json
+import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mcp.types import (
@@ -8,6 +9,7 @@ from mcp.types import (
     EmbeddedResource,
     ImageContent,
     TextContent,
+    Tool,
 )
 from tensorzero import AsyncTensorZeroGateway
 from tensorzero.types import (
@@ -24,6 +26,7 @@ from mcp_agent.llm.memory import Memory, SimpleMemory
 from mcp_agent.llm.provider_types import Provider
 from mcp_agent.llm.providers.multipart_converter_tensorzero import TensorZeroConverter
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.metrics import record_llm_request
 
 
 class TensorZeroAugmentedLLM(AugmentedLLM[Dict[str, Any], Any]):
@@ -183,6 +186,7 @@ class TensorZeroAugmentedLLM(AugmentedLLM[Dict[str, Any], Any]):
                 t0_api_input_dict["messages"] = current_api_messages  # type: ignore
 
                 # [4] Call the TensorZero inference API
+                start = time.perf_counter()
                 response_iter_or_completion = await gateway.inference(
                     function_name=self._t0_function_name,
                     input=t0_api_input_dict,
@@ -191,6 +195,14 @@ class TensorZeroAugmentedLLM(AugmentedLLM[Dict[str, Any], Any]):
                     stream=False,
                     episode_id=current_t0_episode_id,
                 )
+                usage = getattr(response_iter_or_completion, "usage", None)
+                record_llm_request(
+                    self.provider.value,
+                    self._t0_function_name,
+                    time.perf_counter() - start,
+                    input_tokens=getattr(usage, "input_tokens", None),
+                    output_tokens=getattr(usage, "output_tokens", None),
+                )
 
                 if not isinstance(
                     response_iter_or_completion, (ChatInferenceResponse, JsonInferenceResponse)
@@ -324,30 +336,32 @@ class TensorZeroAugmentedLLM(AugmentedLLM[Dict[str, Any], Any]):
 
     async def _prepare_t0_tools(self) -> Optional[List[Dict[str, Any]]]:
         """Fetches and formats tools for the additional_tools parameter."""
-        formatted_tools: List[Dict[str, Any]] = []
         try:
-            tools_response = await self.aggregator.list_tools()
-            if tools_response and hasattr(tools_response, "tools") and tools_response.tools:
-                for mcp_tool in tools_response.tools:
-                    if (
-                        not isinstance(mcp_tool.inputSchema, dict)
-                        or mcp_tool.inputSchema.get("type") != "object"
-                    ):
-                        self.logger.warning(
-                            f"Tool '{mcp_tool.name}' has invalid parameters schema. Skipping."
-                        )
-                        continue
-                    t0_tool_dict = {
-                        "name": mcp_tool.name,
-                        "description": mcp_tool.description if mcp_tool.description else "",
-                        "parameters": mcp_tool.inputSchema,
-                    }
-                    formatted_tools.append(t0_tool_dict)
-                return formatted_tools if formatted_tools else None
+            return await self._provider_tools(self._format_t0_tools)
         except Exception as e:
             self.logger.error(f"Failed to fetch or format tools: {e}")
         return None
 
+    def _format_t0_tools(self, tools: List[Tool]) -> Optional[List[Dict[str, Any]]]:
+        """Formats MCP tools as TensorZero additional_tools, skipping invalid schemas."""
+        formatted_tools: List[Dict[str, Any]] = []
+        for mcp_tool in tools:
+            if (
+                not isinstance(mcp_tool.inputSchema, dict)
+                or mcp_tool.inputSchema.get("type") != "object"
+            ):
+                self.logger.warning(
+                    f"Tool '{mcp_tool.name}' has invalid parameters schema. Skipping."
+                )
+                continue
+            t0_tool_dict = {
+                "name": mcp_tool.name,
+                "description": mcp_tool.description if mcp_tool.description else "",
+                "parameters": mcp_tool.inputSchema,
+            }
+            formatted_tools.append(t0_tool_dict)
+        return formatted_tools if formatted_tools else None
+
     async def _adapt_t0_native_completion(
         self,
         completion: Union[ChatInferenceResponse, JsonInferenceResponse],
@@ -402,7 +416,7 @@ class TensorZeroAugmentedLLM(AugmentedLLM[Dict[str, Any], Any]):
                             setattr(result, "_t0_tool_name_temp", tool_name)
                             setattr(result, "_t0_is_error_temp", False)
                             executed_tool_results.append(result)
-                            self.show_oai_tool_result(str(result))
+                            self.show_oai_tool_result(result)
                         except Exception as e:
                             self.logger.error(
                                 f"Error executing tool {tool_name} (id: {tool_use_id}): {e}"
@@ -17,6 +17,14 @@ from pydantic import BaseModel, ConfigDict, Field
 EventType = Literal["debug", "info", "warning", "error", "progress"]
 """Broad categories for events (severity or role)."""
 
+EVENT_LEVELS: Dict[EventType, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+"""Severity of each event type. Types not listed (progress) are treated as debug."""
+
 
 class EventContext(BaseModel):
     """
@@ -89,15 +97,8 @@ class EventFilter(BaseModel):
 
         # 4) Minimum severity
         if self.min_level:
-            level_map: Dict[EventType, int] = {
-                "debug": logging.DEBUG,
-                "info": logging.INFO,
-                "warning": logging.WARNING,
-                "error": logging.ERROR,
-            }
-
-            min_val = level_map.get(self.min_level, logging.DEBUG)
-            event_val = level_map.get(event.type, logging.DEBUG)
+            min_val = EVENT_LEVELS.get(self.min_level, logging.DEBUG)
+            event_val = EVENT_LEVELS.get(event.type, logging.DEBUG)
             if event_val < min_val:
                 return False
 
@@ -1,23 +1,44 @@
 import dataclasses
 import inspect
+import json
 import os
+import re
 import warnings
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set
+from typing import Any, Callable, Dict, Iterable, Set
 from uuid import UUID
 
 import httpx
 
-from mcp_agent.logging import logger
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Encode already-serialized data as compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys, ints beyond 64 bits); fall back
+            pass
+    return json.dumps(obj, separators=(",", ":"))
 
 
 class JSONSerializer:
     """
     A robust JSON serializer that handles various Python objects by attempting
     different serialization strategies recursively.
+
+    The output contains only JSON-compatible values (dict, list, str, int, float, bool, None).
+    Handlers are looked up by exact type and cached, so common payloads avoid the chain of
+    isinstance/hasattr checks.
     """
 
     MAX_DEPTH = 99  # Maximum recursion depth
@@ -36,10 +57,27 @@ class JSONSerializer:
     }
 
     def __init__(self) -> None:
-        # Set of already processed objects to prevent infinite recursion
+        # Ids of the containers currently being serialized, to break reference cycles
         self._processed_objects: Set[int] = set()
         # Check if secrets should be logged in full
         self._log_secrets = os.getenv("LOG_SECRETS", "").upper() == "TRUE"
+        self._parent_obj: Any = None
+        self._handlers: Dict[type, Callable[[Any, int], Any]] = {
+            str: _identity,
+            int: _identity,
+            float: _identity,
+            bool: _identity,
+            type(None): _identity,
+            dict: self._serialize_dict,
+            list: self._serialize_iterable,
+            tuple: self._serialize_iterable,
+            set: self._serialize_iterable,
+            frozenset: self._serialize_iterable,
+            datetime: _isoformat,
+            date: _isoformat,
+            Decimal: _to_str,
+            UUID: _to_str,
+        }
 
     def _redact_sensitive_value(self, value: str) -> str:
         """Redact sensitive values to show only first 10 chars."""
@@ -55,110 +93,210 @@ class JSONSerializer:
         """Main entry point for serialization."""
         # Reset processed objects for new serialization
         self._processed_objects.clear()
+        self._parent_obj = obj
         return self._serialize_object(obj, depth=0)
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a key likely contains sensitive information."""
-        key = str(key).lower()
-        return any(sensitive in key for sensitive in self.SENSITIVE_FIELDS)
+        return _is_sensitive_key(str(key))
 
     def _serialize_object(self, obj: Any, depth: int = 0) -> Any:
-        """Recursively serialize an object using various strategies."""
-        # Handle None
-        if obj is None:
-            return None
-
-        if depth == 0:
-            self._parent_obj = obj
-        # Check depth
-        if depth > self.MAX_DEPTH:
-            warnings.warn(
-                f"Maximum recursion depth ({self.MAX_DEPTH}) exceeded while serializing object of type {type(obj).__name__} parent: {type(self._parent_obj).__name__}"
+        """Serialize an object using the handler registered for its type."""
+        obj_type = type(obj)
+        handler = self._handlers.get(obj_type)
+        if handler is None:
+            handler = self._handlers[obj_type] = self._resolve_handler(obj_type)
+        try:
+            return handler(obj, depth)
+        except Exception as e:
+            # If all serialization attempts fail, return string representation
+            return f"<unserializable: {obj_type.__name__}, error: {str(e)}>"
+
+    def _resolve_handler(self, obj_type: type) -> Callable[[Any, int], Any]:
+        """Choose the serialization strategy for a type not yet in the dispatch table."""
+        # The logger imports the transports, which import this module
+        from mcp_agent.logging.logger import Logger
+
+        if issubclass(obj_type, httpx.Response):
+            return _describe_response
+        if issubclass(obj_type, Logger):
+            return lambda obj, depth: "<logging: logger>"
+
+        # Enums before basic types, so str/int enums serialize to their value
+        if issubclass(obj_type, Enum):
+            return lambda obj, depth: self._serialize_object(obj.value, depth + 1)
+        if issubclass(obj_type, int):
+            return lambda obj, depth: int(obj)
+        if issubclass(obj_type, float):
+            return lambda obj, depth: float(obj)
+        if issubclass(obj_type, str):
+            return lambda obj, depth: str(obj)
+
+        # Handle common built-in types
+        if issubclass(obj_type, (datetime, date)):
+            return _isoformat
+        if issubclass(obj_type, (Decimal, UUID, Path)):
+            return _to_str
+
+        # Handle callables
+        if any("__call__" in vars(klass) for klass in obj_type.__mro__):
+            return _describe_callable
+
+        # Handle Pydantic models
+        if hasattr(obj_type, "model_dump"):  # Pydantic v2
+            return self._serialize_model
+
+        if hasattr(obj_type, "dict"):  # Pydantic v1
+            return self._guarded(lambda obj, depth: self._serialize_object(obj.dict(), depth + 1))
+
+        # Handle dataclasses
+        if dataclasses.is_dataclass(obj_type):
+            return self._guarded(
+                lambda obj, depth: self._serialize_object(dataclasses.asdict(obj), depth + 1)
             )
-            return str(obj)
 
-        # Prevent infinite recursion
-        obj_id = id(obj)
-        if obj_id in self._processed_objects:
-            return str(obj)
-        self._processed_objects.add(obj_id)
+        # Handle objects with custom serialization method
+        if hasattr(obj_type, "to_json"):
+            return self._guarded(
+                lambda obj, depth: self._serialize_object(obj.to_json(), depth + 1)
+            )
+        if hasattr(obj_type, "to_dict"):
+            return self._guarded(
+                lambda obj, depth: self._serialize_object(obj.to_dict(), depth + 1)
+            )
 
-        # Try different serialization strategies in order
-        try:
-            if isinstance(obj, httpx.Response):
-                return f"<httpx.Response [{obj.status_code}] {obj.url}>"
+        # Handle dictionaries with sensitive data redaction
+        if issubclass(obj_type, Dict):
+            return self._serialize_dict
 
-            if isinstance(obj, logger.Logger):
-                return "<logging: logger>"
+        # Handle iterables (lists, tuples, sets)
+        if issubclass(obj_type, Iterable) and not issubclass(obj_type, bytes):
+            return self._serialize_iterable
 
-            # Basic JSON-serializable types
-            if isinstance(obj, (str, int, float, bool)):
-                return obj
+        return self._serialize_other
 
-            # Handle common built-in types
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            if isinstance(obj, (Decimal, UUID)):
-                return str(obj)
-            if isinstance(obj, Path):
+    def _guarded(self, serialize: Callable[[Any, int], Any]) -> Callable[[Any, int], Any]:
+        """Wrap a container strategy with the depth limit and cycle check."""
+
+        def handler(obj: Any, depth: int) -> Any:
+            if depth > self.MAX_DEPTH:
+                return self._too_deep(obj)
+            obj_id = id(obj)
+            if obj_id in self._processed_objects:
                 return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-
-            # Handle callables
-            if callable(obj):
-                return f"<callable: {obj.__name__}>"
-
-            # Handle Pydantic models
-            if hasattr(obj, "model_dump"):  # Pydantic v2
-                return self._serialize_object(obj.model_dump())
-            if hasattr(obj, "dict"):  # Pydantic v1
-                return self._serialize_object(obj.dict())
-
-            # Handle dataclasses
-            if dataclasses.is_dataclass(obj):
-                return self._serialize_object(dataclasses.asdict(obj))
-
-            # Handle objects with custom serialization method
-            if hasattr(obj, "to_json"):
-                return self._serialize_object(obj.to_json())
-            if hasattr(obj, "to_dict"):
-                return self._serialize_object(obj.to_dict())
-
-            # Handle dictionaries with sensitive data redaction
-            if isinstance(obj, Dict):
-                return {
-                    str(key): self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(key)
-                    else self._serialize_object(value, depth + 1)
-                    for key, value in obj.items()
-                }
+            self._processed_objects.add(obj_id)
+            try:
+                return serialize(obj, depth)
+            finally:
+                self._processed_objects.discard(obj_id)
+
+        return handler
+
+    def _too_deep(self, obj: Any) -> str:
+        warnings.warn(
+            f"Maximum recursion depth ({self.MAX_DEPTH}) exceeded while serializing object of type {type(obj).__name__} parent: {type(self._parent_obj).__name__}"
+        )
+        return str(obj)
 
-            # Handle iterables (lists, tuples, sets)
-            if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
-                return [self._serialize_object(item, depth + 1) for item in obj]
+    def _serialize_model(self, obj: Any, depth: int) -> Any:
+        """Pydantic models dump straight to JSON-compatible values; only redaction remains."""
+        try:
+            dumped = obj.model_dump(mode="json")
+        except Exception:
+            dumped = obj.model_dump()
+        return self._serialize_object(dumped, depth + 1)
 
+    def _serialize_dict(self, obj: Any, depth: int) -> Any:
+        if depth > self.MAX_DEPTH:
+            return self._too_deep(obj)
+        obj_id = id(obj)
+        if obj_id in self._processed_objects:
+            return str(obj)
+        self._processed_objects.add(obj_id)
+        try:
+            result = {}
+            for key, value in obj.items():
+                key = str(key)
+                if _is_sensitive_key(key):
+                    result[key] = self._redact_sensitive_value(value)
+                else:
+                    result[key] = self._serialize_object(value, depth + 1)
+            return result
+        finally:
+            self._processed_objects.discard(obj_id)
+
+    def _serialize_iterable(self, obj: Any, depth: int) -> Any:
+        if depth > self.MAX_DEPTH:
+            return self._too_deep(obj)
+        obj_id = id(obj)
+        if obj_id in self._processed_objects:
+            return str(obj)
+        self._processed_objects.add(obj_id)
+        try:
+            return [self._serialize_object(item, depth + 1) for item in obj]
+        finally:
+            self._processed_objects.discard(obj_id)
+
+    def _serialize_other(self, obj: Any, depth: int) -> Any:
+        """Fallback for types without a dedicated strategy."""
+        if depth > self.MAX_DEPTH:
+            return self._too_deep(obj)
+        obj_id = id(obj)
+        if obj_id in self._processed_objects:
+            return str(obj)
+        self._processed_objects.add(obj_id)
+        try:
             # Handle objects with __dict__
             if hasattr(obj, "__dict__"):
                 return self._serialize_object(obj.__dict__, depth + 1)
 
             # Handle objects with attributes
-            if inspect.getmembers(obj):
+            members = inspect.getmembers(obj)
+            if members:
                 return {
                     name: self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(name)
+                    if _is_sensitive_key(name)
                     else self._serialize_object(value, depth + 1)
-                    for name, value in inspect.getmembers(obj)
+                    for name, value in members
                     if not name.startswith("_") and not inspect.ismethod(value)
                 }
 
             # Fallback: convert to string
             return str(obj)
-
-        except Exception as e:
-            # If all serialization attempts fail, return string representation
-            return f"<unserializable: {type(obj).__name__}, error: {str(e)}>"
+        finally:
+            self._processed_objects.discard(obj_id)
 
     def __call__(self, obj: Any) -> Any:
         """Make the serializer callable."""
         return self.serialize(obj)
+
+
+_SENSITIVE_KEY_PATTERN = re.compile(
+    "|".join(re.escape(field) for field in sorted(JSONSerializer.SENSITIVE_FIELDS))
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    # Payload keys repeat heavily, so the regex search runs once per distinct key
+    return _SENSITIVE_KEY_PATTERN.search(key.lower()) is not None
+
+
+def _identity(obj: Any, depth: int) -> Any:
+    return obj
+
+
+def _isoformat(obj: Any, depth: int) -> str:
+    return obj.isoformat()
+
+
+def _to_str(obj: Any, depth: int) -> str:
+    return str(obj)
+
+
+def _describe_callable(obj: Any, depth: int) -> str:
+    return f"<callable: {getattr(obj, '__name__', type(obj).__name__)}>"
+
+
+def _describe_response(obj: httpx.Response, depth: int) -> str:
+    return f"<httpx.Response [{obj.status_code}] {obj.url}>"
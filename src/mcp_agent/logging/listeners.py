@@ -6,10 +6,10 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import List
 
 from mcp_agent.event_progress import convert_log_event
-from mcp_agent.logging.events import Event, EventFilter, EventType
+from mcp_agent.logging.events import EVENT_LEVELS, Event, EventFilter, EventType
 
 
 class EventListener(ABC):
@@ -19,6 +19,29 @@ class EventListener(ABC):
     async def handle_event(self, event: Event):
         """Process an incoming event."""
 
+    async def handle_events(self, events: List[Event]) -> None:
+        """
+        Process a batch of events in order. The event bus delivers events this way;
+        override to handle a batch more efficiently than one event at a time.
+        A failing event does not prevent the rest of the batch being handled.
+        """
+        first_error: Exception | None = None
+        for event in events:
+            try:
+                await self.handle_event(event)
+            except Exception as e:
+                first_error = first_error or e
+        if first_error:
+            raise first_error
+
+    @property
+    def min_level(self) -> EventType | None:
+        """
+        Lowest level of event this listener may handle, or None if it only handles progress
+        events. Loggers skip building events that no listener or transport will receive.
+        """
+        return "debug"
+
 
 class LifecycleAwareListener(EventListener):
     """
@@ -49,14 +72,28 @@ class FilteredListener(LifecycleAwareListener):
         """
         self.filter = event_filter
 
+    @property
+    def min_level(self) -> EventType | None:
+        return (self.filter.min_level if self.filter else None) or "debug"
+
     async def handle_event(self, event) -> None:
         if not self.filter or self.filter.matches(event):
             await self.handle_matched_event(event)
 
+    async def handle_events(self, events: List[Event]) -> None:
+        matched = [event for event in events if not self.filter or self.filter.matches(event)]
+        if matched:
+            await self.handle_matched_events(matched)
+
     async def handle_matched_event(self, event: Event) -> None:
         """Process an event that matches the filter."""
         pass
 
+    async def handle_matched_events(self, events: List[Event]) -> None:
+        """Process a batch of events that match the filter."""
+        for event in events:
+            await self.handle_matched_event(event)
+
 
 class LoggingListener(FilteredListener):
     """
@@ -77,13 +114,14 @@ class LoggingListener(FilteredListener):
         self.logger = logger or logging.getLogger("mcp_agent")
 
     async def handle_matched_event(self, event) -> None:
-        level_map: Dict[EventType, int] = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-        }
-        level = level_map.get(event.type, logging.INFO)
+        self._log(event)
+
+    async def handle_matched_events(self, events: List[Event]) -> None:
+        for event in events:
+            self._log(event)
+
+    def _log(self, event: Event) -> None:
+        level = EVENT_LEVELS.get(event.type, logging.INFO)
 
         # Check if this is a server stderr message and format accordingly
         if event.name == "mcpserver.stderr":
@@ -121,6 +159,10 @@ class ProgressListener(LifecycleAwareListener):
 
         self.display = display or progress_display
 
+    @property
+    def min_level(self) -> EventType | None:
+        return None
+
     async def start(self) -> None:
         """Start the progress display."""
         self.display.start()
@@ -131,7 +173,13 @@ class ProgressListener(LifecycleAwareListener):
 
     async def handle_event(self, event: Event) -> None:
         """Process an incoming event and display progress if relevant."""
+        self._update(event)
 
+    async def handle_events(self, events: List[Event]) -> None:
+        for event in events:
+            self._update(event)
+
+    def _update(self, event: Event) -> None:
         if event.data:
             progress_event = convert_log_event(event)
             if progress_event:
@@ -197,6 +245,11 @@ class BatchingListener(FilteredListener):
         if len(self.batch) >= self.batch_size:
             await self.flush()
 
+    async def handle_matched_events(self, events: List[Event]) -> None:
+        self.batch.extend(events)
+        if len(self.batch) >= self.batch_size:
+            await self.flush()
+
     async def flush(self) -> None:
         """Flush the current batch of events."""
         if not self.batch:
@@ -0,0 +1,396 @@
+"""
+Indexed, random-access reader for JSONL event logs written by FileTransport.
+
+The first open scans the log with memory-mapped I/O and writes a sidecar index
+(<log>.idx) holding each line's offset, timestamp, level and namespace. Later opens
+load the index directly, and a log that has grown since is indexed from where the
+previous index stopped. Events are only parsed when they are accessed.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate, repeat
+from operator import add, methodcaller, sub
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Sequence, overload
+
+from mcp_agent.logging.events import EVENT_LEVELS, Event, EventType
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+# The index records a hash of the log's first bytes, to notice a log replaced by another
+HEAD_SIZE = 4096
+
+# FileTransport writes level, timestamp and namespace first, so lines from it are indexed
+# from this prefix alone; other lines fall back to json.loads.
+_LINE_PREFIX = re.compile(
+    rb'\{"level":"([A-Za-z]+)","timestamp":"([^"]+)","namespace":"((?:[^"\\]+|\\.)*)"'
+)
+
+# Lines are split and matched a chunk at a time so the per-line work stays in C
+_SCAN_CHUNK = 16 * 1024 * 1024
+
+# Timestamps are indexed as seconds since this naive epoch: FileTransport writes local
+# naive timestamps, and converting each through the local timezone is slow
+_EPOCH = datetime(1970, 1, 1)
+
+_decoder = json.JSONDecoder()
+
+
+def event_from_log_entry(entry: dict) -> Event:
+    """Convert a FileTransport log entry back into an Event."""
+    return Event(
+        type=entry.get("level", "info").lower(),
+        namespace=entry.get("namespace", ""),
+        message=entry.get("message", ""),
+        timestamp=datetime.fromisoformat(entry["timestamp"]),
+        data=entry.get("data", {}),
+    )
+
+
+def _seconds(timestamp: datetime) -> float:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return (timestamp - _EPOCH).total_seconds()
+
+
+def _seconds_all(raw_values: Sequence[bytes]) -> List[float]:
+    timestamps = list(map(datetime.fromisoformat, map(bytes.decode, raw_values)))
+    try:
+        return list(map(timedelta.total_seconds, map(sub, timestamps, repeat(_EPOCH))))
+    except TypeError:
+        # Timezone-aware timestamps can't be subtracted from the naive epoch
+        return [_seconds(timestamp) for timestamp in timestamps]
+
+
+def _decode_level(raw: bytes) -> str:
+    return raw.decode().lower()
+
+
+def _decode_namespace(raw: bytes) -> str:
+    return json.loads(b'"' + raw + b'"') if b"\\" in raw else raw.decode()
+
+
+def _intern(value: str, table: List[str], index: Dict[str, int]) -> int:
+    """Id of value in a string table, adding it if new."""
+    value_id = index.get(value)
+    if value_id is None:
+        value_id = index[value] = len(table)
+        table.append(value)
+    return value_id
+
+
+def _intern_all(
+    raw_values: Sequence[bytes],
+    decode: Callable[[bytes], str],
+    table: List[str],
+    index: Dict[str, int],
+) -> Iterator[int]:
+    """Ids for a run of raw values, decoding each distinct value once."""
+    ids = {raw: _intern(decode(raw), table, index) for raw in dict.fromkeys(raw_values)}
+    return map(ids.__getitem__, raw_values)
+
+
+class EventLogReader(Sequence[Event]):
+    """
+    Sequence of the events in a JSONL log, backed by a sidecar offset index.
+
+    Indexing and filtering (find) only use the index; events are read and parsed from
+    the memory-mapped log when accessed.
+    """
+
+    def __init__(self, path: str | Path, index_path: str | Path | None = None) -> None:
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else Path(f"{self.path}{INDEX_SUFFIX}")
+
+        self._offsets = array("q")
+        self._timestamps = array("d")
+        self._level_ids = array("H")
+        self._namespace_ids = array("I")
+        self._levels: List[str] = []
+        self._namespaces: List[str] = []
+        self._indexed_size = 0
+
+        self._file = open(self.path, "rb")
+        self._mmap: mmap.mmap | None = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Index lines appended since the last refresh (rebuilding if the log was replaced)."""
+        size = os.fstat(self._file.fileno()).st_size
+        if not self._offsets and not self._load_index(size):
+            self._reset()
+        if size < self._indexed_size:
+            self._reset()
+        if self._mmap is None or len(self._mmap) != size:
+            self._remap(size)
+        if size > self._indexed_size:
+            self._scan(self._indexed_size, size)
+            self._save_index()
+
+    def _reset(self) -> None:
+        for values in (self._offsets, self._timestamps, self._level_ids, self._namespace_ids):
+            del values[:]
+        self._levels.clear()
+        self._namespaces.clear()
+        self._indexed_size = 0
+
+    def _remap(self, size: int) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ) if size else None
+
+    def _scan(self, start: int, end: int) -> None:
+        """Index complete lines between start and end. A trailing partial line is left for later."""
+        mm = self._mmap
+        end = mm.rfind(b"\n", start, end) + 1
+        level_index = {name: i for i, name in enumerate(self._levels)}
+        namespace_index = {name: i for i, name in enumerate(self._namespaces)}
+
+        position = start
+        while position < end:
+            chunk_end = mm.find(b"\n", min(position + _SCAN_CHUNK, end) - 1, end) + 1
+            lines = mm[position:chunk_end].split(b"\n")
+            lines.pop()
+            offsets = array("q", accumulate(map(add, map(len, lines), repeat(1)), initial=position))
+            offsets.pop()
+
+            matches = list(map(_LINE_PREFIX.match, lines))
+            if None in matches:
+                self._index_mixed_lines(offsets, lines, matches, level_index, namespace_index)
+            else:
+                levels, timestamps, namespaces = zip(*map(methodcaller("groups"), matches))
+                self._offsets.extend(offsets)
+                self._timestamps.extend(_seconds_all(timestamps))
+                self._level_ids.extend(
+                    _intern_all(levels, _decode_level, self._levels, level_index)
+                )
+                self._namespace_ids.extend(
+                    _intern_all(namespaces, _decode_namespace, self._namespaces, namespace_index)
+                )
+            position = chunk_end
+
+        self._indexed_size = max(end, self._indexed_size)
+
+    def _index_mixed_lines(
+        self,
+        offsets: Sequence[int],
+        lines: List[bytes],
+        matches: List[re.Match | None],
+        level_index: Dict[str, int],
+        namespace_index: Dict[str, int],
+    ) -> None:
+        """Index a chunk containing lines not written by FileTransport (or blank/corrupt ones)."""
+        for offset, line, match in zip(offsets, lines, matches):
+            if match is not None:
+                level, timestamp, namespace = match.groups()
+                fields = (
+                    _decode_level(level),
+                    _seconds(datetime.fromisoformat(timestamp.decode())),
+                    _decode_namespace(namespace),
+                )
+            else:
+                fields = self._parse_fields(line)
+                if fields is None:
+                    continue
+
+            level, timestamp, namespace = fields
+            self._offsets.append(offset)
+            self._timestamps.append(timestamp)
+            self._level_ids.append(_intern(level, self._levels, level_index))
+            self._namespace_ids.append(_intern(namespace, self._namespaces, namespace_index))
+
+    @staticmethod
+    def _parse_fields(line: bytes) -> tuple[str, float, str] | None:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # Skip lines that are not JSON (e.g. truncated by a crash)
+            return None
+        timestamp = entry.get("timestamp")
+        return (
+            str(entry.get("level", "info")).lower(),
+            _seconds(datetime.fromisoformat(timestamp)) if timestamp else 0.0,
+            entry.get("namespace", ""),
+        )
+
+    def _load_index(self, size: int) -> bool:
+        """Load the sidecar index if it belongs to this log. Returns False if it can't be used."""
+        try:
+            with open(self.index_path, "rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != INDEX_VERSION
+                    or header["indexed_size"] > size
+                    or header["head"] != self._head(header["indexed_size"])
+                ):
+                    return False
+                count = header["count"]
+                for values in (
+                    self._offsets,
+                    self._timestamps,
+                    self._level_ids,
+                    self._namespace_ids,
+                ):
+                    values.fromfile(f, count)
+        except (OSError, EOFError, ValueError, KeyError):
+            self._reset()
+            return False
+
+        self._levels[:] = header["levels"]
+        self._namespaces[:] = header["namespaces"]
+        self._indexed_size = header["indexed_size"]
+        return True
+
+    def _head(self, size: int) -> str:
+        return hashlib.sha1(os.pread(self._file.fileno(), min(size, HEAD_SIZE), 0)).hexdigest()
+
+    def _save_index(self) -> None:
+        header = {
+            "version": INDEX_VERSION,
+            "indexed_size": self._indexed_size,
+            "head": self._head(self._indexed_size),
+            "count": len(self._offsets),
+            "levels": self._levels,
+            "namespaces": self._namespaces,
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                for values in (
+                    self._offsets,
+                    self._timestamps,
+                    self._level_ids,
+                    self._namespace_ids,
+                ):
+                    values.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # A read-only location only costs re-indexing next time
+            pass
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Event]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._read(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        return self._read(index)
+
+    def _read(self, index: int) -> Event:
+        start = self._offsets[index]
+        end = self._offsets[index + 1] if index + 1 < len(self._offsets) else self._indexed_size
+        # Decode only the first value: skipped (blank or corrupt) lines may follow it
+        entry, _ = _decoder.raw_decode(self._mmap[start:end].decode("utf-8"))
+        return event_from_log_entry(entry)
+
+    def level(self, index: int) -> str:
+        """Level of an event, from the index."""
+        return self._levels[self._level_ids[index]]
+
+    def namespace(self, index: int) -> str:
+        """Namespace of an event, from the index."""
+        return self._namespaces[self._namespace_ids[index]]
+
+    def timestamp(self, index: int) -> datetime:
+        """Timestamp of an event, from the index."""
+        return _EPOCH + timedelta(seconds=self._timestamps[index])
+
+    def find(
+        self,
+        min_level: EventType | None = None,
+        namespace: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> "EventLogView":
+        """
+        Select events using only the index.
+
+        Args:
+            min_level: Minimum level (as in EventFilter)
+            namespace: Namespace prefix, e.g. "mcp_agent.mcp"
+            since: Earliest timestamp (inclusive)
+            until: Latest timestamp (inclusive)
+        """
+        earliest = _seconds(since) if since else float("-inf")
+        latest = _seconds(until) if until else float("inf")
+
+        level_ok = None
+        if min_level:
+            threshold = EVENT_LEVELS.get(min_level, logging.DEBUG)
+            level_ok = {
+                i
+                for i, name in enumerate(self._levels)
+                if EVENT_LEVELS.get(name, logging.DEBUG) >= threshold
+            }
+        namespace_ok = None
+        if namespace:
+            namespace_ok = {
+                i
+                for i, name in enumerate(self._namespaces)
+                if name == namespace or name.startswith(f"{namespace}.")
+            }
+
+        indices = array(
+            "q",
+            (
+                i
+                for i in range(len(self))
+                if earliest <= self._timestamps[i] <= latest
+                and (level_ok is None or self._level_ids[i] in level_ok)
+                and (namespace_ok is None or self._namespace_ids[i] in namespace_ok)
+            ),
+        )
+        return EventLogView(self, indices)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "EventLogReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class EventLogView(Sequence[Event]):
+    """A filtered selection of a reader's events; events are parsed on access."""
+
+    def __init__(self, reader: EventLogReader, indices: Sequence[int]) -> None:
+        self.reader = reader
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.reader[i] for i in self.indices[index]]
+        return self.reader[self.indices[index]]
+
+    def __iter__(self) -> Iterator[Event]:
+        for i in self.indices:
+            yield self.reader[i]
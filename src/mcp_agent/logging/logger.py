@@ -11,7 +11,7 @@ import asyncio
 import threading
 import time
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from mcp_agent.logging.events import Event, EventContext, EventFilter, EventType
 from mcp_agent.logging.listeners import (
@@ -19,7 +19,13 @@ from mcp_agent.logging.listeners import (
     LoggingListener,
     ProgressListener,
 )
-from mcp_agent.logging.transport import AsyncEventBus, EventTransport
+from mcp_agent.logging.transport import AsyncEventBus, EventTransport, QueueOverflowPolicy
+
+
+def _is_progress_data(data: dict) -> bool:
+    """Whether event data carries a progress_action for the progress display"""
+    event_data = data.get("data")
+    return isinstance(event_data, dict) and "progress_action" in event_data
 
 
 class Logger:
@@ -47,21 +53,43 @@ class Logger:
         """Emit an event by running it in the event loop."""
         loop = self._ensure_event_loop()
         if loop.is_running():
-            # If we're in a thread with a running loop, schedule the coroutine
-            asyncio.create_task(self.event_bus.emit(event))
+            # We can't wait here, so queue the event now rather than scheduling emit(),
+            # which would leave a pending task per event while the queue is full
+            self.event_bus.emit_nowait(event)
         else:
             # If no loop is running, run it until the emit completes
             loop.run_until_complete(self.event_bus.emit(event))
 
+    def is_enabled_for(self, etype: EventType) -> bool:
+        """
+        Check whether an event of this type would be delivered anywhere. Use to guard
+        expensive preparation of log data that cannot be passed lazily.
+        """
+        return self.event_bus.is_enabled_for(etype)
+
     def event(
         self,
         etype: EventType,
         ename: str | None,
-        message: str,
+        message: str | Callable[[], str],
         context: EventContext | None,
         data: dict,
     ) -> None:
-        """Create and emit an event."""
+        """
+        Create and emit an event, unless no transport or listener would receive it.
+
+        The message may be a callable returning the message, and the `data` entry may be a
+        factory, as in `logger.debug("request", data=lambda: request.model_dump())`; they are
+        only called if the event is emitted. Other values are logged as they are.
+        """
+        if not self.event_bus.is_enabled_for(etype, _is_progress_data(data)):
+            return
+
+        if callable(message):
+            message = message()
+        if callable(data.get("data")):
+            data = {**data, "data": data["data"]()}
+
         evt = Event(
             type=etype,
             name=ename,
@@ -74,7 +102,7 @@ class Logger:
 
     def debug(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext | None = None,
         **data,
@@ -84,7 +112,7 @@ class Logger:
 
     def info(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext | None = None,
         **data,
@@ -94,7 +122,7 @@ class Logger:
 
     def warning(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext | None = None,
         **data,
@@ -104,7 +132,7 @@ class Logger:
 
     def error(
         self,
-        message: str,
+        message: str | Callable[[], str],
         name: str | None = None,
         context: EventContext | None = None,
         **data,
@@ -191,6 +219,9 @@ class LoggingConfig:
         transport: EventTransport | None = None,
         batch_size: int = 100,
         flush_interval: float = 2.0,
+        max_queue_size: int = 0,
+        queue_overflow: QueueOverflowPolicy = "block",
+        queue_debug_sample_rate: float = 1.0,
         **kwargs: Any,
     ) -> None:
         """
@@ -201,20 +232,27 @@ class LoggingConfig:
             transport: Transport for sending events to external systems
             batch_size: Default batch size for batching listener
             flush_interval: Default flush interval for batching listener
+            max_queue_size: Maximum events queued for listeners (0 for unbounded)
+            queue_overflow: Policy for events arriving when the queue is full
+            queue_debug_sample_rate: Fraction of debug events kept when full ('sample_debug')
             **kwargs: Additional configuration options
         """
         if cls._initialized:
             return
 
         bus = AsyncEventBus.get(transport=transport)
+        bus.configure_queue(max_queue_size, queue_overflow, queue_debug_sample_rate)
 
         # Add standard listeners
         if "logging" not in bus.listeners:
             bus.add_listener("logging", LoggingListener(event_filter=event_filter))
 
-        # Only add progress listener if enabled in settings
+        # Only add progress listener if enabled in settings and there is a terminal to draw on
         if "progress" not in bus.listeners and kwargs.get("progress_display", True):
-            bus.add_listener("progress", ProgressListener())
+            from mcp_agent.progress_display import progress_display
+
+            if progress_display.enabled:
+                bus.add_listener("progress", ProgressListener())
 
         if "batching" not in bus.listeners:
             bus.add_listener(
@@ -1,24 +1,47 @@
 """Rich-based progress display for MCP Agent."""
 
+import threading
 import time
 from contextlib import contextmanager
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional
 
-from rich.console import Console
+from rich.console import Console, RenderableType
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from mcp_agent.console import console as default_console
 from mcp_agent.event_progress import ProgressAction, ProgressEvent
 
 
+class _CoalescingProgress(Progress):
+    """Progress that applies pending updates just before each (auto) refresh renders."""
+
+    def __init__(self, *columns, before_render: Callable[[], None], **kwargs) -> None:
+        # Set first: Progress renders once while it is constructed
+        self._before_render = before_render
+        super().__init__(*columns, **kwargs)
+
+    def get_renderables(self) -> Iterable[RenderableType]:
+        self._before_render()
+        yield from super().get_renderables()
+
+
 class RichProgressDisplay:
-    """Rich-based display for progress events."""
+    """
+    Rich-based display for progress events.
+
+    Updates are coalesced: update() only records the latest event for each row, and rows are
+    redrawn at refresh_per_second by Rich's refresh thread. When the console is not a terminal
+    the display is disabled and every method is a no-op.
+    """
 
-    def __init__(self, console: Optional[Console] = None) -> None:
+    def __init__(self, console: Optional[Console] = None, refresh_per_second: float = 10) -> None:
         """Initialize the progress display."""
         self.console = console or default_console
+        self.enabled = self.console.is_terminal
         self._taskmap = {}
-        self._progress = Progress(
+        self._pending: Dict[str, ProgressEvent] = {}
+        self._pending_lock = threading.Lock()
+        self._progress = _CoalescingProgress(
             SpinnerColumn(spinner_name="simpleDotsScrolling"),
             TextColumn(
                 "[progress.description]{task.description}|",
@@ -28,21 +51,24 @@ class RichProgressDisplay:
             TextColumn(text_format="{task.fields[details]}", style="dim white"),
             console=self.console,
             transient=False,
+            refresh_per_second=refresh_per_second,
+            before_render=self._apply_pending,
         )
         self._paused = False
 
     def start(self) -> None:
         """start"""
-
-        self._progress.start()
+        if self.enabled:
+            self._progress.start()
 
     def stop(self) -> None:
         """stop"""
-        self._progress.stop()
+        if self.enabled:
+            self._progress.stop()
 
     def pause(self) -> None:
         """Pause the progress display."""
-        if not self._paused:
+        if self.enabled and not self._paused:
             self._paused = True
 
             for task in self._progress.tasks:
@@ -51,7 +77,7 @@ class RichProgressDisplay:
 
     def resume(self) -> None:
         """Resume the progress display."""
-        if self._paused:
+        if self.enabled and self._paused:
             for task in self._progress.tasks:
                 task.visible = True
             self._paused = False
@@ -84,7 +110,23 @@ class RichProgressDisplay:
         }.get(action, "white")
 
     def update(self, event: ProgressEvent) -> None:
-        """Update the progress display with a new event."""
+        """Record a progress event; only the latest event per row is drawn at the next refresh."""
+        if not self.enabled:
+            return
+        task_name = event.agent_name or "default"
+        with self._pending_lock:
+            # Re-insert so rows are applied in the order of their latest events
+            self._pending.pop(task_name, None)
+            self._pending[task_name] = event
+
+    def _apply_pending(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for event in pending.values():
+            self._apply(event)
+
+    def _apply(self, event: ProgressEvent) -> None:
+        """Update the progress rows with a new event."""
         task_name = event.agent_name or "default"
 
         # Create new task if needed
@@ -5,13 +5,20 @@ Transports for the Logger module for MCP Agent, including:
 """
 
 import asyncio
-import json
+import atexit
+import gzip
+import logging
+import os
+import random
+import shutil
+import threading
+import time
 import traceback
 from abc import ABC, abstractmethod
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Protocol
+from typing import TYPE_CHECKING, Dict, List, Literal, Protocol
 
-import aiohttp
 from opentelemetry import trace
 from rich import print
 from rich.json import JSON
@@ -19,10 +26,13 @@ from rich.text import Text
 
 from mcp_agent.config import LoggerSettings
 from mcp_agent.console import console
-from mcp_agent.logging.events import Event, EventFilter
-from mcp_agent.logging.json_serializer import JSONSerializer
+from mcp_agent.logging.events import EVENT_LEVELS, Event, EventFilter, EventType
+from mcp_agent.logging.json_serializer import JSONSerializer, dumps
 from mcp_agent.logging.listeners import EventListener, LifecycleAwareListener
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 class EventTransport(Protocol):
     """
@@ -47,6 +57,11 @@ class FilteredEventTransport(EventTransport, ABC):
     def __init__(self, event_filter: EventFilter | None = None) -> None:
         self.filter = event_filter
 
+    @property
+    def min_level(self) -> EventType | None:
+        """Lowest level of event this transport may send, or None if it sends nothing."""
+        return (self.filter.min_level if self.filter else None) or "debug"
+
     async def send_event(self, event: Event) -> None:
         if not self.filter or self.filter.matches(event):
             await self.send_matched_event(event)
@@ -59,6 +74,10 @@ class FilteredEventTransport(EventTransport, ABC):
 class NoOpTransport(FilteredEventTransport):
     """Default transport that does nothing (purely local)."""
 
+    @property
+    def min_level(self) -> EventType | None:
+        return None
+
     async def send_matched_event(self, event) -> None:
         """Do nothing."""
         pass
@@ -106,7 +125,14 @@ class ConsoleTransport(FilteredEventTransport):
 
 
 class FileTransport(FilteredEventTransport):
-    """Transport that writes events to a file with proper formatting."""
+    """
+    Transport that writes events to a JSONL file.
+
+    Entries are formatted on the event loop and buffered; a background thread owns the
+    file handle and writes the buffer when it reaches batch_size entries or every
+    flush_interval seconds. The file can be rotated by size and/or age, optionally
+    gzipping rotated files.
+    """
 
     def __init__(
         self,
@@ -114,6 +140,12 @@ class FileTransport(FilteredEventTransport):
         event_filter: EventFilter | None = None,
         mode: str = "a",
         encoding: str = "utf-8",
+        batch_size: int = 100,
+        flush_interval: float = 2.0,
+        max_bytes: int | None = None,
+        rotate_interval: float | None = None,
+        backup_count: int = 5,
+        compress: bool = False,
     ) -> None:
         """Initialize FileTransport.
 
@@ -122,18 +154,38 @@ class FileTransport(FilteredEventTransport):
             event_filter: Optional filter for events
             mode: File open mode ('a' for append, 'w' for write)
             encoding: File encoding to use
+            batch_size: Number of buffered entries that triggers a write
+            flush_interval: Maximum seconds an entry stays buffered
+            max_bytes: Rotate the file before it would exceed this size
+            rotate_interval: Rotate the file after it has been open this many seconds
+            backup_count: Number of rotated files to keep (path.1 is the newest)
+            compress: Gzip rotated files
         """
         super().__init__(event_filter=event_filter)
         self.filepath = Path(filepath)
         self.mode = mode
         self.encoding = encoding
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
         self._serializer = JSONSerializer()
 
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer: threading.Thread | None = None
+        self._file = None
+        self._opened_at = 0.0
+
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
     async def send_matched_event(self, event: Event) -> None:
-        """Write matched event to log file asynchronously.
+        """Format a matched event and buffer it for the writer thread.
 
         Args:
             event: Event to write to file
@@ -154,23 +206,122 @@ class FileTransport(FilteredEventTransport):
         if event.data:
             log_entry["data"] = self._serializer(event.data)
 
+        # Write the log entry as compact JSON (JSONL format)
+        line = dumps(log_entry) + "\n"
+        with self._lock:
+            if self._writer is None:
+                # First event, or the first since close(): (re)open the file
+                self._closed = False
+                self._start_writer()
+            elif self._closed:
+                # close() is still writing out the buffer
+                return
+            self._buffer.append(line)
+            if len(self._buffer) >= self.batch_size:
+                self._wake.set()
+
+    def _start_writer(self) -> None:
+        self._writer = threading.Thread(
+            target=self._run_writer, name="fast-agent-file-log", daemon=True
+        )
+        self._writer.start()
+        # Flush anything still buffered if the process exits without close()
+        atexit.register(self._shutdown)
+
+    def _run_writer(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._write_buffer()
+            if self._closed:
+                break
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write_buffer(self) -> None:
+        """Write buffered entries, rotating first if needed. Runs on the writer thread."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if not lines:
+            return
+
+        data = "".join(lines)
         try:
-            with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
-                # Write the log entry as compact JSON (JSONL format)
-                f.write(json.dumps(log_entry, separators=(",", ":")) + "\n")
-                f.flush()  # Ensure writing to disk
-        except IOError as e:
+            if self._file is None:
+                # Append when reopening after close(), even if the file was first truncated
+                self._open(self.mode if self._opened_at == 0.0 else "a")
+            elif self._should_rotate(len(data.encode(self.encoding))):
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+        except (IOError, OSError) as e:
             # Log error without recursion
             print(f"Error writing to log file {self.filepath}: {e}")
 
+    def _open(self, mode: str) -> None:
+        self._file = open(self.filepath, mode=mode, encoding=self.encoding)
+        self._opened_at = time.monotonic()
+
+    def _should_rotate(self, pending_bytes: int) -> bool:
+        if self.rotate_interval and time.monotonic() - self._opened_at >= self.rotate_interval:
+            return True
+        if self.max_bytes:
+            size = self._file.tell()
+            return size > 0 and size + pending_bytes > self.max_bytes
+        return False
+
+    def _backup_path(self, index: int) -> Path:
+        suffix = ".gz" if self.compress else ""
+        return self.filepath.with_name(f"{self.filepath.name}.{index}{suffix}")
+
+    def _rotate(self) -> None:
+        """Shift existing backups up by one and move the current file to backup 1."""
+        self._file.close()
+        self._file = None
+
+        if self.backup_count > 0:
+            oldest = self._backup_path(self.backup_count)
+            if oldest.exists():
+                oldest.unlink()
+            for index in range(self.backup_count - 1, 0, -1):
+                backup = self._backup_path(index)
+                if backup.exists():
+                    os.replace(backup, self._backup_path(index + 1))
+
+            if self.compress:
+                with open(self.filepath, "rb") as src, gzip.open(self._backup_path(1), "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                os.replace(self.filepath, self._backup_path(1))
+
+        self._open("w")
+
+    def _shutdown(self) -> None:
+        """Stop the writer thread after it has written everything buffered."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+        if writer is not None:
+            self._wake.set()
+            writer.join()
+            atexit.unregister(self._shutdown)
+            with self._lock:
+                self._writer = None
+
     async def close(self) -> None:
-        """Clean up resources if needed."""
-        pass  # File handles are automatically closed after each write
+        """
+        Write any buffered entries and close the file. An event sent afterwards reopens
+        the file, so the transport can be reused when its event bus is started again.
+        """
+        await asyncio.to_thread(self._shutdown)
 
     @property
     def is_closed(self) -> bool:
         """Check if transport is closed."""
-        return False  # Since we open/close per write
+        return self._closed
 
 
 class HTTPTransport(FilteredEventTransport):
@@ -195,14 +346,19 @@ class HTTPTransport(FilteredEventTransport):
 
         self.batch: List[Event] = []
         self.lock = asyncio.Lock()
-        self._session: aiohttp.ClientSession | None = None
+        self._session: "aiohttp.ClientSession | None" = None
         self._serializer = JSONSerializer()
 
     async def start(self) -> None:
         """Initialize HTTP session."""
         if not self._session:
+            # Imported here: aiohttp is only needed when HTTP logging is configured
+            import aiohttp
+
             self._session = aiohttp.ClientSession(
-                headers=self.headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                json_serialize=dumps,
             )
 
     async def stop(self) -> None:
@@ -258,6 +414,12 @@ class HTTPTransport(FilteredEventTransport):
             self.batch.clear()
 
 
+QueueOverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "sample_debug"]
+
+# Put on a listener queue that configure_queue() has replaced, to wake its reader
+_QUEUE_REPLACED = object()
+
+
 class AsyncEventBus:
     """
     Async event bus with local in-process listeners + optional remote transport.
@@ -266,10 +428,17 @@ class AsyncEventBus:
 
     _instance = None
 
+    max_batch_size: int = 100
+    """Maximum number of events handed to listeners at once"""
+
     def __init__(self, transport: EventTransport | None = None) -> None:
-        self.transport: EventTransport = transport or NoOpTransport()
         self.listeners: Dict[str, EventListener] = {}
+        self.transport = transport or NoOpTransport()
         self._queue = asyncio.Queue()
+        self._overflow: QueueOverflowPolicy = "block"
+        self._debug_sample_rate = 1.0
+        self.dropped_events: Counter[str] = Counter()
+        """Number of events discarded because the queue was full, by event type"""
         self._task: asyncio.Task | None = None
         self._running = False
         self._stop_event = asyncio.Event()
@@ -281,6 +450,100 @@ class AsyncEventBus:
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
 
+    @property
+    def transport(self) -> EventTransport:
+        """Transport that receives every event before the listeners."""
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: EventTransport) -> None:
+        self._transport = transport
+        self._update_min_level()
+
+    def _update_min_level(self) -> None:
+        """Recompute the lowest event level the transport or any listener will receive."""
+        levels = [getattr(self._transport, "min_level", "debug")]
+        levels.extend(listener.min_level for listener in self.listeners.values())
+        values = [EVENT_LEVELS.get(level, logging.DEBUG) for level in levels if level is not None]
+
+        self._min_level_value = min(values) if values else None
+        # Listeners that only consume progress events receive them at any level
+        self._wants_progress = any(
+            listener.min_level is None for listener in self.listeners.values()
+        )
+
+    def configure_queue(
+        self,
+        max_queue_size: int = 0,
+        overflow: QueueOverflowPolicy = "block",
+        debug_sample_rate: float = 1.0,
+    ) -> None:
+        """
+        Bound the listener queue (0 for unbounded) and set the policy for events that
+        arrive while it is full. Events already queued are kept, subject to the new policy.
+        May be called while the bus is running.
+        """
+        old_queue = self._queue
+        pending = []
+        while not old_queue.empty():
+            pending.append(old_queue.get_nowait())
+            old_queue.task_done()
+
+        self._queue = asyncio.Queue(maxsize=max_queue_size)
+        self._overflow = overflow
+        self._debug_sample_rate = debug_sample_rate
+        for event in pending:
+            self._enqueue_nowait(event)
+
+        # Wake the processing task if it is waiting on the old queue
+        old_queue.put_nowait(_QUEUE_REPLACED)
+
+    @property
+    def dropped_total(self) -> int:
+        """Total number of events discarded because the queue was full"""
+        return sum(self.dropped_events.values())
+
+    def _record_drop(self, event: Event) -> None:
+        self.dropped_events[event.type] += 1
+
+    def _enqueue_nowait(self, event: Event) -> None:
+        """
+        Queue an event without waiting, applying the overflow policy if the queue is full.
+        With 'block' the new event is discarded, as the caller can't wait for space.
+        """
+        if not self._queue.full():
+            self._queue.put_nowait(event)
+            return
+
+        if self._overflow in ("block", "drop_newest") or (
+            self._overflow == "sample_debug"
+            and EVENT_LEVELS.get(event.type, logging.DEBUG) <= logging.DEBUG
+            and random.random() >= self._debug_sample_rate
+        ):
+            self._record_drop(event)
+            return
+
+        # Make room by discarding the oldest queued event
+        self._record_drop(self._queue.get_nowait())
+        self._queue.task_done()
+        self._queue.put_nowait(event)
+
+    def is_enabled_for(self, event_type: EventType, progress: bool = False) -> bool:
+        """
+        Whether an event of this type would reach the transport or any listener.
+        Progress events (carrying a progress_action) also reach progress listeners.
+        Until the bus is started all events are accepted, as they are queued for
+        listeners that may not have been added yet.
+        """
+        if not self._running:
+            return True
+        if progress and self._wants_progress:
+            return True
+        return (
+            self._min_level_value is not None
+            and EVENT_LEVELS.get(event_type, logging.DEBUG) >= self._min_level_value
+        )
+
     @classmethod
     def get(cls, transport: EventTransport | None = None) -> "AsyncEventBus":
         """Get the singleton instance of the event bus."""
@@ -330,21 +593,19 @@ class AsyncEventBus:
         self._running = False
         self._stop_event.set()
 
-        # Try to process remaining items with a timeout
-        if not self._queue.empty():
-            try:
-                # Give some time for remaining items to be processed
-                await asyncio.wait_for(self._queue.join(), timeout=5.0)
-            except asyncio.TimeoutError:
-                # If we timeout, drain the queue to prevent deadlock
-                while not self._queue.empty():
-                    try:
-                        self._queue.get_nowait()
-                        self._queue.task_done()
-                    except asyncio.QueueEmpty:
-                        break
-            except Exception as e:
-                print(f"Error during queue cleanup: {e}")
+        # Let the processing task deliver queued (and in-flight) events, with a timeout
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=5.0)
+        except asyncio.TimeoutError:
+            # If we timeout, drain the queue to prevent deadlock
+            while not self._queue.empty():
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except asyncio.QueueEmpty:
+                    break
+        except Exception as e:
+            print(f"Error during queue cleanup: {e}")
 
         # Cancel and wait for task with timeout
         if self._task and not self._task.done():
@@ -359,6 +620,14 @@ class AsyncEventBus:
             finally:
                 self._task = None
 
+        # Let the transport write out anything it has buffered
+        close_transport = getattr(self.transport, "close", None)
+        if close_transport is not None:
+            try:
+                await asyncio.wait_for(close_transport(), timeout=5.0)
+            except Exception as e:
+                print(f"Error closing transport: {e}")
+
         # Stop each lifecycle-aware listener
         for listener in self.listeners.values():
             if isinstance(listener, LifecycleAwareListener):
@@ -369,94 +638,97 @@ class AsyncEventBus:
                 except Exception as e:
                     print(f"Error stopping listener: {e}")
 
-    async def emit(self, event: Event) -> None:
-        """Emit an event to all listeners and transport."""
-        # Inject current tracing info if available
+    @staticmethod
+    def _add_trace_context(event: Event) -> None:
+        """Inject current tracing info if available"""
         span = trace.get_current_span()
         if span.is_recording():
             ctx = span.get_span_context()
             event.trace_id = f"{ctx.trace_id:032x}"
             event.span_id = f"{ctx.span_id:016x}"
 
-        # Forward to transport first (immediate processing)
+    async def _send_to_transport(self, event: Event) -> None:
         try:
             await self.transport.send_event(event)
         except Exception as e:
             print(f"Error in transport.send_event: {e}")
 
+    async def emit(self, event: Event) -> None:
+        """
+        Emit an event to all listeners and transport. With the 'block' overflow policy
+        this waits for space in the listener queue.
+        """
+        self._add_trace_context(event)
+
+        # Forward to transport first (immediate processing)
+        await self._send_to_transport(event)
+
         # Then queue for listeners
-        await self._queue.put(event)
+        if self._overflow == "block":
+            await self._queue.put(event)
+        else:
+            self._enqueue_nowait(event)
+
+    def emit_nowait(self, event: Event) -> None:
+        """
+        Emit an event from synchronous code running on the event loop, such as Logger.
+        The event is queued for the listeners straight away, so the overflow policy bounds
+        memory even with 'block' (see _enqueue_nowait); the transport send is scheduled.
+        """
+        self._add_trace_context(event)
+        if not isinstance(self.transport, NoOpTransport):
+            asyncio.create_task(self._send_to_transport(event))
+        self._enqueue_nowait(event)
 
     def add_listener(self, name: str, listener: EventListener) -> None:
         """Add a listener to the event bus."""
         self.listeners[name] = listener
+        self._update_min_level()
 
     def remove_listener(self, name: str) -> None:
         """Remove a listener from the event bus."""
         self.listeners.pop(name, None)
+        self._update_min_level()
 
     async def _process_events(self) -> None:
-        """Process events from the queue until stopped."""
-        while self._running:
-            event = None
-            try:
-                # Use wait_for with a timeout to allow checking running state
-                try:
-                    # Check if we should be stopping first
-                    if not self._running or self._stop_event.is_set():
-                        break
+        """
+        Deliver queued events to the listeners until cancelled by stop(). Waits on the queue
+        rather than polling, and hands each listener every event that is ready as one batch.
+        """
+        while True:
+            # configure_queue() may swap the queue; finish each batch on the queue it came from
+            queue = self._queue
+            batch = [await queue.get()]
+            if batch[0] is _QUEUE_REPLACED:
+                queue.task_done()
+                continue
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
 
-                    event = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    # Check again before continuing
-                    if not self._running or self._stop_event.is_set():
-                        break
-                    continue
-
-                # Process the event through all listeners
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception as e:
-                        print(f"Error creating listener task: {e}")
-
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for r in results:
-                        if isinstance(r, Exception):
-                            print(f"Error in listener: {r}")
-                            print(
-                                f"Stacktrace: {''.join(traceback.format_exception(type(r), r, r.__traceback__))}"
-                            )
-
-            except asyncio.CancelledError:
-                # If we have a current event, mark it done before breaking
-                if event is not None:
-                    self._queue.task_done()
-                break
+            try:
+                await self._dispatch(batch)
             except Exception as e:
                 print(f"Error in event processing loop: {e}")
             finally:
-                # Always mark the task as done if we got an event
-                if event is not None:
-                    self._queue.task_done()
+                for _ in batch:
+                    queue.task_done()
 
-        # Process remaining events in queue
-        while not self._queue.empty():
-            try:
-                event = self._queue.get_nowait()
-                tasks = []
-                for listener in self.listeners.values():
-                    try:
-                        tasks.append(listener.handle_event(event))
-                    except Exception:
-                        pass
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                self._queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+    async def _dispatch(self, events: List[Event]) -> None:
+        """Hand a batch of events to every listener concurrently."""
+        listeners = list(self.listeners.values())
+        if not listeners:
+            return
+
+        results = await asyncio.gather(
+            *(listener.handle_events(events) for listener in listeners),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, Exception):
+                print(f"Error in listener: {r}")
+                print(
+                    f"Stacktrace: {''.join(traceback.format_exception(type(r), r, r.__traceback__))}"
+                )
 
 
 def create_transport(
@@ -473,6 +745,12 @@ def create_transport(
         return FileTransport(
             filepath=settings.path,
             event_filter=event_filter,
+            batch_size=settings.batch_size,
+            flush_interval=settings.flush_interval,
+            max_bytes=settings.max_file_size,
+            rotate_interval=settings.rotate_interval,
+            backup_count=settings.backup_count,
+            compress=settings.compress_rotated,
         )
     elif settings.type == "http":
         if not settings.http_endpoint:
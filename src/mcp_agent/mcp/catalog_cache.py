@@ -0,0 +1,93 @@
+"""
+On-disk cache of MCP server tool and prompt catalogs.
+
+Entries are keyed by a hash of the settings that determine which server process is
+launched, so changing a server's command, arguments or environment misses the cache.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Tuple
+
+from mcp.types import Prompt, Tool
+
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+CATALOG_CACHE_VERSION = 1
+
+# Settings that identify the server being launched
+_KEY_FIELDS = {"transport", "command", "args", "env", "url", "headers", "cwd"}
+
+
+def catalog_key(server_name: str, server_config: MCPServerSettings) -> str:
+    """Return a stable hash identifying a server's configuration."""
+    identity = server_config.model_dump(mode="json", include=_KEY_FIELDS)
+    payload = json.dumps([server_name, identity], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CatalogCache:
+    """
+    Stores each server's tool and prompt lists as a JSON file in a directory.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, server_name: str, server_config: MCPServerSettings) -> Path:
+        return self.directory / f"{catalog_key(server_name, server_config)}.json"
+
+    def load(
+        self, server_name: str, server_config: MCPServerSettings
+    ) -> Tuple[List[Tool], List[Prompt]] | None:
+        """Return the cached (tools, prompts) for a server, or None if there is no usable entry."""
+        path = self._path(server_name, server_config)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != CATALOG_CACHE_VERSION:
+                return None
+            tools = [Tool.model_validate(tool) for tool in data["tools"]]
+            prompts = [Prompt.model_validate(prompt) for prompt in data["prompts"]]
+            return tools, prompts
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable catalog cache entry for '{server_name}': {e}")
+            return None
+
+    def store(
+        self,
+        server_name: str,
+        server_config: MCPServerSettings,
+        tools: List[Tool],
+        prompts: List[Prompt],
+    ) -> None:
+        """Write a server's catalog, replacing any existing entry atomically."""
+        path = self._path(server_name, server_config)
+        data = {
+            "version": CATALOG_CACHE_VERSION,
+            "server_name": server_name,
+            "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in tools],
+            "prompts": [prompt.model_dump(mode="json", exclude_none=True) for prompt in prompts],
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Unable to write catalog cache for '{server_name}': {e}")
+
+    def invalidate(self, server_name: str, server_config: MCPServerSettings) -> None:
+        """Remove a server's cached catalog."""
+        try:
+            self._path(server_name, server_config).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Unable to remove catalog cache for '{server_name}': {e}")
@@ -7,6 +7,7 @@ from datetime import timedelta
 from typing import (
     Any,
     AsyncContextManager,
+    AsyncIterator,
     Callable,
     Dict,
     List,
@@ -29,6 +30,7 @@ from pydantic import BaseModel
 
 from mcp_agent.core.agent_types import AgentType
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.core.stream_events import StreamEvent
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 
@@ -122,6 +124,26 @@ class AugmentedLLMProtocol(Protocol):
         """
         ...
 
+    def generate_stream(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Apply a list of PromptMessageMultipart messages, yielding events as the response is produced.
+
+        Text deltas and tool call/result events are yielded as they arrive. The final event is
+        a GenerationComplete carrying the same message generate() would have returned.
+
+        Args:
+            multipart_messages: List of PromptMessageMultipart objects
+            request_params: Optional parameters to configure the LLM request
+
+        Returns:
+            An async iterator of StreamEvents
+        """
+        ...
+
     @property
     def message_history(self) -> List[PromptMessageMultipart]:
         """
@@ -132,6 +154,10 @@ class AugmentedLLMProtocol(Protocol):
         """
         ...
 
+    async def shutdown(self) -> None:
+        """Release resources held for the LLM, such as provider HTTP connections"""
+        ...
+
 
 class AgentProtocol(AugmentedLLMProtocol, Protocol):
     """Protocol defining the standard agent interface"""
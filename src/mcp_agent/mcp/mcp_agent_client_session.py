@@ -76,19 +76,19 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
         result_type: type[ReceiveResultT],
         request_read_timeout_seconds: timedelta | None = None,
     ) -> ReceiveResultT:
-        logger.debug("send_request: request=", data=request.model_dump())
+        logger.debug("send_request: request=", data=lambda: request.model_dump())
         try:
             result = await super().send_request(
                 request, result_type, request_read_timeout_seconds=request_read_timeout_seconds
             )
-            logger.debug("send_request: response=", data=result.model_dump())
+            logger.debug("send_request: response=", data=lambda: result.model_dump())
             return result
         except Exception as e:
             logger.error(f"send_request failed: {str(e)}")
             raise
 
     async def send_notification(self, notification: SendNotificationT) -> None:
-        logger.debug("send_notification:", data=notification.model_dump())
+        logger.debug("send_notification:", data=lambda: notification.model_dump())
         try:
             return await super().send_notification(notification)
         except Exception as e:
@@ -100,7 +100,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
     ) -> None:
         logger.debug(
             f"send_response: request_id={request_id}, response=",
-            data=response.model_dump(),
+            data=lambda: response.model_dump(),
         )
         return await super()._send_response(request_id, response)
 
@@ -111,7 +111,7 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
         """
         logger.info(
             "_received_notification: notification=",
-            data=notification.model_dump(),
+            data=lambda: notification.model_dump(),
         )
 
         # Call parent notification handler first
@@ -1,12 +1,16 @@
+import asyncio
+import time
 from asyncio import Lock, gather
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
+    Tuple,
     TypeVar,
 )
 
@@ -23,11 +27,14 @@ from opentelemetry import trace
 from pydantic import AnyUrl, BaseModel, ConfigDict
 
 from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.core.exceptions import ServerInitializationError
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.mcp.catalog_cache import CatalogCache
 from mcp_agent.mcp.gen_client import gen_client
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
 from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
+from mcp_agent.metrics import tool_call_duration
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -62,6 +69,23 @@ class NamespacedTool(BaseModel):
     namespaced_tool_name: str
 
 
+class ToolCatalogSnapshot(BaseModel):
+    """
+    Immutable view of an aggregator's tools, rebuilt only when its tool maps change.
+    """
+
+    version: int = 0
+    """Incremented every time the aggregator's tools change."""
+
+    tools: Tuple[Tool, ...] = ()
+    """All tools, renamed to their namespaced names."""
+
+    local_tool_index: Dict[str, str] = {}
+    """Maps each un-namespaced tool name to the first server providing it."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class MCPAggregator(ContextDependent):
     """
     Aggregates multiple MCP servers. When a developer calls, e.g. call_tool(...),
@@ -133,6 +157,8 @@ class MCPAggregator(ContextDependent):
         # Maps server_name -> list of tools
         self._server_to_tool_map: Dict[str, List[NamespacedTool]] = {}
         self._tool_map_lock = Lock()
+        # Precomputed tool list and lookup index, replaced whenever the maps above change
+        self._tool_snapshot = ToolCatalogSnapshot()
 
         # Cache for prompt objects, maps server_name -> list of prompt objects
         self._prompt_cache: Dict[str, List[Prompt]] = {}
@@ -141,10 +167,16 @@ class MCPAggregator(ContextDependent):
         # Lock for refreshing tools from a server
         self._refresh_lock = Lock()
 
+        # Background refresh of catalogs loaded from the catalog cache
+        self._catalog_refresh_task: asyncio.Task | None = None
+
     async def close(self) -> None:
         """
         Close all persistent connections when the aggregator is deleted.
         """
+        if self._catalog_refresh_task and not self._catalog_refresh_task.done():
+            self._catalog_refresh_task.cancel()
+
         if self.connection_persistence and self._persistent_connection_manager:
             try:
                 # Only attempt cleanup if we own the connection manager
@@ -197,6 +229,10 @@ class MCPAggregator(ContextDependent):
         """
         Discover tools from each server in parallel and build an index of namespaced tool names.
         Also populate the prompt cache.
+
+        If mcp.catalog_cache_dir is configured and every server has a cached catalog, the
+        aggregator is ready immediately from the cache, and the servers are connected and
+        their catalogs refreshed in the background.
         """
         if self.initialized:
             logger.debug("MCPAggregator already initialized.")
@@ -205,35 +241,33 @@ class MCPAggregator(ContextDependent):
         async with self._tool_map_lock:
             self._namespaced_tool_map.clear()
             self._server_to_tool_map.clear()
+            self._rebuild_tool_snapshot()
 
         async with self._prompt_cache_lock:
             self._prompt_cache.clear()
 
-        for server_name in self.server_names:
-            if self.connection_persistence:
-                logger.info(
-                    f"Creating persistent connection to server: {server_name}",
-                    data={
-                        "progress_action": ProgressAction.STARTING,
-                        "server_name": server_name,
-                        "agent_name": self.agent_name,
-                    },
-                )
+        cached_catalogs = self._load_cached_catalogs()
+        if cached_catalogs is not None:
+            logger.debug(f"Loaded tool catalogs for agent '{self.agent_name}' from cache")
+            await self._index_catalogs(
+                (server_name, tools, prompts)
+                for server_name, (tools, prompts) in cached_catalogs.items()
+            )
+            self.initialized = True
+            self._catalog_refresh_task = asyncio.create_task(self._refresh_catalogs())
+            return
 
-                # Create a wrapper to capture the parameters for the client session
-                def session_factory(read_stream, write_stream, read_timeout):
-                    return MCPAgentClientSession(
-                        read_stream,
-                        write_stream,
-                        read_timeout,
-                        server_name=server_name,
-                        tool_list_changed_callback=self._handle_tool_list_changed
-                    )
+        await self._index_catalogs(await self._fetch_server_catalogs())
 
-                await self._persistent_connection_manager.get_server(
-                    server_name,
-                    client_session_factory=session_factory
-                )
+        self.initialized = True
+
+    async def _fetch_server_catalogs(self) -> List[Tuple[str, List[Tool], List[Prompt]]]:
+        """
+        Connect to the servers and fetch their tools and prompts concurrently, updating the
+        catalog cache if one is configured. Servers that fail to respond are logged and omitted.
+        """
+        if self.connection_persistence:
+            await self._start_persistent_servers()
 
             logger.info(
                 f"MCP Servers initialized for agent '{self.agent_name}'",
@@ -243,7 +277,7 @@ class MCPAggregator(ContextDependent):
                 },
             )
 
-        async def fetch_tools(client: ClientSession):
+        async def fetch_tools(client: ClientSession, server_name: str) -> List[Tool]:
             try:
                 result: ListToolsResult = await client.list_tools()
                 return result.tools or []
@@ -272,7 +306,7 @@ class MCPAggregator(ContextDependent):
                 server_connection = await self._persistent_connection_manager.get_server(
                     server_name, client_session_factory=MCPAgentClientSession
                 )
-                tools = await fetch_tools(server_connection.session)
+                tools = await fetch_tools(server_connection.session, server_name)
                 prompts = await fetch_prompts(server_connection.session, server_name)
             else:
                 # Create a factory function for the client session
@@ -282,15 +316,15 @@ class MCPAggregator(ContextDependent):
                         write_stream,
                         read_timeout,
                         server_name=server_name,
-                        tool_list_changed_callback=self._handle_tool_list_changed
+                        tool_list_changed_callback=self._handle_tool_list_changed,
                     )
 
                 async with gen_client(
                     server_name,
                     server_registry=self.context.server_registry,
-                    client_session_factory=create_session
+                    client_session_factory=create_session,
                 ) as client:
-                    tools = await fetch_tools(client)
+                    tools = await fetch_tools(client, server_name)
                     prompts = await fetch_prompts(client, server_name)
 
             return server_name, tools, prompts
@@ -301,30 +335,39 @@ class MCPAggregator(ContextDependent):
             return_exceptions=True,
         )
 
+        catalogs = []
+        catalog_cache = self._catalog_cache()
         for result in results:
             if isinstance(result, BaseException):
                 logger.error(f"Error loading server data: {result}")
                 continue
 
+            catalogs.append(result)
             server_name, tools, prompts = result
+            server_config = self.context.server_registry.get_server_config(server_name)
+            if catalog_cache and server_config:
+                catalog_cache.store(server_name, server_config, tools, prompts)
 
-            # Process tools
-            self._server_to_tool_map[server_name] = []
-            for tool in tools:
-                namespaced_tool_name = create_namespaced_name(server_name, tool.name)
-                namespaced_tool = NamespacedTool(
-                    tool=tool,
-                    server_name=server_name,
-                    namespaced_tool_name=namespaced_tool_name,
-                )
+        return catalogs
 
-                self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
-                self._server_to_tool_map[server_name].append(namespaced_tool)
+    async def _index_catalogs(
+        self, catalogs: Iterable[Tuple[str, List[Tool], List[Prompt]]]
+    ) -> None:
+        """
+        Replace the indexed tools and cached prompts for each (server_name, tools, prompts)
+        entry. The tool snapshot is rebuilt once, after all servers are indexed.
+        """
+        catalogs = list(catalogs)
+        async with self._tool_map_lock:
+            for server_name, tools, _ in catalogs:
+                self._replace_server_tools(server_name, tools)
+            self._rebuild_tool_snapshot()
 
-            # Process prompts
-            async with self._prompt_cache_lock:
+        async with self._prompt_cache_lock:
+            for server_name, _, prompts in catalogs:
                 self._prompt_cache[server_name] = prompts
 
+        for server_name, tools, prompts in catalogs:
             logger.debug(
                 f"MCP Aggregator initialized for server '{server_name}'",
                 data={
@@ -336,7 +379,134 @@ class MCPAggregator(ContextDependent):
                 },
             )
 
-        self.initialized = True
+    async def _index_server_tools(self, server_name: str, tools: List[Tool]) -> None:
+        """Replace the namespaced tool entries for a server."""
+        async with self._tool_map_lock:
+            self._replace_server_tools(server_name, tools)
+            self._rebuild_tool_snapshot()
+
+    def _replace_server_tools(self, server_name: str, tools: List[Tool]) -> None:
+        """Replace a server's entries in the tool maps. Call with the tool map lock held."""
+        # Remove old tools for this server
+        for old_tool in self._server_to_tool_map.get(server_name, []):
+            self._namespaced_tool_map.pop(old_tool.namespaced_tool_name, None)
+
+        self._server_to_tool_map[server_name] = []
+        for tool in tools:
+            namespaced_tool_name = create_namespaced_name(server_name, tool.name)
+            namespaced_tool = NamespacedTool(
+                tool=tool,
+                server_name=server_name,
+                namespaced_tool_name=namespaced_tool_name,
+            )
+
+            self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
+            self._server_to_tool_map[server_name].append(namespaced_tool)
+
+    def _rebuild_tool_snapshot(self) -> None:
+        """Replace the tool snapshot from the current tool maps. Call with the tool map lock held."""
+        local_tool_index: Dict[str, str] = {}
+        for server_name, tools in self._server_to_tool_map.items():
+            for namespaced_tool in tools:
+                local_tool_index.setdefault(namespaced_tool.tool.name, server_name)
+
+        self._tool_snapshot = ToolCatalogSnapshot(
+            version=self._tool_snapshot.version + 1,
+            tools=tuple(
+                namespaced_tool.tool.model_copy(update={"name": namespaced_tool_name})
+                for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items()
+            ),
+            local_tool_index=local_tool_index,
+        )
+
+    @property
+    def tool_catalog_version(self) -> int:
+        """Version of the aggregated tool list; changes whenever tools are loaded or refreshed."""
+        return self._tool_snapshot.version
+
+    def _catalog_cache(self) -> CatalogCache | None:
+        """Return the configured catalog cache, or None if caching is disabled."""
+        mcp_settings = self.context.config.mcp if self.context.config else None
+        if not mcp_settings or not mcp_settings.catalog_cache_dir:
+            return None
+        return CatalogCache(mcp_settings.catalog_cache_dir)
+
+    def _load_cached_catalogs(self) -> Dict[str, Tuple[List[Tool], List[Prompt]]] | None:
+        """Return cached catalogs for all servers, or None unless every server has an entry."""
+        catalog_cache = self._catalog_cache()
+        if not catalog_cache or not self.server_names:
+            return None
+
+        catalogs = {}
+        for server_name in self.server_names:
+            server_config = self.context.server_registry.get_server_config(server_name)
+            entry = catalog_cache.load(server_name, server_config) if server_config else None
+            if entry is None:
+                return None
+            catalogs[server_name] = entry
+        return catalogs
+
+    async def _refresh_catalogs(self) -> None:
+        """Connect to the servers and replace cached catalogs with live ones."""
+        try:
+            await self._index_catalogs(await self._fetch_server_catalogs())
+        except Exception as e:
+            logger.error(f"Error refreshing cached catalogs for agent '{self.agent_name}': {e}")
+
+    async def _start_persistent_servers(self) -> None:
+        """
+        Launch and initialize persistent connections to all servers concurrently, bounded by
+        mcp.max_concurrent_startups. Each server's startup_timeout_seconds applies to it alone.
+        If any server fails, the first failure is raised once the others have finished starting.
+        """
+        mcp_settings = self.context.config.mcp if self.context.config else None
+        limit = mcp_settings.max_concurrent_startups if mcp_settings else 8
+        semaphore = asyncio.Semaphore(limit)
+
+        async def start_server(server_name: str) -> None:
+            def session_factory(read_stream, write_stream, read_timeout):
+                return MCPAgentClientSession(
+                    read_stream,
+                    write_stream,
+                    read_timeout,
+                    server_name=server_name,
+                    tool_list_changed_callback=self._handle_tool_list_changed,
+                )
+
+            server_config = self.context.server_registry.get_server_config(server_name)
+            timeout = server_config.startup_timeout_seconds if server_config else None
+
+            async with semaphore:
+                logger.info(
+                    f"Creating persistent connection to server: {server_name}",
+                    data={
+                        "progress_action": ProgressAction.STARTING,
+                        "server_name": server_name,
+                        "agent_name": self.agent_name,
+                    },
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._persistent_connection_manager.get_server(
+                            server_name, client_session_factory=session_factory
+                        ),
+                        timeout,
+                    )
+                except asyncio.TimeoutError:
+                    await self._persistent_connection_manager.disconnect_server(server_name)
+                    raise ServerInitializationError(
+                        f"MCP Server: '{server_name}': Timed out during startup",
+                        f"The server did not initialize within {timeout} seconds "
+                        "(startup_timeout_seconds)",
+                    )
+
+        results = await gather(
+            *(start_server(server_name) for server_name in self.server_names),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def get_capabilities(self, server_name: str):
         """Get server capabilities if available."""
@@ -399,16 +569,15 @@ class MCPAggregator(ContextDependent):
     async def list_tools(self) -> ListToolsResult:
         """
         :return: Tools from all servers aggregated, and renamed to be dot-namespaced by server name.
+
+        The list is a copy and can be changed freely, but the Tool objects in it are shared with
+        the aggregator's snapshot and must not be modified; use tool.model_copy() to change one.
         """
         if not self.initialized:
             await self.load_servers()
 
-        return ListToolsResult(
-            tools=[
-                namespaced_tool.tool.model_copy(update={"name": namespaced_tool_name})
-                for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items()
-            ]
-        )
+        # Copy the list so callers can extend the result without altering the snapshot
+        return ListToolsResult(tools=list(self._tool_snapshot.tools))
 
     async def refresh_all_tools(self) -> None:
         """
@@ -459,10 +628,10 @@ class MCPAggregator(ContextDependent):
                     raise e
 
         if self.connection_persistence:
-            server_connection = await self._persistent_connection_manager.get_server(
+            async with self._persistent_connection_manager.acquire(
                 server_name, client_session_factory=MCPAgentClientSession
-            )
-            return await try_execute(server_connection.session)
+            ) as server_connection:
+                return await try_execute(server_connection.session)
         else:
             logger.debug(
                 f"Creating temporary connection to server: {server_name}",
@@ -517,10 +686,9 @@ class MCPAggregator(ContextDependent):
 
         # For tools, search all servers for the tool by exact name match
         if resource_type == "tool":
-            for server_name, tools in self._server_to_tool_map.items():
-                for namespaced_tool in tools:
-                    if namespaced_tool.tool.name == name:
-                        return server_name, name
+            server_name = self._tool_snapshot.local_tool_index.get(name)
+            if server_name is not None:
+                return server_name, name
 
         # For all other resource types, use the first server
         return (self.server_names[0] if self.server_names else None, name)
@@ -554,9 +722,12 @@ class MCPAggregator(ContextDependent):
 
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"MCP Tool: {server_name}/{local_tool_name}"):
-            trace.get_current_span().set_attribute("tool_name", local_tool_name)
-            trace.get_current_span().set_attribute("server_name", server_name)
-            return await self._execute_on_server(
+            span = trace.get_current_span()
+            if span.is_recording():
+                span.set_attribute("tool_name", local_tool_name)
+                span.set_attribute("server_name", server_name)
+            start = time.perf_counter()
+            result = await self._execute_on_server(
                 server_name=server_name,
                 operation_type="tool",
                 operation_name=local_tool_name,
@@ -569,6 +740,11 @@ class MCPAggregator(ContextDependent):
                     isError=True, content=[TextContent(type="text", text=msg)]
                 ),
             )
+            tool_call_duration.record(
+                time.perf_counter() - start,
+                {"server": server_name, "tool": local_tool_name, "error": bool(result.isError)},
+            )
+            return result
 
     async def get_prompt(
         self,
@@ -909,6 +1085,11 @@ class MCPAggregator(ContextDependent):
         """
         logger.info(f"Tool list changed for server '{server_name}', refreshing tools")
 
+        catalog_cache = self._catalog_cache()
+        server_config = self.context.server_registry.get_server_config(server_name)
+        if catalog_cache and server_config:
+            catalog_cache.invalidate(server_name, server_config)
+
         # Refresh the tools for this server
         await self._refresh_server_tools(server_name)
 
@@ -934,12 +1115,11 @@ class MCPAggregator(ContextDependent):
                             write_stream,
                             read_timeout,
                             server_name=server_name,
-                            tool_list_changed_callback=self._handle_tool_list_changed
+                            tool_list_changed_callback=self._handle_tool_list_changed,
                         )
 
                     server_connection = await self._persistent_connection_manager.get_server(
-                        server_name,
-                        client_session_factory=create_session
+                        server_name, client_session_factory=create_session
                     )
                     tools_result = await server_connection.session.list_tools()
                     new_tools = tools_result.tools or []
@@ -951,37 +1131,26 @@ class MCPAggregator(ContextDependent):
                             write_stream,
                             read_timeout,
                             server_name=server_name,
-                            tool_list_changed_callback=self._handle_tool_list_changed
+                            tool_list_changed_callback=self._handle_tool_list_changed,
                         )
 
                     async with gen_client(
                         server_name,
                         server_registry=self.context.server_registry,
-                        client_session_factory=create_session
+                        client_session_factory=create_session,
                     ) as client:
                         tools_result = await client.list_tools()
                         new_tools = tools_result.tools or []
 
-                # Update tool maps
-                async with self._tool_map_lock:
-                    # Remove old tools for this server
-                    old_tools = self._server_to_tool_map.get(server_name, [])
-                    for old_tool in old_tools:
-                        if old_tool.namespaced_tool_name in self._namespaced_tool_map:
-                            del self._namespaced_tool_map[old_tool.namespaced_tool_name]
-
-                    # Add new tools
-                    self._server_to_tool_map[server_name] = []
-                    for tool in new_tools:
-                        namespaced_tool_name = create_namespaced_name(server_name, tool.name)
-                        namespaced_tool = NamespacedTool(
-                            tool=tool,
-                            server_name=server_name,
-                            namespaced_tool_name=namespaced_tool_name,
-                        )
+                await self._index_server_tools(server_name, new_tools)
 
-                        self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
-                        self._server_to_tool_map[server_name].append(namespaced_tool)
+                # Write the new catalog back, so the next start can use the cache again
+                catalog_cache = self._catalog_cache()
+                server_config = self.context.server_registry.get_server_config(server_name)
+                if catalog_cache and server_config:
+                    async with self._prompt_cache_lock:
+                        prompts = list(self._prompt_cache.get(server_name, []))
+                    catalog_cache.store(server_name, server_config, new_tools, prompts)
 
                 logger.info(
                     f"Successfully refreshed tools for server '{server_name}'",
@@ -3,14 +3,19 @@ Manages the lifecycle of multiple MCP server connections.
 """
 
 import asyncio
+import time
 import traceback
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
+    AsyncIterator,
     Callable,
     Dict,
+    List,
     Optional,
+    Tuple,
 )
 
 from anyio import Event, Lock, create_task_group
@@ -33,6 +38,7 @@ from mcp_agent.event_progress import ProgressAction
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.logger_textio import get_stderr_handler
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
+from mcp_agent.metrics import mcp_connection_errors, mcp_connections
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -40,6 +46,11 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# After repeated pool member failures, wait this long before starting another member,
+# doubling with each further failure up to the maximum
+POOL_RETRY_DELAY = 1.0
+POOL_RETRY_MAX_DELAY = 60.0
+
 
 class StreamingContextAdapter:
     """Adapter to provide a 3-value context from a 2-value context manager"""
@@ -106,10 +117,17 @@ class ServerConnection:
         self._error_occurred = False
         self._error_message = None
 
+        # Requests currently in flight on this connection (for pool load balancing)
+        self.outstanding = 0
+
     def is_healthy(self) -> bool:
         """Check if the server connection is healthy and ready to use."""
         return self.session is not None and not self._error_occurred
 
+    def is_ready(self) -> bool:
+        """Check if the connection has finished initializing and is healthy."""
+        return self._initialized_event.is_set() and self.is_healthy()
+
     def reset_error_state(self) -> None:
         """Reset the error state, allowing reconnection attempts."""
         self._error_occurred = False
@@ -182,6 +200,7 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
     Runs inside the MCPConnectionManager's shared TaskGroup.
     """
     server_name = server_conn.server_name
+    connected = False
     try:
         transport_context = server_conn._transport_context_factory()
 
@@ -190,6 +209,8 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
 
             async with server_conn.session:
                 await server_conn.initialize_session()
+                mcp_connections.add(1, {"server": server_name})
+                connected = True
                 await server_conn.wait_for_shutdown_request()
 
     except HTTPStatusError as http_exc:
@@ -201,6 +222,7 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
                 "server_name": server_name,
             },
         )
+        mcp_connection_errors.add(1, {"server": server_name})
         server_conn._error_occurred = True
         server_conn._error_message = f"HTTP Error: {http_exc.response.status_code} {http_exc.response.reason_phrase} for URL: {http_exc.request.url}"
         server_conn._initialized_event.set()
@@ -215,6 +237,7 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
                 "server_name": server_name,
             },
         )
+        mcp_connection_errors.add(1, {"server": server_name})
         server_conn._error_occurred = True
 
         if "ExceptionGroup" in type(exc).__name__ and hasattr(exc, "exceptions"):
@@ -242,6 +265,10 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
         server_conn._initialized_event.set()
         # No raise - allow graceful exit
 
+    finally:
+        if connected:
+            mcp_connections.add(-1, {"server": server_name})
+
 
 class MCPConnectionManager(ContextDependent):
     """
@@ -255,6 +282,10 @@ class MCPConnectionManager(ContextDependent):
         super().__init__(context=context)
         self.server_registry = server_registry
         self.running_servers: Dict[str, ServerConnection] = {}
+        # Additional sessions for servers configured with pool_size > 1
+        self._pool_members: Dict[str, List[ServerConnection]] = {}
+        # Consecutive pool member failures for each server, and when to start the next member
+        self._pool_failures: Dict[str, Tuple[int, float]] = {}
         self._lock = Lock()
         # Manage our own task group - independent of task context
         self._task_group = None
@@ -312,7 +343,38 @@ class MCPConnectionManager(ContextDependent):
         if not config:
             raise ValueError(f"Server '{server_name}' not found in registry.")
 
-        logger.debug(f"{server_name}: Found server configuration=", data=config.model_dump())
+        logger.debug(
+            f"{server_name}: Found server configuration=", data=lambda: config.model_dump()
+        )
+
+        server_conn = self._create_server_connection(
+            server_name, config, client_session_factory, init_hook
+        )
+
+        async with self._lock:
+            # Check if already running
+            if server_name in self.running_servers:
+                return self.running_servers[server_name]
+
+            self.running_servers[server_name] = server_conn
+            self._tg.start_soon(_server_lifecycle_task, server_conn)
+
+        logger.info(f"{server_name}: Up and running with a persistent connection!")
+        return server_conn
+
+    def _create_server_connection(
+        self,
+        server_name: str,
+        config: MCPServerSettings,
+        client_session_factory: Callable[
+            [MemoryObjectReceiveStream, MemoryObjectSendStream, timedelta | None],
+            ClientSession,
+        ],
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> ServerConnection:
+        """
+        Create (but do not start) a connection to the configured server.
+        """
 
         def transport_context_factory():
             if config.transport == "stdio":
@@ -340,7 +402,7 @@ class MCPConnectionManager(ContextDependent):
             else:
                 raise ValueError(f"Unsupported transport: {config.transport}")
 
-        server_conn = ServerConnection(
+        return ServerConnection(
             server_name=server_name,
             server_config=config,
             transport_context_factory=transport_context_factory,
@@ -348,17 +410,6 @@ class MCPConnectionManager(ContextDependent):
             init_hook=init_hook or self.server_registry.init_hooks.get(server_name),
         )
 
-        async with self._lock:
-            # Check if already running
-            if server_name in self.running_servers:
-                return self.running_servers[server_name]
-
-            self.running_servers[server_name] = server_conn
-            self._tg.start_soon(_server_lifecycle_task, server_conn)
-
-        logger.info(f"{server_name}: Up and running with a persistent connection!")
-        return server_conn
-
     async def get_server(
         self,
         server_name: str,
@@ -374,18 +425,22 @@ class MCPConnectionManager(ContextDependent):
             if server_conn and server_conn.is_healthy():
                 return server_conn
 
-            # If server exists but isn't healthy, remove it so we can create a new one
-            if server_conn:
+            # If server exists but isn't healthy, remove it so we can create a new one.
+            # A server still starting (e.g. for another agent initializing concurrently)
+            # has no session yet, so wait for it instead.
+            if server_conn and server_conn._initialized_event.is_set():
                 logger.info(f"{server_name}: Server exists but is unhealthy, recreating...")
                 self.running_servers.pop(server_name)
                 server_conn.request_shutdown()
+                server_conn = None
 
         # Launch the connection
-        server_conn = await self.launch_server(
-            server_name=server_name,
-            client_session_factory=client_session_factory,
-            init_hook=init_hook,
-        )
+        if server_conn is None:
+            server_conn = await self.launch_server(
+                server_name=server_name,
+                client_session_factory=client_session_factory,
+                init_hook=init_hook,
+            )
 
         # Wait until it's fully initialized, or an error occurs
         await server_conn.wait_for_initialized()
@@ -406,8 +461,81 @@ class MCPConnectionManager(ContextDependent):
                 formatted_error,
             )
 
+        if server_conn.server_config.pool_size > 1:
+            async with self._lock:
+                self._fill_pool(server_name, server_conn, client_session_factory, init_hook)
+
         return server_conn
 
+    def _fill_pool(
+        self,
+        server_name: str,
+        primary: ServerConnection,
+        client_session_factory: Callable,
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> List[ServerConnection]:
+        """
+        Replace failed pool members and start any that are missing, without waiting for them
+        to initialize. Must be called with the lock held. Returns the members ready for use,
+        starting with the primary connection.
+
+        A failed member is replaced straight away, but if its replacements keep failing
+        (e.g. the server is broken) new members are started with an increasing delay.
+        """
+        members = self._pool_members.setdefault(server_name, [])
+        pool_size = primary.server_config.pool_size - 1
+        failures, retry_at = self._pool_failures.get(server_name, (0, 0.0))
+
+        for member in [m for m in members if m._initialized_event.is_set() and not m.is_healthy()]:
+            members.remove(member)
+            member.request_shutdown()
+            failures += 1
+            delay = 0.0
+            if failures > 1:
+                delay = min(POOL_RETRY_DELAY * 2 ** (failures - 2), POOL_RETRY_MAX_DELAY)
+            retry_at = time.monotonic() + delay
+            logger.warning(
+                f"{server_name}: Pool member is unhealthy, replacing in {delay:.0f}s",
+                data={"failures": failures, "error": member._error_message},
+            )
+
+        if len(members) == pool_size and all(m.is_ready() for m in members):
+            failures = 0
+        self._pool_failures[server_name] = (failures, retry_at)
+
+        if time.monotonic() >= retry_at:
+            while len(members) < pool_size:
+                member = self._create_server_connection(
+                    server_name, primary.server_config, client_session_factory, init_hook
+                )
+                members.append(member)
+                self._tg.start_soon(_server_lifecycle_task, member)
+
+        return [primary] + [m for m in members if m.is_ready()]
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        server_name: str,
+        client_session_factory: Callable,
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> AsyncIterator[ServerConnection]:
+        """
+        Borrow a connection for a single request. For pooled servers this is the ready
+        member with the fewest requests in flight; otherwise it is the server's only connection.
+        """
+        server_conn = await self.get_server(server_name, client_session_factory, init_hook)
+        if server_conn.server_config.pool_size > 1:
+            async with self._lock:
+                ready = self._fill_pool(server_name, server_conn, client_session_factory, init_hook)
+            server_conn = min(ready, key=lambda member: member.outstanding)
+
+        server_conn.outstanding += 1
+        try:
+            yield server_conn
+        finally:
+            server_conn.outstanding -= 1
+
     async def get_server_capabilities(self, server_name: str) -> ServerCapabilities | None:
         """Get the capabilities of a specific server."""
         server_conn = await self.get_server(
@@ -423,6 +551,9 @@ class MCPConnectionManager(ContextDependent):
 
         async with self._lock:
             server_conn = self.running_servers.pop(server_name, None)
+            for member in self._pool_members.pop(server_name, []):
+                member.request_shutdown()
+            self._pool_failures.pop(server_name, None)
         if server_conn:
             server_conn.request_shutdown()
             logger.info(f"{server_name}: Shutdown signal sent (lifecycle task will exit).")
@@ -440,8 +571,12 @@ class MCPConnectionManager(ContextDependent):
 
             # Make a copy of the servers to shut down
             servers_to_shutdown = list(self.running_servers.items())
-            # Clear the dict immediately to prevent any new access
+            for name, members in self._pool_members.items():
+                servers_to_shutdown.extend((name, member) for member in members)
+            # Clear the dicts immediately to prevent any new access
             self.running_servers.clear()
+            self._pool_members.clear()
+            self._pool_failures.clear()
 
         # Release the lock before waiting for servers to shut down
         for name, conn in servers_to_shutdown:
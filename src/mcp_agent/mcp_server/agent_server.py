@@ -10,15 +10,21 @@ from typing import Set
 
 from mcp.server.fastmcp import Context as MCPContext
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
 import mcp_agent
 import mcp_agent.core
 import mcp_agent.core.prompt
 from mcp_agent.core.agent_app import AgentApp
+from mcp_agent.core.stream_events import GenerationComplete, TextDelta
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.metrics import prometheus_text
 
 logger = get_logger(__name__)
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 class AgentMCPServer:
     """Exposes FastAgent agents as MCP tools through an MCP server."""
@@ -50,6 +56,7 @@ class AgentMCPServer:
 
         # Set up agent tools
         self.setup_tools()
+        self.setup_metrics_route()
 
         logger.info(f"AgentMCPServer initialized with {len(agent_app._agents)} agents")
 
@@ -58,6 +65,16 @@ class AgentMCPServer:
         for agent_name, agent in self.agent_app._agents.items():
             self.register_agent_tools(agent_name, agent)
 
+    def setup_metrics_route(self) -> None:
+        """Serve metrics in Prometheus text format at /metrics (SSE/HTTP transports)."""
+
+        @self.mcp_server.custom_route("/metrics", methods=["GET"])
+        async def metrics_endpoint(request: Request) -> Response:
+            text = prometheus_text()
+            if text is None:
+                return PlainTextResponse("Prometheus metrics are not enabled", status_code=404)
+            return PlainTextResponse(text, media_type=PROMETHEUS_CONTENT_TYPE)
+
     def register_agent_tools(self, agent_name: str, agent) -> None:
         """Register tools for a specific agent."""
 
@@ -73,6 +90,9 @@ class AgentMCPServer:
 
             # Define the function to execute
             async def execute_send():
+                # Stream when the client asked for progress, reporting characters generated
+                if ctx and ctx.request_context.meta and ctx.request_context.meta.progressToken:
+                    return await self._send_streaming(agent, message, ctx)
                 return await agent.send(message)
 
             # Execute with bridged context
@@ -100,6 +120,18 @@ class AgentMCPServer:
             # that matches the structure that FastMCP expects (list of dicts with role/content)
             return [{"role": msg.role, "content": msg.content} for msg in prompt_messages]
 
+    async def _send_streaming(self, agent, message: str, ctx: MCPContext) -> str:
+        """Send a message using generate_stream(), reporting progress as text arrives."""
+        prompt = mcp_agent.core.prompt.Prompt.user(message)
+        generated = 0
+        async for event in agent.generate_stream([prompt]):
+            if isinstance(event, TextDelta):
+                generated += len(event.text)
+                await ctx.report_progress(generated)
+            elif isinstance(event, GenerationComplete):
+                return event.message.all_text()
+        return ""
+
     def _setup_signal_handlers(self):
         """Set up signal handlers for graceful and forced shutdown."""
         loop = asyncio.get_running_loop()
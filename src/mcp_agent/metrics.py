@@ -0,0 +1,287 @@
+"""
+Metrics for LLM requests, tool calls, MCP connections, executor retries and worker pools,
+the event bus and workflow steps.
+
+Instruments are created from the global OpenTelemetry meter, so recording is a no-op until
+configure_metrics() installs a MeterProvider. Metrics are exported via OTLP and, when enabled,
+rendered in Prometheus text format for the MCP server's /metrics route.
+"""
+
+import math
+import re
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader, MetricsData
+
+    from mcp_agent.config import OpenTelemetrySettings
+
+# Bucket boundaries in seconds, from fast tool calls up to long generations
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+_meter = metrics.get_meter("fast-agent")
+
+llm_request_duration = _meter.create_histogram(
+    "fast_agent.llm.request.duration",
+    unit="s",
+    description="Duration of LLM provider requests",
+    explicit_bucket_boundaries_advisory=DURATION_BUCKETS,
+)
+llm_tokens = _meter.create_counter(
+    "fast_agent.llm.tokens",
+    unit="{token}",
+    description="Tokens sent to and received from LLM providers",
+)
+tool_call_duration = _meter.create_histogram(
+    "fast_agent.tool.call.duration",
+    unit="s",
+    description="Duration of MCP tool calls",
+    explicit_bucket_boundaries_advisory=DURATION_BUCKETS,
+)
+mcp_connections = _meter.create_up_down_counter(
+    "fast_agent.mcp.connections",
+    unit="{connection}",
+    description="Initialized MCP server connections",
+)
+mcp_connection_errors = _meter.create_counter(
+    "fast_agent.mcp.connection.errors",
+    unit="{error}",
+    description="MCP server connections that failed",
+)
+task_retries = _meter.create_counter(
+    "fast_agent.executor.retries",
+    unit="{retry}",
+    description="Executor task attempts retried after a transient error",
+)
+task_retry_outcomes = _meter.create_counter(
+    "fast_agent.executor.retry.outcomes",
+    unit="{task}",
+    description="Final outcomes of executor tasks that were retried",
+)
+task_timeouts = _meter.create_counter(
+    "fast_agent.executor.timeouts",
+    unit="{task}",
+    description="Executor tasks that ran past their deadline",
+)
+workflow_step_duration = _meter.create_histogram(
+    "fast_agent.workflow.step.duration",
+    unit="s",
+    description="Duration of workflow agent steps",
+    explicit_bucket_boundaries_advisory=DURATION_BUCKETS,
+)
+
+
+def _observe_queue_depth(options: CallbackOptions) -> Iterable[Observation]:
+    from mcp_agent.logging.transport import AsyncEventBus
+
+    bus = AsyncEventBus._instance
+    if bus is not None:
+        yield Observation(bus._queue.qsize())
+
+
+def _observe_dropped_events(options: CallbackOptions) -> Iterable[Observation]:
+    from mcp_agent.logging.transport import AsyncEventBus
+
+    bus = AsyncEventBus._instance
+    if bus is not None:
+        for event_type, count in bus.dropped_events.items():
+            yield Observation(count, {"event_type": event_type})
+
+
+def _observe_pool_tasks(options: CallbackOptions) -> Iterable[Observation]:
+    from mcp_agent.executor.executor import AsyncioExecutor
+
+    # Tasks beyond the worker count are waiting for a free worker
+    totals: dict[tuple[str, str], int] = {}
+    for executor in list(AsyncioExecutor.instances):
+        for pool, (in_flight, size) in executor.pool_usage().items():
+            for state, count in (
+                ("active", min(in_flight, size)),
+                ("queued", max(in_flight - size, 0)),
+            ):
+                totals[pool, state] = totals.get((pool, state), 0) + count
+    for (pool, state), count in totals.items():
+        yield Observation(count, {"pool": pool, "state": state})
+
+
+def _observe_pool_workers(options: CallbackOptions) -> Iterable[Observation]:
+    from mcp_agent.executor.executor import AsyncioExecutor
+
+    totals: dict[str, int] = {}
+    for executor in list(AsyncioExecutor.instances):
+        for pool, (_, size) in executor.pool_usage().items():
+            totals[pool] = totals.get(pool, 0) + size
+    for pool, size in totals.items():
+        yield Observation(size, {"pool": pool})
+
+
+_meter.create_observable_gauge(
+    "fast_agent.event_bus.queue_depth",
+    callbacks=[_observe_queue_depth],
+    unit="{event}",
+    description="Events waiting in the event bus queue",
+)
+_meter.create_observable_counter(
+    "fast_agent.event_bus.dropped_events",
+    callbacks=[_observe_dropped_events],
+    unit="{event}",
+    description="Events dropped because the event bus queue was full",
+)
+_meter.create_observable_gauge(
+    "fast_agent.executor.pool.tasks",
+    callbacks=[_observe_pool_tasks],
+    unit="{task}",
+    description="Tasks running on (active) or waiting for (queued) executor worker pools",
+)
+_meter.create_observable_gauge(
+    "fast_agent.executor.pool.workers",
+    callbacks=[_observe_pool_workers],
+    unit="{worker}",
+    description="Workers in each executor pool",
+)
+
+
+def record_llm_request(
+    provider: str,
+    model: str | None,
+    duration: float,
+    input_tokens: int | None = None,
+    output_tokens: int | None = None,
+    error: bool = False,
+) -> None:
+    """Record the latency and token usage of a single provider request."""
+    attributes = {"provider": provider, "model": model or "unknown", "error": error}
+    llm_request_duration.record(duration, attributes)
+    if input_tokens:
+        llm_tokens.add(input_tokens, {**attributes, "direction": "input"})
+    if output_tokens:
+        llm_tokens.add(output_tokens, {**attributes, "direction": "output"})
+
+
+@contextmanager
+def workflow_step(workflow: str, agent: str, step: str) -> Iterator[None]:
+    """Time a step of a workflow agent."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        workflow_step_duration.record(
+            time.perf_counter() - start, {"workflow": workflow, "agent": agent, "step": step}
+        )
+
+
+_prometheus_reader: "InMemoryMetricReader | None" = None
+
+
+def configure_metrics(settings: "OpenTelemetrySettings", resource=None) -> None:
+    """
+    Install a MeterProvider exporting via OTLP (when OTEL is enabled) and/or keeping
+    cumulative values for the Prometheus endpoint.
+    """
+    global _prometheus_reader
+
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import (
+        InMemoryMetricReader,
+        PeriodicExportingMetricReader,
+    )
+
+    readers = []
+    endpoint = settings.otlp_metrics_endpoint or (
+        settings.otlp_endpoint.replace("/v1/traces", "/v1/metrics")
+        if settings.otlp_endpoint
+        else None
+    )
+    if settings.enabled and endpoint:
+        readers.append(
+            PeriodicExportingMetricReader(
+                OTLPMetricExporter(endpoint=endpoint),
+                export_interval_millis=settings.metrics_export_interval_millis,
+            )
+        )
+    if settings.prometheus:
+        _prometheus_reader = InMemoryMetricReader()
+        readers.append(_prometheus_reader)
+
+    if readers:
+        kwargs = {"resource": resource} if resource is not None else {}
+        metrics.set_meter_provider(MeterProvider(metric_readers=readers, **kwargs))
+
+
+def prometheus_text() -> str | None:
+    """Current metric values in Prometheus text format, or None if the endpoint is disabled."""
+    if _prometheus_reader is None:
+        return None
+    return render_prometheus(_prometheus_reader.get_metrics_data())
+
+
+def _prometheus_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+
+
+def _prometheus_labels(attributes, extra: dict[str, str] | None = None) -> str:
+    labels = {**{_prometheus_name(k): v for k, v in (attributes or {}).items()}, **(extra or {})}
+    if not labels:
+        return ""
+    values = (
+        str(value).lower() if isinstance(value, bool) else str(value) for value in labels.values()
+    )
+    escaped = (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for value in values
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+def _prometheus_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(data: "MetricsData | None") -> str:
+    """Render collected OTEL metrics in the Prometheus text exposition format."""
+    from opentelemetry.sdk.metrics.export import Histogram, Sum
+
+    lines: list[str] = []
+    for resource_metrics in data.resource_metrics if data else ():
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                name = _prometheus_name(metric.name)
+                points = metric.data
+                if isinstance(points, Histogram):
+                    kind = "histogram"
+                elif isinstance(points, Sum) and points.is_monotonic:
+                    kind = "counter"
+                    name = f"{name}_total"
+                else:
+                    kind = "gauge"
+
+                if metric.description:
+                    lines.append(f"# HELP {name} {metric.description}")
+                lines.append(f"# TYPE {name} {kind}")
+
+                for point in points.data_points:
+                    if kind != "histogram":
+                        labels = _prometheus_labels(point.attributes)
+                        lines.append(f"{name}{labels} {_prometheus_value(point.value)}")
+                        continue
+
+                    cumulative = 0
+                    bounds = list(point.explicit_bounds) + [math.inf]
+                    for bound, count in zip(bounds, point.bucket_counts):
+                        cumulative += count
+                        labels = _prometheus_labels(
+                            point.attributes, {"le": _prometheus_value(bound)}
+                        )
+                        lines.append(f"{name}_bucket{labels} {cumulative}")
+                    labels = _prometheus_labels(point.attributes)
+                    lines.append(f"{name}_sum{labels} {_prometheus_value(point.sum)}")
+                    lines.append(f"{name}_count{labels} {point.count}")
+
+    return "\n".join(lines) + "\n" if lines else ""
@@ -1,14 +1,72 @@
-from typing import Optional, Union
+from typing import Any, AsyncIterator, Iterator, Optional, Union
 
 from mcp.types import CallToolResult
+from pydantic import BaseModel
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
 from mcp_agent import console
+from mcp_agent.core.stream_events import GenerationComplete, StreamEvent, TextDelta, ToolCallEvent
 from mcp_agent.mcp.mcp_aggregator import SEP
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 # Constants
 HUMAN_INPUT_TOOL_NAME = "__human_input__"
+# Characters kept for truncated tool panels (8 lines high), well beyond what they can show
+TRUNCATED_TEXT_LIMIT = 4000
+
+
+def _repr_parts(value: Any, limit: int) -> Iterator[str]:
+    """
+    Yield repr(value) a piece at a time, cutting strings to `limit` characters, so a
+    caller can stop formatting a large payload once it has as much as it needs.
+    """
+    if isinstance(value, str):
+        yield repr(value[:limit])
+    elif isinstance(value, (list, tuple)):
+        yield "[" if isinstance(value, list) else "("
+        for index, item in enumerate(value):
+            if index:
+                yield ", "
+            yield from _repr_parts(item, limit)
+        if isinstance(value, tuple) and len(value) == 1:
+            yield ","
+        yield "]" if isinstance(value, list) else ")"
+    elif isinstance(value, dict):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield f"{', ' if index else ''}{key!r}: "
+            yield from _repr_parts(item, limit)
+        yield "}"
+    elif isinstance(value, BaseModel):
+        yield f"{type(value).__name__}("
+        yield from _model_parts(value, ", ", limit)
+        yield ")"
+    else:
+        yield repr(value)
+
+
+def _model_parts(model: BaseModel, separator: str, limit: int) -> Iterator[str]:
+    """Yield a pydantic model's fields as its repr (or, with a space separator, str) does."""
+    for index, (name, field) in enumerate(model.__repr_args__()):
+        if index:
+            yield separator
+        if name is not None:
+            yield f"{name}="
+        yield from _repr_parts(field, limit)
+
+
+def _str_parts(value: Any, limit: int) -> Iterator[str]:
+    """Yield str(value) a piece at a time (see _repr_parts)."""
+    if isinstance(value, str):
+        yield value[:limit]
+    elif isinstance(value, BaseModel):
+        yield from _model_parts(value, " ", limit)
+    elif isinstance(value, (list, tuple, dict)):
+        yield from _repr_parts(value, limit)
+    else:
+        yield str(value)
 
 
 class ConsoleDisplay:
@@ -27,15 +85,45 @@ class ConsoleDisplay:
         self.config = config
         self._markup = config.logger.enable_markup if config else True
 
+    # Read on every call: quiet mode switches these off after the display is created
+    @property
+    def chat_enabled(self) -> bool:
+        """Whether user and assistant messages are displayed."""
+        return bool(self.config and self.config.logger.show_chat)
+
+    @property
+    def tools_enabled(self) -> bool:
+        """Whether tool calls and results are displayed."""
+        return bool(self.config and self.config.logger.show_tools)
+
+    def _tool_text(self, value) -> tuple[str, bool]:
+        """
+        Stringify a tool payload. When tool panels are truncated, stop formatting once
+        there is more than a truncated panel can show.
+        """
+        if not self.config.logger.truncate_tools:
+            return str(value), False
+
+        parts: list[str] = []
+        length = 0
+        for part in _str_parts(value, TRUNCATED_TEXT_LIMIT):
+            parts.append(part)
+            length += len(part)
+            if length > TRUNCATED_TEXT_LIMIT:
+                break
+        text = "".join(parts)
+        return text[:TRUNCATED_TEXT_LIMIT], len(text) > 360
+
     def show_tool_result(self, result: CallToolResult) -> None:
         """Display a tool result in a formatted panel."""
-        if not self.config or not self.config.logger.show_tools:
+        if not self.tools_enabled:
             return
 
         style = "red" if result.isError else "magenta"
+        text, truncated = self._tool_text(result.content)
 
         panel = Panel(
-            Text(str(result.content), overflow="..."),
+            Text(text, overflow="..."),
             title="[TOOL RESULT]",
             title_align="right",
             style=style,
@@ -43,20 +131,21 @@ class ConsoleDisplay:
             padding=(1, 2),
         )
 
-        if self.config and self.config.logger.truncate_tools:
-            if len(str(result.content)) > 360:
-                panel.height = 8
+        if truncated:
+            panel.height = 8
 
         console.console.print(panel, markup=self._markup)
         console.console.print("\n")
 
     def show_oai_tool_result(self, result) -> None:
         """Display an OpenAI tool result in a formatted panel."""
-        if not self.config or not self.config.logger.show_tools:
+        if not self.tools_enabled:
             return
 
+        text, truncated = self._tool_text(result)
+
         panel = Panel(
-            Text(str(result), overflow="..."),
+            Text(text, overflow="..."),
             title="[TOOL RESULT]",
             title_align="right",
             style="magenta",
@@ -64,22 +153,22 @@ class ConsoleDisplay:
             padding=(1, 2),
         )
 
-        if self.config and self.config.logger.truncate_tools:
-            if len(str(result)) > 360:
-                panel.height = 8
+        if truncated:
+            panel.height = 8
 
         console.console.print(panel, markup=self._markup)
         console.console.print("\n")
 
     def show_tool_call(self, available_tools, tool_name, tool_args) -> None:
         """Display a tool call in a formatted panel."""
-        if not self.config or not self.config.logger.show_tools:
+        if not self.tools_enabled:
             return
 
         display_tool_list = self._format_tool_list(available_tools, tool_name)
+        text, truncated = self._tool_text(tool_args)
 
         panel = Panel(
-            Text(str(tool_args), overflow="ellipsis"),
+            Text(text, overflow="ellipsis"),
             title="[TOOL CALL]",
             title_align="left",
             style="magenta",
@@ -89,9 +178,8 @@ class ConsoleDisplay:
             padding=(1, 2),
         )
 
-        if self.config and self.config.logger.truncate_tools:
-            if len(str(tool_args)) > 360:
-                panel.height = 8
+        if truncated:
+            panel.height = 8
 
         console.console.print(panel, markup=self._markup)
         console.console.print("\n")
@@ -138,15 +226,14 @@ class ConsoleDisplay:
         name: Optional[str] = None,
     ) -> None:
         """Display an assistant message in a formatted panel."""
-        if not self.config or not self.config.logger.show_chat:
+        if not self.chat_enabled:
             return
 
         display_server_list = Text()
 
         if aggregator:
-            # Add human input tool if available
-            tools = await aggregator.list_tools()
-            if any(tool.name == HUMAN_INPUT_TOOL_NAME for tool in tools.tools):
+            # Use the agent's configured state rather than listing tools for every message
+            if getattr(aggregator, "human_input_callback", None):
                 style = (
                     "green" if highlight_namespaced_tool == HUMAN_INPUT_TOOL_NAME else "dim white"
                 )
@@ -159,7 +246,7 @@ class ConsoleDisplay:
                 else highlight_namespaced_tool
             )
 
-            for server_name in await aggregator.list_servers():
+            for server_name in aggregator.server_names:
                 style = "green" if server_name == mcp_server_name else "dim white"
                 display_server_list.append(f"[{server_name}] ", style)
 
@@ -176,11 +263,61 @@ class ConsoleDisplay:
         console.console.print(panel, markup=self._markup)
         console.console.print("\n")
 
+    async def show_assistant_stream(
+        self,
+        stream: AsyncIterator[StreamEvent],
+        name: Optional[str] = None,
+    ) -> Optional[PromptMessageMultipart]:
+        """
+        Consume a generate_stream() iterator, rendering assistant text live as it arrives.
+
+        The live panel is transient - the LLM prints the usual assistant panel once the
+        response is complete. Returns the completed message.
+        """
+        message: Optional[PromptMessageMultipart] = None
+
+        if not self.chat_enabled:
+            async for event in stream:
+                if isinstance(event, GenerationComplete):
+                    message = event.message
+            return message
+
+        from mcp_agent.progress_display import progress_display
+
+        text = Text()
+
+        def render() -> Panel:
+            return Panel(
+                text,
+                title=f"[ASSISTANT]{f' ({name})' if name else ''}",
+                title_align="left",
+                style="green",
+                border_style="bold white",
+                padding=(1, 2),
+            )
+
+        with progress_display.paused():
+            with Live(
+                render(), console=console.console, transient=True, refresh_per_second=10
+            ) as live:
+                async for event in stream:
+                    if isinstance(event, TextDelta):
+                        text.append(event.text)
+                        live.update(render())
+                    elif isinstance(event, ToolCallEvent):
+                        # The LLM displays the tool call; start a fresh panel for the next turn
+                        text = Text()
+                        live.update(render())
+                    elif isinstance(event, GenerationComplete):
+                        message = event.message
+
+        return message
+
     def show_user_message(
         self, message, model: Optional[str], chat_turn: int, name: Optional[str] = None
     ) -> None:
         """Display a user message in a formatted panel."""
-        if not self.config or not self.config.logger.show_chat:
+        if not self.chat_enabled:
             return
 
         subtitle_text = Text(f"{model or 'unknown'}", style="dim white")
@@ -220,7 +357,7 @@ class ConsoleDisplay:
             aggregator: Optional aggregator instance to use for server highlighting
             arguments: Optional dictionary of arguments passed to the prompt template
         """
-        if not self.config or not self.config.logger.show_tools:
+        if not self.tools_enabled:
             return
 
         # Get server name from the namespaced prompt_name
@@ -235,7 +372,7 @@ class ConsoleDisplay:
         # Build the server list with highlighting
         display_server_list = Text()
         if aggregator:
-            for server_name in await aggregator.list_servers():
+            for server_name in aggregator.server_names:
                 style = "green" if server_name == mcp_server_name else "dim white"
                 display_server_list.append(f"[{server_name}] ", style)
 
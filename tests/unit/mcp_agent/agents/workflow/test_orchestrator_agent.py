@@ -1,5 +1,6 @@
 """Unit tests for the OrchestratorAgent class."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -229,3 +230,123 @@ async def test_iterative_planning(orchestrator_fixture):
 
     # Check _get_next_step call count
     assert get_next_step_mock.call_count == 2
+
+
+def _slow_agent(name: str, delay: float, *trackers: dict):
+    """Create a mock agent that sleeps before responding, tracking concurrency."""
+
+    async def generate(*args, **kwargs):
+        for tracker in trackers:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            for tracker in trackers:
+                tracker["active"] -= 1
+        return PromptMessageMultipart(
+            role="assistant", content=[TextContent(type="text", text=f"{name} response")]
+        )
+
+    agent = MagicMock()
+    agent.name = name
+    agent.generate = AsyncMock(side_effect=generate)
+    return agent
+
+
+def _orchestrator_for(agents, **kwargs) -> OrchestratorAgent:
+    config = MagicMock()
+    config.name = "orchestrator"
+    return OrchestratorAgent(config=config, agents=agents, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_execute_step_runs_tasks_concurrently_in_order():
+    """Tasks within a step run concurrently and results keep the plan order."""
+    tracker = {"active": 0, "peak": 0}
+    delays = {"slow": 0.2, "medium": 0.1, "fast": 0.0}
+    agents = [_slow_agent(name, delay, tracker) for name, delay in delays.items()]
+    orchestrator = _orchestrator_for(agents)
+
+    step = Step(
+        description="Concurrent step",
+        tasks=[AgentTask(description=f"Task for {name}", agent=name) for name in delays],
+    )
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    step_result = await orchestrator._execute_step(step, plan_result, RequestParams())
+
+    assert tracker["peak"] == 3
+    assert [t.agent for t in step_result.task_results] == ["slow", "medium", "fast"]
+    assert step_result.task_results[0].result == "slow response"
+
+
+@pytest.mark.asyncio
+async def test_execute_step_respects_max_parallel_tasks():
+    """The concurrency cap limits how many tasks run at once."""
+    tracker = {"active": 0, "peak": 0}
+    agents = [_slow_agent(f"agent{i}", 0.05, tracker) for i in range(4)]
+    orchestrator = _orchestrator_for(agents, max_parallel_tasks=2)
+
+    step = Step(
+        description="Capped step",
+        tasks=[AgentTask(description="Task", agent=agent.name) for agent in agents],
+    )
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    step_result = await orchestrator._execute_step(step, plan_result, RequestParams())
+
+    assert tracker["peak"] == 2
+    assert len(step_result.task_results) == 4
+
+
+@pytest.mark.asyncio
+async def test_execute_step_task_timeout_is_isolated():
+    """A task exceeding the timeout reports an error without affecting the others."""
+    tracker = {"active": 0, "peak": 0}
+    agents = [_slow_agent("hung", 5, tracker), _slow_agent("quick", 0, tracker)]
+    orchestrator = _orchestrator_for(agents, task_timeout=0.1)
+
+    step = Step(
+        description="Timeout step",
+        tasks=[
+            AgentTask(description="Task for hung", agent="hung"),
+            AgentTask(description="Task for quick", agent="quick"),
+        ],
+    )
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    step_result = await orchestrator._execute_step(step, plan_result, RequestParams())
+
+    assert "ERROR" in step_result.task_results[0].result
+    assert "timed out" in step_result.task_results[0].result
+    assert step_result.task_results[1].result == "quick response"
+
+
+@pytest.mark.asyncio
+async def test_execute_step_serializes_tasks_for_the_same_agent():
+    """Tasks for one agent share its history, so only different agents run in parallel."""
+    writer = {"active": 0, "peak": 0}
+    overall = {"active": 0, "peak": 0}
+    agents = [
+        _slow_agent("writer", 0.05, writer, overall),
+        _slow_agent("reviewer", 0.05, overall),
+    ]
+    orchestrator = _orchestrator_for(agents)
+
+    step = Step(
+        description="Shared agent step",
+        tasks=[
+            AgentTask(description="First draft", agent="writer"),
+            AgentTask(description="Review", agent="reviewer"),
+            AgentTask(description="Second draft", agent="writer"),
+        ],
+    )
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    step_result = await orchestrator._execute_step(step, plan_result, RequestParams())
+
+    assert writer["peak"] == 1
+    assert overall["peak"] == 2
+    assert agents[0].generate.call_count == 2
+    assert [t.agent for t in step_result.task_results] == ["writer", "reviewer", "writer"]
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.core import direct_factory
+from mcp_agent.core.agent_types import AgentType
+
+
+class FakeAgent:
+    def __init__(self) -> None:
+        self.shut_down = False
+
+    async def shutdown(self) -> None:
+        self.shut_down = True
+
+
+class FakeCreator:
+    def __init__(self, failing: set[str] = frozenset()) -> None:
+        self.failing = failing
+        self.running = 0
+        self.peak = 0
+        self.created: dict[str, FakeAgent] = {}
+
+    async def __call__(self, app, name, agent_data, agent_type, active_agents, model_factory):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if name in self.failing:
+                raise RuntimeError(f"{name} failed")
+            self.created[name] = FakeAgent()
+            return {name: self.created[name]}
+        finally:
+            self.running -= 1
+
+
+def _agents(count: int) -> dict:
+    return {f"agent{i}": {"type": AgentType.BASIC.value} for i in range(count)}
+
+
+@pytest.mark.asyncio
+async def test_agents_initialized_concurrently_with_limit(monkeypatch):
+    creator = FakeCreator()
+    monkeypatch.setattr(direct_factory, "_create_agent", creator)
+
+    agents = await direct_factory.create_agents_by_type(
+        None, _agents(6), AgentType.BASIC, max_concurrency=3
+    )
+
+    assert creator.peak == 3
+    assert list(agents) == [f"agent{i}" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_first_failure_raised_after_all_finish(monkeypatch):
+    creator = FakeCreator(failing={"agent1", "agent3"})
+    monkeypatch.setattr(direct_factory, "_create_agent", creator)
+    errors = []
+    monkeypatch.setattr(
+        direct_factory.logger, "error", lambda message, **kwargs: errors.append(message)
+    )
+
+    with pytest.raises(RuntimeError, match="agent1 failed"):
+        await direct_factory.create_agents_by_type(None, _agents(4), AgentType.BASIC)
+
+    assert creator.running == 0
+    assert len(errors) == 2
+    assert "agent3" in errors[1]
+    assert set(creator.created) == {"agent0", "agent2"}
+    assert all(agent.shut_down for agent in creator.created.values())
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.started: list[int] = []
+
+    async def __call__(self, item: int) -> int:
+        self.started.append(item)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            # Later items finish first
+            await asyncio.sleep(0.01 * (5 - item % 5))
+            if item == 7:
+                raise ValueError("bad item")
+            return item * 2
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_map_limits_concurrency_and_keeps_order():
+    tracker = Tracker()
+    executor = AsyncioExecutor(config=ExecutorConfig(max_concurrent_activities=3))
+
+    results = await executor.map(tracker, range(10))
+
+    assert tracker.peak == 3
+    assert results[:7] == [0, 2, 4, 6, 8, 10, 12]
+    assert isinstance(results[7], ValueError)
+    assert results[8:] == [16, 18]
+
+
+@pytest.mark.asyncio
+async def test_map_streaming_as_completed_and_ordered():
+    executor = AsyncioExecutor()
+
+    completed = [
+        index async for index, _ in executor.map_streaming(Tracker(), range(5), max_concurrency=5)
+    ]
+    assert completed == [4, 3, 2, 1, 0]
+
+    tracker = Tracker()
+    ordered = [
+        result
+        async for _, result in executor.map_streaming(
+            tracker, range(5), ordered=True, max_concurrency=2
+        )
+    ]
+    assert ordered == [0, 2, 4, 6, 8]
+    assert tracker.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_inputs_consumed_lazily():
+    executor = AsyncioExecutor()
+    tracker = Tracker()
+
+    stream = executor.map_streaming(tracker, iter(range(1000)), max_concurrency=2)
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert len(tracker.started) <= 3
+    assert tracker.running == 0
+
+
+@pytest.mark.asyncio
+async def test_timeout_per_item():
+    async def slow(item: int) -> int:
+        await asyncio.sleep(1 if item else 0)
+        return item
+
+    results = await AsyncioExecutor().map(slow, [0, 1], timeout=0.05)
+
+    assert results[0] == 0
+    assert isinstance(results[1], asyncio.TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_remaining():
+    tracker = Tracker()
+
+    with pytest.raises(ValueError):
+        await AsyncioExecutor().map(tracker, range(100), max_concurrency=4, fail_fast=True)
+
+    assert tracker.running == 0
+    assert len(tracker.started) < 20
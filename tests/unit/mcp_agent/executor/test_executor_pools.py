@@ -0,0 +1,65 @@
+import asyncio
+import contextvars
+import os
+import threading
+
+import pytest
+
+from mcp_agent import metrics
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.mark.asyncio
+async def test_sync_tasks_use_io_pool_with_context():
+    executor = AsyncioExecutor()
+    request_id.set("abc")
+
+    def blocking(suffix: str) -> tuple[str, str]:
+        return threading.current_thread().name, f"{request_id.get()}{suffix}"
+
+    try:
+        [(thread_name, value)] = await executor.execute(blocking, suffix="-1")
+    finally:
+        executor.shutdown()
+
+    assert thread_name.startswith("fast-agent-io")
+    assert value == "abc-1"
+
+
+@pytest.mark.asyncio
+async def test_pool_saturation_observed():
+    executor = AsyncioExecutor(config=ExecutorConfig(io_pool_size=2))
+    release = threading.Event()
+
+    tasks = [asyncio.create_task(executor.run_blocking(release.wait, 5)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    try:
+        assert executor.pool_usage() == {"io": (5, 2)}
+        observed = {
+            (o.attributes["pool"], o.attributes["state"]): o.value
+            for o in metrics._observe_pool_tasks(None)
+        }
+        assert observed[("io", "active")] >= 2
+        assert observed[("io", "queued")] >= 3
+    finally:
+        release.set()
+        await asyncio.gather(*tasks)
+        executor.shutdown()
+
+    assert executor.pool_usage() == {}
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_work():
+    without_pool = AsyncioExecutor()
+    assert await without_pool.run_cpu_bound(os.getpid) == os.getpid()
+    without_pool.shutdown()
+
+    executor = AsyncioExecutor(config=ExecutorConfig(process_pool_size=1))
+    try:
+        assert await executor.run_cpu_bound(os.getpid) != os.getpid()
+        assert executor.pool_usage() == {"process": (0, 1)}
+    finally:
+        executor.shutdown()
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta
+
+import anthropic
+import httpx
+import pytest
+
+from mcp_agent.config import RetrySettings
+from mcp_agent.executor import retry
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+from mcp_agent.llm.providers import augmented_llm_anthropic  # noqa: F401 - registers classifier
+
+
+class TransientError(Exception):
+    pass
+
+
+class FlakyTask:
+    def __init__(self, failures: int, error: Exception | None = None) -> None:
+        self.failures = failures
+        self.error = error or TransientError("try again")
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "done"
+
+
+def _executor(**config) -> AsyncioExecutor:
+    policy = RetrySettings(initial_delay=0.001, jitter=False)
+    return AsyncioExecutor(config=ExecutorConfig(retry_policy=policy, **config))
+
+
+def _status_error(status: int, headers: dict | None = None) -> anthropic.APIStatusError:
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, headers=headers, request=request)
+    return anthropic.APIStatusError("error", response=response, body=None)
+
+
+@pytest.fixture(autouse=True)
+def transient_classifier(monkeypatch):
+    monkeypatch.setitem(
+        retry._classifiers, __name__, lambda error: isinstance(error, TransientError)
+    )
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_retried_until_success():
+    task = FlakyTask(failures=2)
+
+    assert await _executor().execute(task) == ["done"]
+    assert task.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts():
+    task = FlakyTask(failures=5)
+
+    result = await _executor().execute(task)
+
+    assert isinstance(result[0], TransientError)
+    assert task.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_other_errors_not_retried():
+    task = FlakyTask(failures=1, error=ValueError("bug"))
+
+    result = await _executor().execute(task)
+
+    assert isinstance(result[0], ValueError)
+    assert task.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_covers_attempts():
+    async def hang():
+        await asyncio.sleep(10)
+
+    executor = _executor(timeout_seconds=timedelta(seconds=0.05))
+    result = await asyncio.wait_for(executor.execute(hang), 1)
+
+    assert isinstance(result[0], asyncio.TimeoutError)
+
+
+def test_provider_status_classification():
+    assert retry.is_retryable(_status_error(429))
+    assert retry.is_retryable(_status_error(529))
+    assert not retry.is_retryable(_status_error(400))
+    assert not retry.is_retryable(_status_error(429, {"x-should-retry": "false"}))
+    assert retry.is_retryable(
+        anthropic.APIConnectionError(request=httpx.Request("POST", "https://api.anthropic.com"))
+    )
+
+
+def test_retry_delay():
+    policy = RetrySettings(initial_delay=1, max_delay=5, jitter=False)
+    error = TransientError()
+
+    assert [retry.retry_delay(policy, attempt, error) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    assert retry.retry_delay(policy, 1, _status_error(429, {"retry-after": "7"})) == 7
+    assert retry.retry_delay(policy, 1, _status_error(429, {"retry-after-ms": "250"})) == 0.25
+    assert 0 <= retry.retry_delay(RetrySettings(jitter=True), 1, error) <= 1
@@ -0,0 +1,57 @@
+from mcp_agent.config import AnthropicSettings
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.providers.augmented_llm_anthropic import (
+    CACHE_CONTROL,
+    AnthropicAugmentedLLM,
+)
+
+
+def _llm(monkeypatch, prompt_caching: bool = False) -> AnthropicAugmentedLLM:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    llm = AnthropicAugmentedLLM()
+    monkeypatch.setattr(
+        llm.context.config, "anthropic", AnthropicSettings(prompt_caching=prompt_caching)
+    )
+    return llm
+
+
+def test_prompt_caching_setting_and_request_override(monkeypatch):
+    llm = _llm(monkeypatch)
+    assert not llm._prompt_caching(RequestParams())
+    assert llm._prompt_caching(RequestParams(prompt_caching=True))
+
+    llm = _llm(monkeypatch, prompt_caching=True)
+    assert llm._prompt_caching(RequestParams())
+    assert not llm._prompt_caching(RequestParams(prompt_caching=False))
+
+
+def test_system_and_tools_marked():
+    system = AnthropicAugmentedLLM._cacheable_system("You are helpful")
+    assert system == [{"type": "text", "text": "You are helpful", "cache_control": CACHE_CONTROL}]
+    assert AnthropicAugmentedLLM._cacheable_system(None) is None
+
+    tools = [{"name": "a", "input_schema": {}}, {"name": "b", "input_schema": {}}]
+    marked = AnthropicAugmentedLLM._cacheable_tools(tools)
+    assert marked[0] is tools[0]
+    assert marked[1]["cache_control"] == CACHE_CONTROL
+    assert "cache_control" not in tools[1]
+
+
+def test_last_message_marked_without_modifying_history():
+    history = [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": [{"type": "text", "text": "reply"}]},
+        {"role": "user", "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}]},
+    ]
+
+    request = AnthropicAugmentedLLM._cacheable_messages(history)
+
+    assert request[:2] == history[:2]
+    assert request[2]["content"][0] == {"type": "text", "text": "a"}
+    assert request[2]["content"][1]["cache_control"] == CACHE_CONTROL
+    assert all("cache_control" not in block for block in history[2]["content"])
+
+    string_content = AnthropicAugmentedLLM._cacheable_messages(history[:1])
+    assert string_content[0]["content"] == [
+        {"type": "text", "text": "first", "cache_control": CACHE_CONTROL}
+    ]
@@ -0,0 +1,240 @@
+import functools
+import sys
+import threading
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+from anthropic.types import Message, TextBlock
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from mcp_agent.config import RetrySettings
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+
+
+def test_anthropic_client_is_reused(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    llm = AnthropicAugmentedLLM()
+
+    client = llm._anthropic_client()
+
+    assert client is llm._anthropic_client()
+    assert client.api_key == "test-key"
+
+
+def test_openai_client_is_reused(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    llm = OpenAIAugmentedLLM()
+
+    client = llm._openai_client()
+
+    assert client is llm._openai_client()
+    assert client.api_key == "test-key"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "llm_class, env_var, client_method",
+    [
+        (AnthropicAugmentedLLM, "ANTHROPIC_API_KEY", "_anthropic_client"),
+        (OpenAIAugmentedLLM, "OPENAI_API_KEY", "_openai_client"),
+    ],
+)
+async def test_shutdown_closes_client(monkeypatch, llm_class, env_var, client_method):
+    monkeypatch.setenv(env_var, "test-key")
+    llm = llm_class()
+    client = getattr(llm, client_method)()
+
+    await llm.shutdown()
+
+    assert client.is_closed()
+    assert getattr(llm, client_method)() is not client
+    await llm.shutdown()
+
+
+@pytest.mark.parametrize(
+    "llm_class, env_var, client_method",
+    [
+        (AnthropicAugmentedLLM, "ANTHROPIC_API_KEY", "_anthropic_client"),
+        (OpenAIAugmentedLLM, "OPENAI_API_KEY", "_openai_client"),
+    ],
+)
+def test_sdk_retries_left_to_executor(monkeypatch, llm_class, env_var, client_method):
+    monkeypatch.setenv(env_var, "test-key")
+    llm = llm_class()
+    llm.executor = AsyncioExecutor(config=ExecutorConfig(retry_policy=RetrySettings()))
+    assert getattr(llm, client_method)().max_retries == 0
+
+    llm = llm_class()
+    llm.executor = AsyncioExecutor(config=ExecutorConfig(retry_policy=None))
+    assert getattr(llm, client_method)().max_retries == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_not_retried_after_deltas_sent():
+    calls = []
+
+    async def chunks():
+        yield ChatCompletionChunk(
+            id="1",
+            created=0,
+            model="gpt-4.1",
+            object="chat.completion.chunk",
+            choices=[{"index": 0, "delta": {"content": "partial"}}],
+        )
+        raise openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return chunks()
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    llm = OpenAIAugmentedLLM()
+    executor = AsyncioExecutor(
+        config=ExecutorConfig(retry_policy=RetrySettings(initial_delay=0.001, jitter=False))
+    )
+
+    result = await executor.execute(functools.partial(llm._openai_stream, client), model="gpt-4.1")
+
+    assert isinstance(result[0], openai.APIConnectionError)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_requests_and_keeps_usage():
+    calls = []
+
+    async def chunks():
+        yield ChatCompletionChunk(
+            id="1",
+            created=0,
+            model="gpt-4.1",
+            object="chat.completion.chunk",
+            choices=[{"index": 0, "delta": {"content": "hi"}, "finish_reason": "stop"}],
+        )
+        yield ChatCompletionChunk(
+            id="1",
+            created=0,
+            model="gpt-4.1",
+            object="chat.completion.chunk",
+            choices=[],
+            usage={"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+        )
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return chunks()
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    completion = await OpenAIAugmentedLLM()._openai_stream(client, model="gpt-4.1")
+
+    assert calls[0]["stream_options"] == {"include_usage": True}
+    assert completion.choices[0].message.content == "hi"
+    assert completion.usage.prompt_tokens == 12
+    assert completion.usage.completion_tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_awaits_decorated_async_callables_on_event_loop():
+    """Async SDK methods wrapped by decorators run on the loop, not the thread pool"""
+    calling_threads = []
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            calling_threads.append(threading.current_thread())
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @decorator
+    async def create(**kwargs):
+        return kwargs
+
+    result = await AsyncioExecutor().execute(create, model="test")
+
+    assert result[0] == {"model": "test"}
+    assert calling_threads == [threading.main_thread()]
+
+
+def _anthropic_message() -> Message:
+    return Message.model_construct(
+        id="1",
+        model="claude",
+        role="assistant",
+        type="message",
+        content=[TextBlock(type="text", text="hi")],
+        stop_reason="end_turn",
+        usage=None,
+    )
+
+
+def _openai_completion() -> ChatCompletion:
+    return ChatCompletion(
+        id="1",
+        created=0,
+        model="gpt-4.1",
+        object="chat.completion",
+        choices=[
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "hi"},
+            }
+        ],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "llm_class, env_var, client_method, client",
+    [
+        (
+            AnthropicAugmentedLLM,
+            "ANTHROPIC_API_KEY",
+            "_anthropic_client",
+            lambda create: SimpleNamespace(messages=SimpleNamespace(create=create)),
+        ),
+        (
+            OpenAIAugmentedLLM,
+            "OPENAI_API_KEY",
+            "_openai_client",
+            lambda create: SimpleNamespace(
+                chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+            ),
+        ),
+    ],
+)
+async def test_request_errors_recorded_alike(
+    monkeypatch, llm_class, env_var, client_method, client
+):
+    monkeypatch.setenv(env_var, "test-key")
+    recorded = []
+    module = sys.modules[llm_class.__module__]
+    monkeypatch.setattr(
+        module, "record_llm_request", lambda *args, **kwargs: recorded.append(kwargs["error"])
+    )
+    responses = [
+        _anthropic_message() if llm_class is AnthropicAugmentedLLM else _openai_completion(),
+        ValueError("boom"),
+    ]
+
+    async def create(**kwargs):
+        response = responses.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    llm = llm_class()
+    llm.executor = AsyncioExecutor(config=ExecutorConfig(retry_policy=None))
+    monkeypatch.setattr(llm, client_method, lambda: client(create))
+
+    await llm.generate([Prompt.user("no usage reported")])
+    await llm.generate([Prompt.user("fails")])
+
+    assert recorded == [False, True]
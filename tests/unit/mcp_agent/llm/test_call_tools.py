@@ -0,0 +1,127 @@
+import asyncio
+from typing import List
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, CallToolResult, TextContent
+
+from mcp_agent.core.exceptions import PromptExitError
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.augmented_llm import HUMAN_INPUT_TOOL_NAME, AugmentedLLM
+from mcp_agent.llm.provider_types import Provider
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+
+class SlowToolAggregator:
+    """Stand-in aggregator whose tools sleep for the number of seconds in their name"""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.completed: List[str] = []
+
+    async def call_tool(self, name: str, arguments: dict | None = None) -> CallToolResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if name == "exit":
+                raise PromptExitError("user exited")
+            await asyncio.sleep(float(arguments["delay"]))
+        finally:
+            self.active -= 1
+        self.completed.append(name)
+        return CallToolResult(content=[TextContent(type="text", text=f"{name} done")])
+
+
+class ToolLLM(AugmentedLLM):
+    def __init__(self, *args, **kwargs):
+        super().__init__(provider=Provider.FAST_AGENT, *args, **kwargs)
+
+    async def _apply_prompt_provider_specific(
+        self,
+        multipart_messages: List["PromptMessageMultipart"],
+        request_params: RequestParams | None = None,
+        is_template: bool = False,
+    ) -> PromptMessageMultipart:
+        return multipart_messages[-1]
+
+
+def _requests(delays: dict[str, float]) -> list[tuple[str, CallToolRequest]]:
+    return [
+        (
+            f"id_{name}",
+            CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(name=name, arguments={"delay": delay}),
+            ),
+        )
+        for name, delay in delays.items()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_and_keep_order():
+    llm = ToolLLM()
+    llm.aggregator = SlowToolAggregator()
+
+    results = await llm.call_tools(
+        _requests({"slow": 0.2, "medium": 0.1, "fast": 0}), RequestParams()
+    )
+
+    assert llm.aggregator.peak == 3
+    assert llm.aggregator.completed == ["fast", "medium", "slow"]
+    assert [tool_id for tool_id, _ in results] == ["id_slow", "id_medium", "id_fast"]
+    assert results[0][1].content[0].text == "slow done"
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_bounded_by_max_parallel_tool_calls():
+    llm = ToolLLM()
+    llm.aggregator = SlowToolAggregator()
+
+    results = await llm.call_tools(
+        _requests({f"tool{i}": 0.05 for i in range(5)}),
+        RequestParams(max_parallel_tool_calls=2),
+    )
+
+    assert llm.aggregator.peak == 2
+    assert len(results) == 5
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_sequential_when_parallel_disabled():
+    llm = ToolLLM()
+    llm.aggregator = SlowToolAggregator()
+
+    await llm.call_tools(
+        _requests({"slow": 0.05, "fast": 0}), RequestParams(parallel_tool_calls=False)
+    )
+
+    assert llm.aggregator.peak == 1
+    assert llm.aggregator.completed == ["slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_human_input_call_runs_on_its_own():
+    llm = ToolLLM()
+    llm.aggregator = SlowToolAggregator()
+
+    results = await llm.call_tools(
+        _requests({"first": 0.05, "second": 0.05, HUMAN_INPUT_TOOL_NAME: 0, "after": 0}),
+        RequestParams(),
+    )
+
+    assert llm.aggregator.peak == 2
+    assert llm.aggregator.completed[2:] == [HUMAN_INPUT_TOOL_NAME, "after"]
+    assert [tool_id for tool_id, _ in results][2] == f"id_{HUMAN_INPUT_TOOL_NAME}"
+
+
+@pytest.mark.asyncio
+async def test_exit_cancels_sibling_tool_calls():
+    llm = ToolLLM()
+    llm.aggregator = SlowToolAggregator()
+
+    with pytest.raises(PromptExitError):
+        await llm.call_tools(_requests({"slow": 5, "exit": 0}), RequestParams())
+
+    assert llm.aggregator.active == 0
+    assert llm.aggregator.completed == []
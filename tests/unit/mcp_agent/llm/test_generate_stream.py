@@ -0,0 +1,93 @@
+import asyncio
+from typing import List
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, CallToolResult, TextContent
+
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.core.stream_events import (
+    GenerationComplete,
+    TextDelta,
+    ToolCallEvent,
+    ToolResultEvent,
+)
+from mcp_agent.llm.augmented_llm import AugmentedLLM
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.llm.provider_types import Provider
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+
+class EchoAggregator:
+    async def call_tool(self, name: str, arguments: dict | None = None) -> CallToolResult:
+        return CallToolResult(content=[TextContent(type="text", text=f"{name} result")])
+
+
+class DeltaLLM(AugmentedLLM):
+    """Emits the words of the last user message one at a time, calling a tool first"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(provider=Provider.FAST_AGENT, *args, **kwargs)
+
+    async def _apply_prompt_provider_specific(
+        self,
+        multipart_messages: List["PromptMessageMultipart"],
+        request_params: RequestParams | None = None,
+        is_template: bool = False,
+    ) -> PromptMessageMultipart:
+        await self.call_tools(
+            [
+                (
+                    "call_1",
+                    CallToolRequest(
+                        method="tools/call",
+                        params=CallToolRequestParams(name="lookup", arguments={"q": "x"}),
+                    ),
+                )
+            ],
+            self.default_request_params,
+        )
+        words = multipart_messages[-1].first_text().split(" ")
+        for word in words:
+            self._emit_stream_event(TextDelta(text=word + " "))
+            await asyncio.sleep(0)
+        return Prompt.assistant(" ".join(words))
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_events_in_order():
+    llm = DeltaLLM()
+    llm.aggregator = EchoAggregator()
+
+    events = [event async for event in llm.generate_stream([Prompt.user("one two three")])]
+
+    assert isinstance(events[0], ToolCallEvent)
+    assert events[0].name == "lookup"
+    assert isinstance(events[1], ToolResultEvent)
+    assert events[1].result.content[0].text == "lookup result"
+    assert [e.text for e in events if isinstance(e, TextDelta)] == ["one ", "two ", "three "]
+    assert isinstance(events[-1], GenerationComplete)
+    assert events[-1].message.first_text() == "one two three"
+    assert llm.message_history[-1].first_text() == "one two three"
+
+
+@pytest.mark.asyncio
+async def test_non_streaming_provider_yields_single_delta():
+    llm = PassthroughLLM()
+
+    events = [event async for event in llm.generate_stream([Prompt.user("hello")])]
+
+    assert [type(e) for e in events] == [TextDelta, GenerationComplete]
+    assert events[0].text == "hello"
+    assert events[1].message.first_text() == "hello"
+
+
+@pytest.mark.asyncio
+async def test_events_not_emitted_outside_stream():
+    llm = DeltaLLM()
+    llm.aggregator = EchoAggregator()
+
+    response = await llm.generate([Prompt.user("quiet")])
+
+    assert response.first_text() == "quiet"
+    assert llm._stream_queue() is None
@@ -131,6 +131,8 @@ class TestRequestParamsInLLM:
         assert "use_history" not in result  # Should be excluded
         assert "max_iterations" not in result  # Should be excluded
         assert "parallel_tool_calls" not in result  # Should be excluded
+        assert "max_parallel_tool_calls" not in result  # Should be excluded
+        assert "prompt_caching" not in result  # Should be excluded
 
     def test_anthropic_provider_arguments(self):
         """Test prepare_provider_arguments with Anthropic provider"""
@@ -171,6 +173,8 @@ class TestRequestParamsInLLM:
         assert "use_history" not in result  # Should be excluded
         assert "max_iterations" not in result  # Should be excluded
         assert "parallel_tool_calls" not in result  # Should be excluded
+        assert "max_parallel_tool_calls" not in result  # Should be excluded
+        assert "prompt_caching" not in result  # Should be excluded
 
     def test_params_dont_overwrite_base_args(self):
         """Test that params don't overwrite base_args with the same key"""
@@ -0,0 +1,33 @@
+import pytest
+from mcp.types import Tool
+
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+
+
+@pytest.mark.asyncio
+async def test_provider_tools_rebuilt_only_when_catalog_changes():
+    aggregator = MCPAggregator(server_names=["fs"], context=object())
+    aggregator.initialized = True
+    await aggregator._index_server_tools("fs", [Tool(name="read", inputSchema={})])
+
+    llm = PassthroughLLM()
+    llm.aggregator = aggregator
+    builds = []
+
+    def build(tools):
+        builds.append(len(tools))
+        return [tool.name for tool in tools]
+
+    first = await llm._provider_tools(build)
+    second = await llm._provider_tools(build)
+    assert first == ["fs-read"]
+    assert second is first
+    assert builds == [1]
+
+    await aggregator._index_server_tools(
+        "fs", [Tool(name="read", inputSchema={}), Tool(name="write", inputSchema={})]
+    )
+
+    assert await llm._provider_tools(build) == ["fs-read", "fs-write"]
+    assert builds == [1, 2]
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.logging.events import Event
+from mcp_agent.logging.listeners import EventListener
+from mcp_agent.logging.logger import Logger
+from mcp_agent.logging.transport import AsyncEventBus
+
+
+def _event(message: str, etype: str = "info") -> Event:
+    return Event(type=etype, namespace="test", message=message)
+
+
+def _queued(bus: AsyncEventBus) -> list[str]:
+    return [event.message for event in bus._queue._queue]
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    bus = AsyncEventBus()
+    bus.configure_queue(2, "drop_oldest")
+
+    for i in range(4):
+        await bus.emit(_event(str(i)))
+
+    assert _queued(bus) == ["2", "3"]
+    assert bus.dropped_events["info"] == 2
+
+
+@pytest.mark.asyncio
+async def test_drop_newest():
+    bus = AsyncEventBus()
+    bus.configure_queue(2, "drop_newest")
+
+    for i in range(4):
+        await bus.emit(_event(str(i)))
+
+    assert _queued(bus) == ["0", "1"]
+    assert bus.dropped_total == 2
+
+
+@pytest.mark.asyncio
+async def test_sample_debug_keeps_other_events():
+    bus = AsyncEventBus()
+    bus.configure_queue(2, "sample_debug", debug_sample_rate=0.0)
+
+    await bus.emit(_event("a"))
+    await bus.emit(_event("b"))
+    await bus.emit(_event("noisy", "debug"))
+    await bus.emit(_event("important", "error"))
+
+    assert _queued(bus) == ["b", "important"]
+    assert bus.dropped_events == {"debug": 1, "info": 1}
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_space():
+    bus = AsyncEventBus()
+    bus.configure_queue(1, "block")
+    await bus.emit(_event("first"))
+
+    blocked = asyncio.create_task(bus.emit(_event("second")))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    bus._queue.get_nowait()
+    await asyncio.wait_for(blocked, 1)
+    assert _queued(bus) == ["second"]
+    assert bus.dropped_total == 0
+
+
+@pytest.mark.asyncio
+async def test_block_bounds_logger_events():
+    bus = AsyncEventBus()
+    bus.configure_queue(1, "block")
+    logger = Logger("test")
+    logger.event_bus = bus
+    pending = len(asyncio.all_tasks())
+
+    for i in range(10):
+        logger.info(str(i))
+
+    assert _queued(bus) == ["0"]
+    assert bus.dropped_events["info"] == 9
+    assert len(asyncio.all_tasks()) == pending
+
+
+@pytest.mark.asyncio
+async def test_reconfigure_keeps_pending_events():
+    bus = AsyncEventBus()
+    for i in range(3):
+        await bus.emit(_event(str(i)))
+
+    bus.configure_queue(2, "drop_oldest")
+
+    assert _queued(bus) == ["1", "2"]
+    assert bus._queue.maxsize == 2
+
+
+class BatchRecorder(EventListener):
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def handle_event(self, event: Event) -> None:
+        raise AssertionError("events should be delivered in batches")
+
+    async def handle_events(self, events: list[Event]) -> None:
+        self.batches.append([event.message for event in events])
+
+
+class FailingListener(EventListener):
+    def __init__(self) -> None:
+        self.handled: list[str] = []
+
+    async def handle_event(self, event: Event) -> None:
+        if event.message == "bad":
+            raise ValueError("bad event")
+        self.handled.append(event.message)
+
+
+@pytest.mark.asyncio
+async def test_ready_events_delivered_as_one_batch():
+    bus = AsyncEventBus()
+    recorder = BatchRecorder()
+    bus.add_listener("recorder", recorder)
+    for i in range(3):
+        await bus.emit(_event(str(i)))
+
+    await bus.start()
+    await bus.stop()
+
+    assert recorder.batches == [["0", "1", "2"]]
+
+
+@pytest.mark.asyncio
+async def test_reconfigure_running_bus():
+    bus = AsyncEventBus()
+    recorder = BatchRecorder()
+    bus.add_listener("recorder", recorder)
+    await bus.start()
+    await bus.emit(_event("before"))
+    await asyncio.sleep(0.01)
+
+    bus.configure_queue(10, "drop_oldest")
+    await bus.emit(_event("after"))
+    await asyncio.wait_for(bus.stop(), 1)
+
+    assert recorder.batches == [["before"], ["after"]]
+
+
+@pytest.mark.asyncio
+async def test_failing_event_does_not_stop_batch():
+    listener = FailingListener()
+
+    with pytest.raises(ValueError):
+        await listener.handle_events([_event("a"), _event("bad"), _event("c")])
+
+    assert listener.handled == ["a", "c"]
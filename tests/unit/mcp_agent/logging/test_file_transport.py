@@ -0,0 +1,69 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from mcp_agent.logging.events import Event
+from mcp_agent.logging.transport import AsyncEventBus, FileTransport
+
+
+def _event(message: str) -> Event:
+    return Event(type="info", namespace="test", message=message)
+
+
+def _messages(path) -> list[str]:
+    return [json.loads(line)["message"] for line in path.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_buffered_entries_written_on_close(tmp_path):
+    path = tmp_path / "log.jsonl"
+    transport = FileTransport(path, flush_interval=60)
+
+    for i in range(3):
+        await transport.send_event(_event(str(i)))
+    assert not path.exists() or path.read_text() == ""
+
+    await transport.close()
+
+    assert transport.is_closed
+    assert _messages(path) == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_rotates_by_size_and_compresses(tmp_path):
+    path = tmp_path / "log.jsonl"
+    transport = FileTransport(
+        path, batch_size=1, flush_interval=60, max_bytes=1, backup_count=2, compress=True
+    )
+
+    for i in range(4):
+        await transport.send_event(_event(str(i)))
+        # Let the writer take each entry as its own batch, forcing a rotation per write
+        while transport._buffer:
+            await asyncio.sleep(0.01)
+    await transport.close()
+
+    assert _messages(path) == ["3"]
+    with gzip.open(tmp_path / "log.jsonl.1.gz", "rt") as f:
+        assert [json.loads(line)["message"] for line in f] == ["2"]
+    assert (tmp_path / "log.jsonl.2.gz").exists()
+    assert not (tmp_path / "log.jsonl.3.gz").exists()
+
+
+@pytest.mark.asyncio
+async def test_bus_restart_reopens_file(tmp_path):
+    path = tmp_path / "log.jsonl"
+    bus = AsyncEventBus(transport=FileTransport(path, mode="w", flush_interval=60))
+
+    await bus.start()
+    await bus.emit(_event("first"))
+    await bus.stop()
+    assert bus.transport.is_closed
+
+    await bus.start()
+    await bus.emit(_event("second"))
+    await bus.stop()
+
+    assert _messages(path) == ["first", "second"]
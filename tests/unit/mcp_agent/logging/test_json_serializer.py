@@ -0,0 +1,68 @@
+import json
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from mcp_agent.logging.json_serializer import JSONSerializer, dumps
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Call(BaseModel):
+    name: str
+    at: datetime
+    arguments: dict
+
+
+def test_pydantic_models_dump_json_compatible_values():
+    call = Call(
+        name="read", at=datetime(2025, 1, 2, 3, 4, 5), arguments={"api_key": "sk-0123456789abc"}
+    )
+
+    result = JSONSerializer()({"call": call})
+
+    assert result == {
+        "call": {
+            "name": "read",
+            "at": "2025-01-02T03:04:05",
+            "arguments": {"api_key": "sk-0123456....."},
+        }
+    }
+
+
+def test_builtin_types_and_redaction():
+    uid = UUID(int=1)
+    data = {
+        "ids": (uid, uid),
+        "color": Color.RED,
+        "counts": [1, 1, 2],
+        "Access_Token": "abc",
+        "callback": test_builtin_types_and_redaction,
+    }
+
+    result = JSONSerializer()(data)
+
+    assert result == {
+        "ids": [str(uid), str(uid)],
+        "color": "red",
+        "counts": [1, 1, 2],
+        "Access_Token": "abc.....",
+        "callback": "<callable: test_builtin_types_and_redaction>",
+    }
+    assert json.loads(dumps(result)) == result
+
+
+def test_shared_and_cyclic_references():
+    shared = {"a": 1}
+    cyclic: list = [shared]
+    cyclic.append(cyclic)
+
+    result = JSONSerializer()({"x": shared, "y": shared, "cycle": cyclic})
+
+    assert result["x"] == result["y"] == {"a": 1}
+    assert result["cycle"][0] == {"a": 1}
+    assert isinstance(result["cycle"][1], str)
@@ -0,0 +1,110 @@
+import json
+from datetime import datetime
+
+from mcp_agent.logging.log_reader import EventLogReader
+
+
+def _line(message: str, level: str = "INFO", namespace: str = "mcp_agent.test", second: int = 0):
+    entry = {
+        "level": level,
+        "timestamp": datetime(2025, 1, 1, 12, 0, second).isoformat(),
+        "namespace": namespace,
+        "message": message,
+        "data": {"message": message},
+    }
+    return json.dumps(entry, separators=(",", ":")) + "\n"
+
+
+def _write(path, *lines: str, mode: str = "w") -> None:
+    with open(path, mode) as f:
+        f.writelines(lines)
+
+
+def test_index_is_saved_and_reused(tmp_path):
+    log = tmp_path / "fastagent.jsonl"
+    _write(log, _line("first"), _line("second", level="ERROR"))
+
+    with EventLogReader(log) as reader:
+        assert len(reader) == 2
+        assert reader[1].message == "second"
+        assert reader[1].type == "error"
+    assert (tmp_path / "fastagent.jsonl.idx").exists()
+
+    with EventLogReader(log) as reader:
+        assert [event.message for event in reader] == ["first", "second"]
+        assert reader[-1].data == {"message": "second"}
+        assert reader.timestamp(0) == datetime(2025, 1, 1, 12, 0, 0)
+
+
+def test_appended_and_partial_lines(tmp_path):
+    log = tmp_path / "fastagent.jsonl"
+    _write(log, _line("first"))
+    with EventLogReader(log):
+        pass
+
+    partial = _line("third")
+    _write(log, _line("second"), partial[:10], mode="a")
+    with EventLogReader(log) as reader:
+        assert [event.message for event in reader] == ["first", "second"]
+
+        _write(log, partial[10:], mode="a")
+        reader.refresh()
+        assert [event.message for event in reader] == ["first", "second", "third"]
+
+
+def test_other_lines_parsed_and_corrupt_lines_skipped(tmp_path):
+    log = tmp_path / "fastagent.jsonl"
+    reordered = json.dumps(
+        {
+            "message": "reordered",
+            "namespace": "mcp_agent.other",
+            "level": "WARNING",
+            "timestamp": "2025-01-01T12:00:05",
+        }
+    )
+    _write(log, _line("first"), "{not json\n", "\n", reordered + "\n", _line("last"))
+
+    with EventLogReader(log) as reader:
+        assert [event.message for event in reader] == ["first", "reordered", "last"]
+        assert reader.namespace(1) == "mcp_agent.other"
+        assert reader.level(1) == "warning"
+
+
+def test_find_uses_index(tmp_path):
+    log = tmp_path / "fastagent.jsonl"
+    _write(
+        log,
+        _line("debug", level="DEBUG", second=1),
+        _line("mcp", namespace="mcp_agent.mcp.aggregator", second=2),
+        _line("mcp prefix", namespace="mcp_agent.mcpx", second=3),
+        _line("error", level="ERROR", second=4),
+    )
+
+    with EventLogReader(log) as reader:
+        assert [event.message for event in reader.find(min_level="info")] == [
+            "mcp",
+            "mcp prefix",
+            "error",
+        ]
+        assert [event.message for event in reader.find(namespace="mcp_agent.mcp")] == ["mcp"]
+
+        view = reader.find(
+            since=datetime(2025, 1, 1, 12, 0, 2), until=datetime(2025, 1, 1, 12, 0, 3)
+        )
+        assert len(view) == 2
+        assert view[-1].message == "mcp prefix"
+
+
+def test_replaced_log_is_reindexed(tmp_path):
+    log = tmp_path / "fastagent.jsonl"
+    _write(log, _line("old one"), _line("old two"))
+    with EventLogReader(log):
+        pass
+
+    _write(log, _line("new"))
+    with EventLogReader(log) as reader:
+        assert [event.message for event in reader] == ["new"]
+
+    _write(log, _line("replaced"), _line("with the same number of lines"))
+    with EventLogReader(log) as reader:
+        assert [event.message for event in reader] == ["replaced", "with the same number of lines"]
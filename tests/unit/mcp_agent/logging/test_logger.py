@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.logging.events import EventFilter
+from mcp_agent.logging.listeners import FilteredListener, ProgressListener
+from mcp_agent.logging.logger import Logger
+from mcp_agent.logging.transport import AsyncEventBus, NoOpTransport
+
+
+class RecordingListener(FilteredListener):
+    def __init__(self, event_filter: EventFilter | None = None) -> None:
+        super().__init__(event_filter=event_filter)
+        self.events = []
+
+    async def handle_matched_event(self, event) -> None:
+        self.events.append(event)
+
+
+class StubDisplay:
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def update(self, event) -> None:
+        pass
+
+
+@pytest.fixture
+def bus():
+    AsyncEventBus.reset()
+    bus = AsyncEventBus.get(transport=NoOpTransport())
+    yield bus
+    AsyncEventBus.reset()
+
+
+def _not_called():
+    raise AssertionError("lazy value should not be evaluated")
+
+
+@pytest.mark.asyncio
+async def test_events_below_level_are_not_built(bus):
+    listener = RecordingListener(EventFilter(min_level="warning"))
+    bus.add_listener("recording", listener)
+    await bus.start()
+    logger = Logger("test")
+    assert not logger.is_enabled_for("info")
+    assert logger.is_enabled_for("error")
+
+    logger.debug(_not_called, data=_not_called)
+    logger.info("skipped")
+    logger.warning(lambda: "built", data=lambda: {"answer": 42})
+    await asyncio.sleep(0.2)
+    await bus.stop()
+
+    assert [event.message for event in listener.events] == ["built"]
+    assert listener.events[0].data == {"data": {"answer": 42}}
+
+
+@pytest.mark.asyncio
+async def test_only_data_factory_is_called(bus):
+    listener = RecordingListener(EventFilter(min_level="info"))
+    bus.add_listener("recording", listener)
+    await bus.start()
+
+    Logger("test").info("handler", handler=_not_called, data={"cls": RecordingListener})
+    await asyncio.sleep(0.2)
+    await bus.stop()
+
+    assert listener.events[0].data == {
+        "handler": _not_called,
+        "data": {"cls": RecordingListener},
+    }
+
+
+@pytest.mark.asyncio
+async def test_progress_events_reach_progress_listener(bus):
+    bus.add_listener("recording", RecordingListener(EventFilter(min_level="error")))
+    bus.add_listener("progress", ProgressListener(display=StubDisplay()))
+    await bus.start()
+
+    assert not bus.is_enabled_for("debug")
+    assert bus.is_enabled_for("debug", progress=True)
+    await bus.stop()
+
+
+def test_everything_accepted_before_start(bus):
+    bus.add_listener("recording", RecordingListener(EventFilter(min_level="error")))
+
+    assert bus.is_enabled_for("debug")
@@ -0,0 +1,43 @@
+from io import StringIO
+
+from rich.console import Console
+
+from mcp_agent.event_progress import ProgressAction, ProgressEvent
+from mcp_agent.logging.rich_progress import RichProgressDisplay
+
+
+def _display(terminal: bool) -> RichProgressDisplay:
+    return RichProgressDisplay(Console(file=StringIO(), force_terminal=terminal, width=120))
+
+
+def _event(agent: str, action: ProgressAction, details: str = "") -> ProgressEvent:
+    return ProgressEvent(action=action, target=agent, agent_name=agent, details=details)
+
+
+def test_updates_coalesce_to_latest_event_per_row():
+    display = _display(terminal=True)
+
+    display.update(_event("a", ProgressAction.CHATTING, "turn 1"))
+    display.update(_event("b", ProgressAction.CALLING_TOOL, "search"))
+    display.update(_event("a", ProgressAction.CHATTING, "turn 2"))
+    assert list(display._pending) == ["b", "a"]
+    assert display._progress.tasks == []
+
+    display.console.print(display._progress.get_renderable())
+
+    assert display._pending == {}
+    assert [task.fields["details"] for task in display._progress.tasks] == ["search", "turn 2"]
+
+
+def test_display_disabled_without_terminal():
+    display = _display(terminal=False)
+    assert not display.enabled
+
+    display.start()
+    display.update(_event("a", ProgressAction.CHATTING))
+    with display.paused():
+        pass
+    display.stop()
+
+    assert display._pending == {}
+    assert display.console.file.getvalue() == ""
@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_agent.config import MCPServerSettings, MCPSettings, Settings
+from mcp_agent.core.exceptions import ServerInitializationError
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+
+
+class FakeRegistry:
+    def __init__(self, servers: dict[str, MCPServerSettings]) -> None:
+        self.registry = servers
+
+    def get_server_config(self, server_name: str) -> MCPServerSettings | None:
+        return self.registry.get(server_name)
+
+
+class SlowStartManager:
+    """Connection manager whose servers take the number of seconds in their name to start"""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.started: list[str] = []
+        self.disconnected: list[str] = []
+
+    async def get_server(self, server_name: str, client_session_factory=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if server_name == "broken":
+                raise ServerInitializationError("broken")
+            await asyncio.sleep(float(server_name.split("_")[1]))
+        finally:
+            self.active -= 1
+        self.started.append(server_name)
+
+    async def disconnect_server(self, server_name: str) -> None:
+        self.disconnected.append(server_name)
+
+
+def _aggregator(server_names, max_concurrent_startups=8, **server_settings) -> MCPAggregator:
+    servers = {name: MCPServerSettings(command="x", **server_settings) for name in server_names}
+    context = SimpleNamespace(
+        config=Settings(
+            mcp=MCPSettings(servers=servers, max_concurrent_startups=max_concurrent_startups)
+        ),
+        server_registry=FakeRegistry(servers),
+    )
+    aggregator = MCPAggregator(server_names=server_names, context=context)
+    aggregator._persistent_connection_manager = SlowStartManager()
+    return aggregator
+
+
+@pytest.mark.asyncio
+async def test_servers_start_concurrently():
+    aggregator = _aggregator(["a_0.2", "b_0.1", "c_0"])
+
+    await aggregator._start_persistent_servers()
+
+    manager = aggregator._persistent_connection_manager
+    assert manager.peak == 3
+    assert manager.started == ["c_0", "b_0.1", "a_0.2"]
+
+
+@pytest.mark.asyncio
+async def test_startup_concurrency_is_limited():
+    aggregator = _aggregator([f"s{i}_0.02" for i in range(5)], max_concurrent_startups=2)
+
+    await aggregator._start_persistent_servers()
+
+    assert aggregator._persistent_connection_manager.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_raised_after_other_servers_start():
+    aggregator = _aggregator(["broken", "ok_0.05"])
+
+    with pytest.raises(ServerInitializationError):
+        await aggregator._start_persistent_servers()
+
+    assert aggregator._persistent_connection_manager.started == ["ok_0.05"]
+
+
+@pytest.mark.asyncio
+async def test_startup_timeout():
+    aggregator = _aggregator(["fast_0", "slow_5"], startup_timeout_seconds=0.1)
+
+    with pytest.raises(ServerInitializationError, match="slow_5"):
+        await aggregator._start_persistent_servers()
+
+    manager = aggregator._persistent_connection_manager
+    assert manager.started == ["fast_0"]
+    assert manager.disconnected == ["slow_5"]
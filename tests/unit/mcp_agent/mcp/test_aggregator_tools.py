@@ -0,0 +1,72 @@
+import pytest
+import pytest_asyncio
+from mcp.types import Prompt, Tool
+
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+
+
+def _tool(name: str) -> Tool:
+    return Tool(name=name, inputSchema={"type": "object"})
+
+
+@pytest_asyncio.fixture
+async def aggregator() -> MCPAggregator:
+    aggregator = MCPAggregator(server_names=["fs", "fetch"], context=object())
+    await aggregator._index_server_tools("fs", [_tool("read"), _tool("write")])
+    await aggregator._index_server_tools("fetch", [_tool("fetch"), _tool("read")])
+    aggregator.initialized = True
+    return aggregator
+
+
+@pytest.mark.asyncio
+async def test_list_tools_uses_snapshot(aggregator):
+    first = await aggregator.list_tools()
+    first.tools.append(_tool("extra"))
+    second = await aggregator.list_tools()
+
+    assert [tool.name for tool in second.tools] == [
+        "fs-read",
+        "fs-write",
+        "fetch-fetch",
+        "fetch-read",
+    ]
+    assert second.tools[0] is first.tools[0]
+
+
+@pytest.mark.asyncio
+async def test_version_changes_on_refresh(aggregator):
+    version = aggregator.tool_catalog_version
+
+    await aggregator._index_server_tools("fs", [_tool("read")])
+
+    assert aggregator.tool_catalog_version == version + 1
+    assert [tool.name for tool in (await aggregator.list_tools()).tools] == [
+        "fetch-fetch",
+        "fetch-read",
+        "fs-read",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resolve_unnamespaced_tool(aggregator):
+    assert await aggregator._parse_resource_name("fs-write", "tool") == ("fs", "write")
+    assert await aggregator._parse_resource_name("fetch", "tool") == ("fetch", "fetch")
+    # First server providing the tool wins
+    assert await aggregator._parse_resource_name("read", "tool") == ("fs", "read")
+
+    await aggregator._index_server_tools("fs", [])
+    assert await aggregator._parse_resource_name("read", "tool") == ("fetch", "read")
+
+
+@pytest.mark.asyncio
+async def test_loading_servers_builds_one_snapshot():
+    aggregator = MCPAggregator(server_names=["fs", "fetch"], context=object())
+    version = aggregator.tool_catalog_version
+
+    await aggregator._index_catalogs(
+        [("fs", [_tool("read")], []), ("fetch", [_tool("fetch")], [Prompt(name="summarise")])]
+    )
+
+    assert aggregator.tool_catalog_version == version + 1
+    assert [tool.name for tool in aggregator._tool_snapshot.tools] == ["fs-read", "fetch-fetch"]
+    assert aggregator._prompt_cache["fetch"] == [Prompt(name="summarise")]
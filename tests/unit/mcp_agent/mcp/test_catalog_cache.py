@@ -0,0 +1,111 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import ListToolsResult, Prompt, Tool
+
+from mcp_agent.config import MCPServerSettings, MCPSettings, Settings
+from mcp_agent.mcp import mcp_aggregator
+from mcp_agent.mcp.catalog_cache import CatalogCache, catalog_key
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+
+TOOLS = [Tool(name="read", description="Read a file", inputSchema={"type": "object"})]
+PROMPTS = [Prompt(name="summarise")]
+
+
+def test_key_depends_on_launch_settings():
+    base = MCPServerSettings(command="npx", args=["server"])
+
+    assert catalog_key("fs", base) == catalog_key("fs", base.model_copy())
+    assert catalog_key("fs", base) == catalog_key("fs", base.model_copy(update={"pool_size": 2}))
+    assert catalog_key("fs", base) != catalog_key("other", base)
+    assert catalog_key("fs", base) != catalog_key("fs", base.model_copy(update={"args": ["v2"]}))
+    assert catalog_key("fs", base) != catalog_key("fs", base.model_copy(update={"env": {"A": "1"}}))
+
+
+def test_store_load_invalidate(tmp_path):
+    cache = CatalogCache(tmp_path / "catalog")
+    config = MCPServerSettings(command="npx")
+
+    assert cache.load("fs", config) is None
+
+    cache.store("fs", config, TOOLS, PROMPTS)
+    tools, prompts = cache.load("fs", config)
+    assert tools == TOOLS
+    assert prompts == PROMPTS
+
+    cache.invalidate("fs", config)
+    assert cache.load("fs", config) is None
+
+
+def test_corrupt_entry_is_ignored(tmp_path):
+    cache = CatalogCache(tmp_path)
+    config = MCPServerSettings(command="npx")
+    (tmp_path / f"{catalog_key('fs', config)}.json").write_text("{not json")
+
+    assert cache.load("fs", config) is None
+
+
+class FakeRegistry:
+    def __init__(self, servers: dict[str, MCPServerSettings]) -> None:
+        self.registry = servers
+
+    def get_server_config(self, server_name: str) -> MCPServerSettings | None:
+        return self.registry.get(server_name)
+
+
+@pytest.mark.asyncio
+async def test_aggregator_ready_from_cache(tmp_path):
+    servers = {"fs": MCPServerSettings(command="npx")}
+    CatalogCache(tmp_path).store("fs", servers["fs"], TOOLS, PROMPTS)
+    context = SimpleNamespace(
+        config=Settings(mcp=MCPSettings(servers=servers, catalog_cache_dir=str(tmp_path))),
+        server_registry=FakeRegistry(servers),
+    )
+    aggregator = MCPAggregator(server_names=["fs"], context=context)
+
+    refreshed = asyncio.Event()
+
+    async def fetch_live_catalogs():
+        refreshed.set()
+        return [("fs", [], [])]
+
+    aggregator._fetch_server_catalogs = fetch_live_catalogs
+
+    await aggregator.load_servers()
+
+    assert [tool.name for tool in (await aggregator.list_tools()).tools] == ["fs-read"]
+    assert aggregator._prompt_cache["fs"] == PROMPTS
+
+    await asyncio.wait_for(refreshed.wait(), 1)
+    await aggregator._catalog_refresh_task
+    assert (await aggregator.list_tools()).tools == []
+
+
+@pytest.mark.asyncio
+async def test_tool_list_change_writes_cache(tmp_path, monkeypatch):
+    servers = {"fs": MCPServerSettings(command="npx")}
+    cache = CatalogCache(tmp_path)
+    cache.store("fs", servers["fs"], TOOLS, PROMPTS)
+    context = SimpleNamespace(
+        config=Settings(mcp=MCPSettings(servers=servers, catalog_cache_dir=str(tmp_path))),
+        server_registry=FakeRegistry(servers),
+    )
+    aggregator = MCPAggregator(server_names=["fs"], connection_persistence=False, context=context)
+    aggregator._prompt_cache["fs"] = PROMPTS
+
+    new_tools = [Tool(name="write", description="Write a file", inputSchema={"type": "object"})]
+
+    @asynccontextmanager
+    async def fake_gen_client(server_name, server_registry, client_session_factory):
+        async def list_tools():
+            return ListToolsResult(tools=new_tools)
+
+        yield SimpleNamespace(list_tools=list_tools)
+
+    monkeypatch.setattr(mcp_aggregator, "gen_client", fake_gen_client)
+
+    await aggregator._handle_tool_list_changed("fs")
+
+    assert cache.load("fs", servers["fs"]) == (new_tools, PROMPTS)
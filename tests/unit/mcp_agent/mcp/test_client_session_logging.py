@@ -0,0 +1,47 @@
+import pytest
+import pytest_asyncio
+from mcp import ClientSession
+
+from mcp_agent.logging.events import EventFilter
+from mcp_agent.logging.listeners import FilteredListener
+from mcp_agent.logging.transport import AsyncEventBus, NoOpTransport
+from mcp_agent.mcp import mcp_agent_client_session
+from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
+
+
+class Message:
+    """Stands in for a request, result or notification that must not be dumped."""
+
+    def model_dump(self):
+        raise AssertionError("model_dump should not be called below the log level")
+
+
+class NullListener(FilteredListener):
+    async def handle_matched_event(self, event) -> None:
+        pass
+
+
+@pytest_asyncio.fixture
+async def warning_bus(monkeypatch):
+    bus = AsyncEventBus(transport=NoOpTransport())
+    bus.add_listener("warnings", NullListener(EventFilter(min_level="warning")))
+    await bus.start()
+    monkeypatch.setattr(mcp_agent_client_session.logger, "event_bus", bus)
+    yield bus
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_messages_not_dumped_above_debug(warning_bus, monkeypatch):
+    async def send_request(self, request, result_type, request_read_timeout_seconds=None):
+        return Message()
+
+    async def send_notification(self, notification):
+        pass
+
+    monkeypatch.setattr(ClientSession, "send_request", send_request)
+    monkeypatch.setattr(ClientSession, "send_notification", send_notification)
+    session = object.__new__(MCPAgentClientSession)
+
+    assert isinstance(await session.send_request(Message(), Message), Message)
+    await session.send_notification(Message())
@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+import pytest
+
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.mcp import mcp_connection_manager
+from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
+
+
+class FakeRegistry:
+    def __init__(self, **servers: MCPServerSettings) -> None:
+        self.registry = servers
+        self.init_hooks = {}
+
+
+async def _fake_lifecycle(server_conn) -> None:
+    server_conn.session = object()
+    server_conn._initialized_event.set()
+    await server_conn.wait_for_shutdown_request()
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(mcp_connection_manager, "_server_lifecycle_task", _fake_lifecycle)
+    return MCPConnectionManager(
+        FakeRegistry(
+            single=MCPServerSettings(command="x"),
+            pooled=MCPServerSettings(command="x", pool_size=3),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_single_session_by_default(manager):
+    async with manager:
+        async with manager.acquire("single", client_session_factory=None) as first:
+            async with manager.acquire("single", client_session_factory=None) as second:
+                assert first is second
+                assert first.outstanding == 2
+        assert manager._pool_members.get("single") is None
+
+
+@pytest.mark.asyncio
+async def test_pool_selects_least_outstanding(manager):
+    async with manager:
+        await manager.get_server("pooled", client_session_factory=None)
+        await asyncio.sleep(0)  # let pool members start
+
+        async with manager.acquire("pooled", client_session_factory=None) as a:
+            async with manager.acquire("pooled", client_session_factory=None) as b:
+                async with manager.acquire("pooled", client_session_factory=None) as c:
+                    assert len({id(a), id(b), id(c)}) == 3
+                    async with manager.acquire("pooled", client_session_factory=None) as d:
+                        assert d.outstanding == 2
+
+        assert a.outstanding == b.outstanding == c.outstanding == 0
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_member_replaced(manager):
+    async with manager:
+        await manager.get_server("pooled", client_session_factory=None)
+        await asyncio.sleep(0)
+
+        failed = manager._pool_members["pooled"][0]
+        failed._error_occurred = True
+
+        async with manager.acquire("pooled", client_session_factory=None):
+            members = manager._pool_members["pooled"]
+            assert failed not in members
+            assert len(members) == 2
+
+        await manager.disconnect_server("pooled")
+        assert "pooled" not in manager._pool_members
+
+
+@pytest.mark.asyncio
+async def test_failing_members_backed_off(manager, monkeypatch):
+    started = []
+
+    async def fail_after_primary(server_conn) -> None:
+        started.append(server_conn)
+        if len(started) == 1:
+            await _fake_lifecycle(server_conn)
+            return
+        server_conn._error_occurred = True
+        server_conn._error_message = "server crashed"
+        server_conn._initialized_event.set()
+
+    monkeypatch.setattr(mcp_connection_manager, "_server_lifecycle_task", fail_after_primary)
+
+    async with manager:
+        await manager.get_server("pooled", client_session_factory=None)
+        await asyncio.sleep(0)
+        assert len(started) == 3
+
+        for _ in range(3):
+            async with manager.acquire("pooled", client_session_factory=None) as conn:
+                assert conn is started[0]
+            await asyncio.sleep(0)
+        assert len(started) == 3
+        failures, retry_at = manager._pool_failures["pooled"]
+        assert failures == 2
+        assert retry_at > time.monotonic()
+
+        # Once the delay has passed, new members are started
+        manager._pool_failures["pooled"] = (failures, time.monotonic())
+        async with manager.acquire("pooled", client_session_factory=None):
+            await asyncio.sleep(0)
+        assert len(started) == 5
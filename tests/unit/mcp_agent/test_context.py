@@ -0,0 +1,45 @@
+import pytest
+
+from mcp_agent.config import OpenTelemetrySettings
+from mcp_agent.context import create_tracer_provider
+
+
+@pytest.fixture
+def provider_factory():
+    providers = []
+
+    def create(**settings):
+        provider = create_tracer_provider(OpenTelemetrySettings(otlp_endpoint="", **settings))
+        providers.append(provider)
+        return provider
+
+    yield create
+    for provider in providers:
+        provider.shutdown()
+
+
+def test_sample_rate_applies_to_root_spans_only(provider_factory):
+    tracer = provider_factory(sample_rate=0.0).get_tracer("test")
+    with tracer.start_as_current_span("root") as root:
+        assert not root.is_recording()
+
+    tracer = provider_factory(sample_rate=1.0).get_tracer("test")
+    with tracer.start_as_current_span("root") as root:
+        with tracer.start_as_current_span("child") as child:
+            assert root.is_recording() and child.is_recording()
+
+
+def test_span_attributes_are_bounded(provider_factory):
+    tracer = provider_factory(max_attribute_length=8, max_span_attributes=2).get_tracer("test")
+
+    with tracer.start_as_current_span("tool") as span:
+        span.set_attribute("prompt", "x" * 100)
+        span.set_attribute("server_name", "fs")
+        span.set_attribute("tool_name", "read")
+
+    assert len(span.attributes) == 2
+
+    tracer = provider_factory(max_attribute_length=8).get_tracer("test")
+    with tracer.start_as_current_span("tool") as span:
+        span.set_attribute("prompt", "x" * 100)
+    assert span.attributes["prompt"] == "x" * 8
@@ -0,0 +1,57 @@
+import json
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import mcp_agent
+import mcp_agent.logging
+from mcp_agent.llm.model_factory import ModelFactory
+from mcp_agent.llm.provider_types import Provider
+
+
+def _loaded_modules(statement: str, modules: list[str]) -> list[str]:
+    check = (
+        f"import json, sys; {statement}; "
+        f"print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_package_import_is_lazy():
+    heavy = ["mcp_agent.core.fastagent", "mcp_agent.mcp.mcp_aggregator", "mcp.types"]
+    assert _loaded_modules("import mcp_agent", heavy) == []
+
+
+def test_provider_sdks_and_otel_not_imported_for_fastagent():
+    heavy = ["anthropic", "openai", "opentelemetry.sdk", "aiohttp"]
+    assert _loaded_modules("from mcp_agent import FastAgent", heavy) == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    [info.name for info in pkgutil.iter_modules(mcp_agent.logging.__path__, "mcp_agent.logging.")],
+)
+def test_logging_modules_import_on_their_own(module):
+    # A fresh interpreter, so an import cycle can't be hidden by modules already loaded
+    assert _loaded_modules(f"import {module}", [module]) == [module]
+
+
+def test_public_names_resolve():
+    from mcp_agent.core.fastagent import FastAgent
+
+    assert mcp_agent.FastAgent is FastAgent
+    assert "RequestParams" in dir(mcp_agent)
+
+
+def test_model_factory_resolves_class_paths():
+    from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
+
+    assert ModelFactory.load_llm_class(ModelFactory.PROVIDER_CLASSES[Provider.ANTHROPIC]) is (
+        AnthropicAugmentedLLM
+    )
+    assert ModelFactory.load_llm_class(AnthropicAugmentedLLM) is AnthropicAugmentedLLM
@@ -0,0 +1,65 @@
+import httpx
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from mcp_agent import metrics
+from mcp_agent.config import OpenTelemetrySettings
+from mcp_agent.logging.transport import AsyncEventBus
+from mcp_agent.mcp_server.agent_server import AgentMCPServer
+
+
+def test_render_prometheus():
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+    meter.create_counter("requests", description="Requests").add(2, {"server": "fs"})
+    meter.create_up_down_counter("connections").add(1)
+    meter.create_histogram("latency", explicit_bucket_boundaries_advisory=[0.1, 1.0]).record(
+        0.5, {"tool": 'say "hi"'}
+    )
+
+    text = metrics.render_prometheus(reader.get_metrics_data())
+
+    assert "# HELP requests_total Requests\n# TYPE requests_total counter\n" in text
+    assert 'requests_total{server="fs"} 2\n' in text
+    assert "# TYPE connections gauge\nconnections 1\n" in text
+    assert 'latency_bucket{tool="say \\"hi\\"",le="0.1"} 0\n' in text
+    assert 'latency_bucket{tool="say \\"hi\\"",le="1.0"} 1\n' in text
+    assert 'latency_bucket{tool="say \\"hi\\"",le="+Inf"} 1\n' in text
+    assert 'latency_count{tool="say \\"hi\\""} 1\n' in text
+
+
+class EmptyApp:
+    _agents = {}
+
+
+@pytest.mark.asyncio
+async def test_prometheus_endpoint_serves_recorded_metrics():
+    metrics.configure_metrics(OpenTelemetrySettings(metrics=True, prometheus=True))
+    AsyncEventBus.reset()
+    bus = AsyncEventBus.get()
+    bus.dropped_events["debug"] += 3
+
+    metrics.record_llm_request("anthropic", "haiku", 0.2, input_tokens=10, output_tokens=4)
+    with metrics.workflow_step("chain", "pipeline", "writer"):
+        pass
+
+    app = AgentMCPServer(EmptyApp()).mcp_server.streamable_http_app()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics")
+    AsyncEventBus.reset()
+
+    assert response.status_code == 200
+    text = response.text
+    assert (
+        'fast_agent_llm_tokens_total{provider="anthropic",model="haiku",error="false",direction="input"} 10'
+        in text
+    )
+    assert (
+        'fast_agent_workflow_step_duration_count{workflow="chain",agent="pipeline",step="writer"} 1'
+        in text
+    )
+    assert 'fast_agent_event_bus_dropped_events_total{event_type="debug"} 3' in text
+    assert "fast_agent_event_bus_queue_depth 0" in text
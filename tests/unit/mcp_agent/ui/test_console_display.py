@@ -0,0 +1,84 @@
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from mcp_agent.config import LoggerSettings, Settings
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.llm import augmented_llm
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.ui.console_display import TRUNCATED_TEXT_LIMIT, ConsoleDisplay
+
+
+class Unrenderable:
+    def __str__(self) -> str:
+        raise AssertionError("should not be rendered")
+
+    __repr__ = __str__
+
+
+class NoListing:
+    server_names = ["fs"]
+    human_input_callback = None
+
+    async def list_tools(self):
+        raise AssertionError("should not list tools")
+
+    async def list_servers(self):
+        raise AssertionError("should not list servers")
+
+
+def _display(**logger) -> ConsoleDisplay:
+    return ConsoleDisplay(Settings(logger=LoggerSettings(**logger)))
+
+
+@pytest.mark.asyncio
+async def test_disabled_display_does_no_rendering():
+    display = _display(show_chat=False, show_tools=False)
+
+    display.show_tool_call([], "fs-read", Unrenderable())
+    display.show_oai_tool_result(Unrenderable())
+    display.show_user_message(Unrenderable(), "model", 1)
+    await display.show_assistant_message(Unrenderable(), aggregator=NoListing())
+
+
+@pytest.mark.asyncio
+async def test_assistant_subtitle_built_without_listing(capsys):
+    display = _display(show_chat=True)
+
+    await display.show_assistant_message("hello", aggregator=NoListing())
+
+    assert "[fs]" in capsys.readouterr().out
+
+
+def test_truncated_tool_text_is_bounded():
+    text, truncated = _display(truncate_tools=True)._tool_text("x" * 100_000)
+    assert truncated and len(text) == TRUNCATED_TEXT_LIMIT
+
+    text, truncated = _display(truncate_tools=False)._tool_text("x" * 1000)
+    assert not truncated and len(text) == 1000
+
+
+def test_truncated_tool_text_stops_formatting_at_limit():
+    display = _display(truncate_tools=True)
+    big = "y" * 100_000
+
+    text, truncated = display._tool_text([TextContent(type="text", text=big), Unrenderable()])
+    assert truncated
+    assert text == f"[TextContent(type='text', text='{big}"[:TRUNCATED_TEXT_LIMIT]
+
+    result = CallToolResult(content=[TextContent(type="text", text="it's")], isError=True)
+    assert display._tool_text(result) == (str(result), False)
+    args = {"path": "a", "lines": (1,)}
+    assert display._tool_text(args) == (str(args), False)
+
+
+def test_user_message_not_rendered_when_chat_hidden(monkeypatch):
+    def render(message):
+        raise AssertionError("should not be rendered")
+
+    monkeypatch.setattr(augmented_llm, "render_multipart_message", render)
+    llm = PassthroughLLM()
+    llm.display = _display(show_chat=False)
+
+    llm._precall([Prompt.user("hi")])
+
+    assert len(llm.message_history) == 1